@@ -1,26 +1,180 @@
+import asyncio
+import logging
+import time
 from typing import AsyncGenerator
+from uuid import UUID
 
+from sqlalchemy import event, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.orm import DeclarativeBase
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
-from sqlalchemy.pool import NullPool
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy.pool import NullPool, AsyncAdaptedQueuePool
 
 from app.settings import settings
+from app.instrumentation import instrument_engine
+from app.partitions import ensure_partitions
+
+
+logger = logging.getLogger(__name__)
 
 
 class Base(DeclarativeBase):
     pass
 
 
-if settings.app_env == "local":
-    engine = create_async_engine(url=settings.database_url, echo=True)
+class PoolStats:
+    """Per-engine counters used to size the connection pool."""
+
+    def __init__(self):
+        self.connects = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.timeouts = 0
+        self.acquire_count = 0
+        self.acquire_total_s = 0.0
+        self.acquire_max_s = 0.0
+
+
+    def record_acquire(self, elapsed: float) -> None:
+        self.acquire_count += 1
+        self.acquire_total_s += elapsed
+        self.acquire_max_s = max(self.acquire_max_s, elapsed)
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Async queue pool that records how long callers wait for a connection.
+
+    _build_engine derives one subclass per engine with its own `stats`, so the
+    counters survive pool.recreate() (which instantiates self.__class__).
+    """
+    stats: PoolStats
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        except PoolTimeoutError:
+            self.stats.timeouts += 1
+            raise
+        finally:
+            self.stats.record_acquire(time.perf_counter() - start)
+
+
+def _engine_options(stats: PoolStats) -> dict:
+    """Translate the db_pool_* settings into create_async_engine kwargs.
+
+    - null: a fresh connection per checkout (no pooling at all)
+    - queue: persistent pooled connections
+    - pgbouncer: pooled, but with psycopg prepared statements disabled, since
+      a transaction-mode PgBouncer may hand each transaction a different backend
+    """
+    if settings.db_pool_mode == "null":
+        return {"poolclass": NullPool}
+
+    options = {
+        "poolclass": type("InstrumentedQueuePool", (InstrumentedQueuePool,), {"stats": stats}),
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_timeout": settings.db_pool_timeout,
+    }
+    if settings.db_pool_mode == "pgbouncer":
+        options["connect_args"] = {"prepare_threshold": None}
+    return options
+
+
+def _build_engine(url: str, stats: PoolStats) -> AsyncEngine:
+    new_engine = create_async_engine(url, echo=settings.db_echo, **_engine_options(stats))
+
+    pool = new_engine.sync_engine.pool
+
+    @event.listens_for(pool, "connect")
+    def _on_connect(dbapi_connection, connection_record) -> None:
+        stats.connects += 1
+
+    @event.listens_for(pool, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy) -> None:
+        stats.checkouts += 1
+
+    @event.listens_for(pool, "checkin")
+    def _on_checkin(dbapi_connection, connection_record) -> None:
+        stats.checkins += 1
+
+    instrument_engine(new_engine)
+    return new_engine
+
+
+pool_stats = PoolStats()
+engine = _build_engine(settings.database_url, pool_stats)
+
+# Read-only traffic goes to the replica when one is configured, otherwise to the primary.
+if settings.read_database_url:
+    read_pool_stats: PoolStats | None = PoolStats()
+    read_engine = _build_engine(settings.read_database_url, read_pool_stats)
 else:
-    engine = create_async_engine(
-        settings.database_url,
-        echo=True,
-        poolclass=NullPool,
-    )
+    read_pool_stats = None
+    read_engine = engine
 
 SessionLocal = async_sessionmaker(bind=engine, autoflush=True, expire_on_commit=False)
+ReadSessionLocal = async_sessionmaker(bind=read_engine, autoflush=False, expire_on_commit=False)
+
+
+class RecentWriters:
+    """Remembers users who wrote recently so their reads stay on the primary.
+
+    Read-your-writes window: for read_your_writes_seconds after a user's own
+    write their list endpoints skip the replica and can't observe replica lag.
+    A window of 0 disables it. In-process only.
+    """
+
+    def __init__(self, window_s: float, max_entries: int = 10_000):
+        self.window_s = window_s
+        self.max_entries = max_entries
+        self._until: dict[UUID, float] = {}
+
+
+    def mark(self, user_id: UUID) -> None:
+        if self.window_s <= 0 or read_engine is engine:
+            return
+        now = time.monotonic()
+        if len(self._until) >= self.max_entries:
+            self._until = {key: until for key, until in self._until.items() if until > now}
+        self._until[user_id] = now + self.window_s
+
+
+    def is_recent(self, user_id: UUID) -> bool:
+        until = self._until.get(user_id)
+        return until is not None and until > time.monotonic()
+
+
+recent_writers = RecentWriters(settings.read_your_writes_seconds)
+
+
+def _describe_pool(pool_engine: AsyncEngine, stats: PoolStats) -> dict:
+    pool = pool_engine.sync_engine.pool
+    description = {
+        "mode": settings.db_pool_mode,
+        "connects": stats.connects,
+        "checkouts": stats.checkouts,
+        "checkins": stats.checkins,
+        "timeouts": stats.timeouts,
+        "acquire_avg_ms": (stats.acquire_total_s / stats.acquire_count * 1000) if stats.acquire_count else 0.0,
+        "acquire_max_ms": stats.acquire_max_s * 1000,
+    }
+    if isinstance(pool, AsyncAdaptedQueuePool):
+        description.update(size=pool.size(), checked_out=pool.checkedout(), checked_in=pool.checkedin(), overflow=pool.overflow())
+    return description
+
+
+def get_pool_stats() -> dict:
+    return _describe_pool(engine, pool_stats)
+
+
+def get_read_pool_stats() -> dict | None:
+    if read_pool_stats is None:
+        return None
+    return _describe_pool(read_engine, read_pool_stats)
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
@@ -28,12 +182,65 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
+def read_session_factory(user_id: UUID | None = None) -> async_sessionmaker[AsyncSession]:
+    """Session factory for read-only queries; honours the read-your-writes window of `user_id`."""
+    if user_id and recent_writers.is_recent(user_id):
+        return SessionLocal
+    return ReadSessionLocal
+
+
 async def init_db() -> None:
+    """Create the schema of an empty database from the models (local dev, tests).
+
+    Only missing tables are created; deployed databases are upgraded by the migrations
+    (`alembic upgrade head`, fly.toml release_command), never on boot.
+    """
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+    # imported here: the services import the models, which import this module
+    from app.services.submissions import SubmissionCounterService
+    async with SessionLocal() as session:
+        await SubmissionCounterService(session).reconcile_pending(settings.counter_reconcile_batch_size)
+    async with engine.begin() as conn:
+        await ensure_partitions(conn, settings.event_partitions_ahead)
+
+
+async def maintain_event_partitions() -> None:
+    """Keep settings.event_partitions_ahead monthly partitions of submission_events ready.
+
+    Runs for the app's lifetime; every process may run it, the work is serialized by an
+    advisory lock and is a no-op once the partitions exist.
+    """
+    while True:
+        try:
+            async with engine.begin() as conn:
+                await ensure_partitions(conn, settings.event_partitions_ahead)
+        except Exception:
+            logger.exception("partition maintenance failed, retrying at the next check")
+        await asyncio.sleep(settings.event_partition_check_hours * 3600)
 
 
 async def drop_db() -> None:
     """Used in tests teardown to drop all tables"""
     async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
\ No newline at end of file
+        await conn.run_sync(Base.metadata.drop_all)
+
+
+async def warm_pool(connections: int) -> int:
+    """Open up to `connections` pooled connections concurrently so early requests skip the handshake.
+
+    Returns how many succeeded; failures are logged, never raised (the app still boots).
+    """
+    if settings.db_pool_mode == "null" or connections <= 0:
+        return 0
+
+    async def _open() -> None:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    results = await asyncio.gather(*(_open() for _ in range(connections)), return_exceptions=True)
+    failures = [result for result in results if isinstance(result, Exception)]
+    if failures:
+        logger.warning("pool warm-up: %d of %d connections failed: %r", len(failures), connections, failures[0])
+    return connections - len(failures)
+
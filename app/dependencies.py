@@ -1,22 +1,25 @@
-from typing import Annotated
+import secrets
+from dataclasses import dataclass
+from typing import Annotated, AsyncGenerator
 from uuid import UUID
 
-from fastapi import Depends, HTTPException, status
-from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from fastapi import Depends, HTTPException, Request, status
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer, OAuth2PasswordBearer
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from app.database import get_db
+from app.database import get_db, read_session_factory, recent_writers
 from app.services.auth import AuthService, InvalidTokenError
 from app.services.users import UserService
-from app.models.models import User, ProducerProfile, LabelStaffProfile
+from app.models.models import User, UserType
 from app.services.tracks import TrackService
 from app.services.workspaces import WorkspaceService
 from app.services.memberships import MembershipService
 from app.services.submissions import SubmissionQueryService, SubmissionWorkflowService
+from app.settings import settings
 
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/token")
+metrics_scheme = HTTPBearer(auto_error=False)
 
 
 def get_auth_service() -> AuthService:
@@ -33,59 +36,99 @@ def get_user_service(session: SessionDep, auth_service: AuthServiceDep) -> UserS
 UserServiceDep = Annotated[UserService, Depends(get_user_service)]
 
 
-async def get_current_user(auth_service: AuthServiceDep,
-                     user_service: UserServiceDep,
-                     token: Annotated[str,Depends(oauth2_scheme)],
-                     ) -> User:
+@dataclass(frozen=True)
+class Principal:
+       """Caller identity resolved once per request: from token claims, the user cache or one joined query."""
+       user_id: UUID
+       user_type: UserType
+       profile_id: UUID | None
+
+
+async def get_principal(request: Request,
+                        auth_service: AuthServiceDep,
+                        user_service: UserServiceDep,
+                        token: Annotated[str, Depends(oauth2_scheme)],
+                        ) -> Principal:
         try:
             payload = auth_service.verify_access_token(token)
-            user_id = payload.get("sub")
-
-            user = await user_service.get_user_by_id(user_id)
-            if not user:
-                   raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found.")
-            return user
-        
         except InvalidTokenError as e:
                raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED,
                                    detail=str(e))
 
+        user_id = payload.get("sub")
+        if "utype" in payload and "pid" in payload:
+               principal = Principal(user_id, UserType(payload["utype"]), payload["pid"])
+        else:
+               resolved = await user_service.get_authenticated_user(user_id)
+               if not resolved:
+                      raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found.")
+               user, profile_id = resolved
+               principal = Principal(user.id, user.user_type, profile_id)
+
+        if request.method not in ("GET", "HEAD", "OPTIONS"):
+               recent_writers.mark(principal.user_id)
+        return principal
+
+
+PrincipalDep = Annotated[Principal, Depends(get_principal)]
+
+
+async def get_current_user(principal: PrincipalDep, user_service: UserServiceDep) -> User:
+       resolved = await user_service.get_authenticated_user(principal.user_id)
+       if not resolved:
+              raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found.")
+       user, _ = resolved
+       return user
+
 
 CurrentUserDep = Annotated[User, Depends(get_current_user)]
 
 
-async def get_producer_profile_id(current_user: CurrentUserDep, session: SessionDep) -> UUID:
-       result = await session.execute(select(ProducerProfile.id).where(ProducerProfile.user_id == current_user.id))
-       producer_profile_id = result.scalar_one_or_none()
+async def get_read_session(principal: PrincipalDep) -> AsyncGenerator[AsyncSession, None]:
+       """Replica session for list endpoints, or primary inside the user's read-your-writes window."""
+       async with read_session_factory(principal.user_id)() as session:
+              yield session
 
-       if not producer_profile_id:
+ReadSessionDep = Annotated[AsyncSession, Depends(get_read_session)]
+
+
+def get_read_session_factory(principal: PrincipalDep) -> async_sessionmaker[AsyncSession]:
+       """For long-lived responses that open a short read session per round instead of holding one."""
+       return read_session_factory(principal.user_id)
+
+ReadSessionFactoryDep = Annotated[async_sessionmaker[AsyncSession], Depends(get_read_session_factory)]
+
+
+def get_producer_profile_id(principal: PrincipalDep) -> UUID:
+       if principal.user_type != UserType.producer or not principal.profile_id:
               raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Producer profile not found.")
 
-       return producer_profile_id
+       return principal.profile_id
 
 CurrentProducerProfileIdDep = Annotated[UUID, Depends(get_producer_profile_id)]
 
 
-def get_track_service(session: SessionDep, producer_profile_id: CurrentProducerProfileIdDep) -> TrackService:
-       return TrackService(session, producer_profile_id)
+def get_track_service(session: SessionDep,
+                      read_session: ReadSessionDep,
+                      producer_profile_id: CurrentProducerProfileIdDep) -> TrackService:
+       return TrackService(session, producer_profile_id, read_session)
 
 TrackServiceDep = Annotated[TrackService, Depends(get_track_service)]
 
 
-async def get_labelstaff_profile_id(current_user: CurrentUserDep, session: SessionDep) -> UUID:
-       result = await session.execute(select(LabelStaffProfile.id).where(LabelStaffProfile.user_id == current_user.id))
-       labelstaff_profile_id = result.scalar_one_or_none()
-
-       if not labelstaff_profile_id:
+def get_labelstaff_profile_id(principal: PrincipalDep) -> UUID:
+       if principal.user_type != UserType.label_staff or not principal.profile_id:
               raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Labelstaff profile not found.")
-       
-       return labelstaff_profile_id
+
+       return principal.profile_id
 
 CurrentLabelstaffProfileIdDep = Annotated[UUID, Depends(get_labelstaff_profile_id)]
 
 
-def get_workspace_service(session: SessionDep, labelstaff_profile_id: CurrentLabelstaffProfileIdDep) -> WorkspaceService:
-       return WorkspaceService(session, labelstaff_profile_id)
+def get_workspace_service(session: SessionDep,
+                          read_session: ReadSessionDep,
+                          labelstaff_profile_id: CurrentLabelstaffProfileIdDep) -> WorkspaceService:
+       return WorkspaceService(session, labelstaff_profile_id, read_session)
 
 
 WorkspaceServiceDep = Annotated[WorkspaceService, Depends(get_workspace_service)]
@@ -98,8 +141,8 @@ def get_membership_service(session: SessionDep, labelstaff_profile_id: CurrentLa
 MembershipServiceDep = Annotated[MembershipService, Depends(get_membership_service)]
 
 
-def get_submission_query_service(session: SessionDep) -> SubmissionQueryService:
-       return SubmissionQueryService(session)
+def get_submission_query_service(read_session: ReadSessionDep) -> SubmissionQueryService:
+       return SubmissionQueryService(read_session)
 
 SubmissionQueryServiceDep = Annotated[SubmissionQueryService, Depends(get_submission_query_service)]
 
@@ -107,4 +150,15 @@ SubmissionQueryServiceDep = Annotated[SubmissionQueryService, Depends(get_submis
 def get_submission_workflow_service(session: SessionDep) -> SubmissionWorkflowService:
        return SubmissionWorkflowService(session)
 
-SubmissionWorkflowServiceDep = Annotated[SubmissionWorkflowService, Depends(get_submission_workflow_service)]
\ No newline at end of file
+SubmissionWorkflowServiceDep = Annotated[SubmissionWorkflowService, Depends(get_submission_workflow_service)]
+
+
+def require_metrics_token(credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(metrics_scheme)]) -> None:
+       """Metrics need `Bearer <settings.metrics_token>`; with no token set they're only served locally."""
+       if settings.metrics_token is None:
+              if settings.app_env != "local":
+                     raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+              return
+       if credentials is None or not secrets.compare_digest(credentials.credentials.encode(), settings.metrics_token.encode()):
+              raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid metrics token.",
+                                  headers={"WWW-Authenticate": "Bearer"})
@@ -0,0 +1,225 @@
+import logging
+import os
+import random
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.settings import settings
+
+
+logger = logging.getLogger(__name__)
+
+_PARAM_RE = re.compile(r"%\(\w+\)s|\$\d+|\b\d+(\.\d+)?\b|'(?:[^']|'')*'")
+_WS_RE = re.compile(r"\s+")
+_IN_LIST_RE = re.compile(r"IN \((\?(, )?)+\)")
+_MAX_LOGGED_STATEMENT = 500
+
+
+def statement_shape(statement: str) -> str:
+    """Normalize a statement so repeated executions with different params compare equal."""
+    shape = _PARAM_RE.sub("?", statement)
+    shape = _WS_RE.sub(" ", shape).strip()
+    return _IN_LIST_RE.sub("IN (?)", shape)
+
+
+class QueryTotals:
+    """Process-wide totals across all sampled requests."""
+
+    def __init__(self):
+        self.sampled_requests = 0
+        self.queries = 0
+        self.db_time_ms = 0.0
+        self.slow_queries = 0
+        self.n_plus_one_requests = 0
+
+
+query_totals = QueryTotals()
+
+
+class RequestQueryStats:
+    """SQL activity of a single HTTP request."""
+
+    def __init__(self, method: str, path: str):
+        self.method = method
+        self.path = path
+        self.query_count = 0
+        self.total_ms = 0.0
+        self.slowest_ms = 0.0
+        self.slowest_statement: str | None = None
+        self.shapes: Counter[str] = Counter()
+
+
+    def record(self, statement: str, elapsed_ms: float) -> None:
+        self.query_count += 1
+        self.total_ms += elapsed_ms
+        self.shapes[statement_shape(statement)] += 1
+        if elapsed_ms > self.slowest_ms:
+            self.slowest_ms = elapsed_ms
+            self.slowest_statement = statement
+
+
+    def repeated_shapes(self) -> list[tuple[str, int]]:
+        threshold = settings.sql_n_plus_one_threshold
+        return [(shape, count) for shape, count in self.shapes.items() if count >= threshold]
+
+
+_current_stats: ContextVar[RequestQueryStats | None] = ContextVar("current_query_stats", default=None)
+
+
+def get_current_query_stats() -> RequestQueryStats | None:
+    return _current_stats.get()
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """Time every cursor execution that happens inside a sampled request."""
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+        if _current_stats.get() is None:
+            return
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+        stats = _current_stats.get()
+        starts = conn.info.get("query_start")
+        if stats is None or not starts:
+            return
+        elapsed_ms = (time.perf_counter() - starts.pop()) * 1000
+        stats.record(statement, elapsed_ms)
+
+        if elapsed_ms >= settings.sql_slow_query_ms:
+            query_totals.slow_queries += 1
+            logger.warning("slow_query method=%s path=%s duration_ms=%.1f statement=%r",
+                           stats.method, stats.path, elapsed_ms, statement[:_MAX_LOGGED_STATEMENT])
+
+
+def _finish_request(stats: RequestQueryStats) -> None:
+    query_totals.sampled_requests += 1
+    query_totals.queries += stats.query_count
+    query_totals.db_time_ms += stats.total_ms
+
+    logger.info("request_sql method=%s path=%s queries=%d db_ms=%.1f slowest_ms=%.1f",
+                stats.method, stats.path, stats.query_count, stats.total_ms, stats.slowest_ms)
+
+    repeated = stats.repeated_shapes()
+    if repeated:
+        query_totals.n_plus_one_requests += 1
+        for shape, count in repeated:
+            logger.warning("n_plus_one method=%s path=%s repeats=%d statement=%r",
+                           stats.method, stats.path, count, shape[:_MAX_LOGGED_STATEMENT])
+
+
+class SQLInstrumentationMiddleware:
+    """ASGI middleware collecting per-request query count, DB time and slowest statement.
+
+    Controlled by SQL_INSTRUMENTATION (on/off) and SQL_SAMPLE_RATE (fraction of requests).
+    Sampled responses carry a Server-Timing header with the DB totals.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+
+    async def __call__(self, scope, receive, send):
+        if (scope["type"] != "http"
+                or not settings.sql_instrumentation
+                or random.random() >= settings.sql_sample_rate):
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestQueryStats(scope["method"], scope["path"])
+        token = _current_stats.set(stats)
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing",
+                                f'db;dur={stats.total_ms:.1f};desc="{stats.query_count} queries"'.encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current_stats.reset(token)
+            _finish_request(stats)
+
+
+def get_query_stats() -> dict:
+    return {
+        "enabled": settings.sql_instrumentation,
+        "sample_rate": settings.sql_sample_rate,
+        "sampled_requests": query_totals.sampled_requests,
+        "queries": query_totals.queries,
+        "db_time_ms": query_totals.db_time_ms,
+        "slow_queries": query_totals.slow_queries,
+        "n_plus_one_requests": query_totals.n_plus_one_requests,
+    }
+
+
+def _process_start_time() -> float:
+    """Wall-clock time the process was exec'd (Linux /proc), or now as a fallback."""
+    try:
+        with open("/proc/self/stat") as f:
+            fields = f.read().rsplit(")", 1)[1].split()
+        with open("/proc/uptime") as f:
+            uptime = float(f.read().split()[0])
+        boot_time = time.time() - uptime
+        return boot_time + int(fields[19]) / os.sysconf("SC_CLK_TCK")
+    except (OSError, ValueError, IndexError):
+        return time.time()
+
+
+class StartupMetrics:
+    """Cold-start milestones, measured from process exec."""
+
+    def __init__(self):
+        self.process_started_at = _process_start_time()
+        self.ready_at: float | None = None
+        self.first_response_at: float | None = None
+        self.schema_created = False
+        self.warmed_connections = 0
+
+
+    def _since_start_ms(self, at: float | None) -> float | None:
+        return (at - self.process_started_at) * 1000 if at else None
+
+
+    def stats(self) -> dict:
+        return {
+            "ready_ms": self._since_start_ms(self.ready_at),
+            "first_response_ms": self._since_start_ms(self.first_response_at),
+            "schema_created": self.schema_created,
+            "warmed_connections": self.warmed_connections,
+        }
+
+
+startup_metrics = StartupMetrics()
+
+
+class FirstResponseMiddleware:
+    """Records when the process sends its first HTTP response (time-to-first-response)."""
+
+    def __init__(self, app):
+        self.app = app
+
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or startup_metrics.first_response_at is not None:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_and_record(message):
+            if message["type"] == "http.response.start" and startup_metrics.first_response_at is None:
+                startup_metrics.first_response_at = time.time()
+            await send(message)
+
+        await self.app(scope, receive, send_and_record)
@@ -1,3 +1,7 @@
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 from fastapi import FastAPI, status, APIRouter
@@ -8,16 +12,59 @@ from app.routers import users
 from app.routers import tracks
 from app.routers import workspaces
 from app.routers import submissions
-from app.database import init_db
+from app.routers import metrics
+from app.database import engine, init_db, maintain_event_partitions, warm_pool
+from app.settings import settings
+from app.services.users import load_password_scorer
+from app.instrumentation import SQLInstrumentationMiddleware, FirstResponseMiddleware, startup_metrics
+from app.notifications import change_listener, listen_url
 
 
+logger = logging.getLogger(__name__)
+
 STATIC_DIR = Path("frontend/dist")
 INDEX_PATH = STATIC_DIR / "index.html"
 
 
+async def _warm_connections() -> None:
+    startup_metrics.warmed_connections = await warm_pool(settings.db_warm_connections)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Keep boot cheap: machines are stopped when idle, so every cold start is user-facing.
+
+    Migrations are a deploy step (alembic upgrade head); local dev creates the tables here;
+    pool warm-up, the zxcvbn pre-warm and event partition maintenance run in the background.
+    """
+    if settings.app_env == "local" or settings.db_create_schema_on_startup:
+        await init_db()
+        startup_metrics.schema_created = True
+
+    if listen_url() is None:
+        logger.error("DB_POOL_MODE is pgbouncer and PUSH_LISTEN_DATABASE_URL is not set: "
+                     "LISTEN cannot go through a transaction-mode pooler, live event streams answer 503")
+
+    warm_task = asyncio.create_task(_warm_connections())
+    partition_task = (asyncio.create_task(maintain_event_partitions())
+                      if settings.event_partition_maintenance else None)
+    if settings.prewarm_password_scorer:
+        asyncio.get_running_loop().run_in_executor(None, load_password_scorer)
+
+    startup_metrics.ready_at = time.time()
+    yield
+
+    warm_task.cancel()
+    if partition_task is not None:
+        partition_task.cancel()
+    await change_listener.stop()
+    await engine.dispose()
+
+
 app = FastAPI(title="Trackflow",
               summary="A b2b platform for sharing track demos between labels and producers.",
-              version="1.0.0")
+              version="1.0.0",
+              lifespan=lifespan)
 
 app.add_middleware(CORSMiddleware,
                    allow_origins=["http://localhost:5173",
@@ -25,13 +72,17 @@ app.add_middleware(CORSMiddleware,
                                   "https://trackflow-app.pl"],
                    allow_headers=["*"],
                    allow_methods=["*"],
+                   expose_headers=["X-Next-Cursor", "ETag"],
                    allow_credentials=True)
+app.add_middleware(SQLInstrumentationMiddleware)
+app.add_middleware(FirstResponseMiddleware)
 
 api_router = APIRouter()
 api_router.include_router(router=users.router)
 api_router.include_router(router=tracks.router)
 api_router.include_router(router=workspaces.router)
 api_router.include_router(router=submissions.router)
+api_router.include_router(router=metrics.router)
 
 
 @api_router.get("/", status_code=status.HTTP_200_OK)
@@ -51,7 +102,3 @@ async def serve_spa(full_path: str) -> FileResponse:
     if file_path.is_file() and file_path.resolve().is_relative_to(STATIC_DIR.resolve()):
         return FileResponse(file_path)
     return FileResponse(INDEX_PATH)
-
-@app.on_event("startup")
-async def init_database() -> None:
-    await init_db()
\ No newline at end of file
@@ -1,12 +1,12 @@
-from datetime import datetime
+from datetime import date, datetime
 from enum import Enum
 import uuid
 from typing import Optional
 
-from sqlalchemy import String, DateTime, func, Float, ForeignKey, UUID, Text, ARRAY
-from sqlalchemy import Enum as SAEnum, CheckConstraint
+from sqlalchemy import String, Date, DateTime, func, Float, ForeignKey, UUID, Text, BigInteger, SmallInteger
+from sqlalchemy import Enum as SAEnum, CheckConstraint, DDL, Index, event, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import JSONB, ARRAY, TSVECTOR
 
 from app.database import Base
 
@@ -68,7 +68,8 @@ class ProducerProfile(Base):
     user: Mapped["User"] = relationship(back_populates="producer_profile")
 
     tracks: Mapped[list["Track"]] = relationship(back_populates="producer", cascade="all, delete-orphan")
-    submission_events: Mapped[list["SubmissionEvent"]] = relationship(back_populates="producer")
+    submission_events: Mapped[list["SubmissionEvent"]] = relationship(back_populates="producer",
+                                                                      foreign_keys="SubmissionEvent.producer_profile_id")
     submissions: Mapped[list["Submission"]] = relationship(back_populates="producer")
 
 
@@ -126,6 +127,40 @@ class Membership(Base):
     workspace: Mapped["Workspace"] = relationship(back_populates="memberships")
 
 
+# array_to_string() is merely stable (element output functions may depend on settings),
+# which doesn't apply to varchar[]; IMMUTABLE lets expression indexes use it too.
+event.listen(Base.metadata, "before_create", DDL(
+    "CREATE OR REPLACE FUNCTION submission_genre_text(genre varchar[]) RETURNS text "
+    "LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$ SELECT coalesce(array_to_string(genre, ' '), '') $$"
+))
+
+# extra_metadata keys included in submission search
+SEARCH_METADATA_KEYS = ("vibe", "tags", "description")
+
+SUBMISSION_SEARCH_DOCUMENT = (
+    "setweight(to_tsvector('simple'::regconfig, title), 'A') || "
+    "setweight(to_tsvector('simple'::regconfig, submission_genre_text(genre)), 'B') || "
+    "setweight(to_tsvector('simple'::regconfig, "
+    + " || ' ' || ".join(f"coalesce(extra_metadata ->> '{key}', '')" for key in SEARCH_METADATA_KEYS)
+    + "), 'C')"
+)
+
+# search_vector is kept by a trigger rather than declared as a generated column: adding a
+# stored generated column rewrites the whole table under an exclusive lock, a plain
+# nullable column is added instantly and backfilled in batches (see migrations/online.py).
+event.listen(Base.metadata, "after_create", DDL(
+    "CREATE OR REPLACE FUNCTION submission_search_vector() RETURNS trigger LANGUAGE plpgsql AS $$ "
+    "BEGIN "
+    f"NEW.search_vector := (SELECT {SUBMISSION_SEARCH_DOCUMENT} FROM (SELECT (NEW).*) AS submission); "
+    "RETURN NEW; "
+    "END $$"
+))
+event.listen(Base.metadata, "after_create", DDL(
+    "CREATE OR REPLACE TRIGGER submissions_search_vector BEFORE INSERT OR UPDATE OF title, genre, extra_metadata "
+    "ON submissions FOR EACH ROW EXECUTE FUNCTION submission_search_vector()"
+))
+
+
 class Submission(Base):
     __tablename__ = "submissions"
 
@@ -134,32 +169,179 @@ class Submission(Base):
     workspace_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("workspaces.id"), nullable=False)
     title: Mapped[str] = mapped_column(String(100), nullable=False)
     streaming_url: Mapped[str] = mapped_column(Text, nullable=False)
-    tempo: Mapped[float] = mapped_column(Float, index=True, nullable=False)
+    tempo: Mapped[float] = mapped_column(Float, nullable=False)
     genre: Mapped[list[str]] = mapped_column(ARRAY(String))
-    key: Mapped[str | None] = mapped_column(String(3), index=True)
+    key: Mapped[str | None] = mapped_column(String(3))
     extra_metadata: Mapped[dict] = mapped_column(JSONB)
 
     status: Mapped[Status] = mapped_column(SAEnum(Status, name="status_enums"), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now(), nullable=False)
+    # set by every transition (creation counts as entering PENDING) and by the first review
+    last_transition_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now(), nullable=False)
+    first_reviewed_at: Mapped[datetime | None] = mapped_column(DateTime)
+    search_vector: Mapped[str | None] = mapped_column(TSVECTOR, deferred=True)
 
     producer: Mapped["ProducerProfile"] = relationship(back_populates="submissions")
     workspace: Mapped["Workspace"] = relationship(back_populates="submissions")
     events: Mapped[list["SubmissionEvent"]] = relationship(back_populates="submission")
 
+    __table_args__ = (
+        # keyset pagination of the label queue and the producer's list (newest first)
+        Index("ix_submissions_workspace_id_created_at_id", "workspace_id", "created_at", "id"),
+        Index("ix_submissions_producer_profile_id_created_at_id", "producer_profile_id", "created_at", "id"),
+        # label queue filters (status, tempo range / tempo sort, key, genre overlap)
+        # label queue status filter; also "in this status since before X" (stale PENDING)
+        Index("ix_submissions_workspace_id_status_last_transition_at", "workspace_id", "status", "last_transition_at", "id"),
+        Index("ix_submissions_workspace_id_tempo_id", "workspace_id", "tempo", "id"),
+        Index("ix_submissions_workspace_id_key", "workspace_id", "key"),
+        Index("ix_submissions_genre", "genre", postgresql_using="gin"),
+        Index("ix_submissions_search_vector", "search_vector", postgresql_using="gin"),
+    )
+
+
+class WorkspaceStatusCount(Base):
+    """Number of a workspace's submissions per status, kept in step by the trigger below."""
+    __tablename__ = "workspace_status_counts"
+
+    workspace_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("workspaces.id", ondelete="CASCADE"), primary_key=True)
+    status: Mapped[Status] = mapped_column(SAEnum(Status, name="status_enums"), primary_key=True)
+    count: Mapped[int] = mapped_column(BigInteger, server_default="0", nullable=False)
+
+
+class ProducerStatusCount(Base):
+    """Number of a producer's submissions per status, kept in step by the trigger below."""
+    __tablename__ = "producer_status_counts"
+
+    producer_profile_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("producer_profiles.id", ondelete="CASCADE"),
+                                                           primary_key=True)
+    status: Mapped[Status] = mapped_column(SAEnum(Status, name="status_enums"), primary_key=True)
+    count: Mapped[int] = mapped_column(BigInteger, server_default="0", nullable=False)
+
+
+class ReviewLatencyBucket(Base):
+    """One bucket of a workspace's monthly PENDING -> IN_REVIEW latency sketch (see app.sketch),
+    upserted by the start-review transition; latency_seconds sums the bucket's values for the mean."""
+    __tablename__ = "review_latency_buckets"
+
+    workspace_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("workspaces.id", ondelete="CASCADE"), primary_key=True)
+    period_start: Mapped[date] = mapped_column(Date, primary_key=True)
+    bucket: Mapped[int] = mapped_column(SmallInteger, primary_key=True)
+    reviews: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    latency_seconds: Mapped[float] = mapped_column(Float, nullable=False)
+
+
+# (counter table, submissions column) pairs maintained by count_submission_statuses()
+STATUS_COUNTERS = (("workspace_status_counts", "workspace_id"), ("producer_status_counts", "producer_profile_id"))
+
+# Table comment of a counter table that hasn't been seeded yet: on an existing database the
+# submissions predate it; it is seeded and cleared by migration 0003 on deployed databases
+# and by init_db (SubmissionCounterService) on local ones.
+COUNTERS_PENDING_COMMENT = "counts pending reconciliation"
+for _table, _column in STATUS_COUNTERS:
+    event.listen(Base.metadata.tables[_table], "after_create",
+                 DDL(f"COMMENT ON TABLE {_table} IS '{COUNTERS_PENDING_COMMENT}'"))
+
+
+def _apply_status_deltas(changes: str) -> str:
+    """Add the per-(key, status) sum of `changes` (rows of key, status, delta) to both counter tables.
+
+    Keys are upserted in order, so concurrent statements lock counter rows in the same order;
+    the triggers fire at the end of the statement, so the writers hold them only until their commit.
+    """
+    return "".join(
+        f"INSERT INTO {table} ({column}, status, count) "
+        f"SELECT {column}, status, sum(delta) FROM ({changes.format(column=column)}) AS changes "
+        f"GROUP BY {column}, status HAVING sum(delta) <> 0 ORDER BY {column}, status "
+        f"ON CONFLICT ({column}, status) DO UPDATE SET count = {table}.count + EXCLUDED.count; "
+        for table, column in STATUS_COUNTERS
+    )
+
+
+# Statement-level triggers with transition tables: one upsert per statement (not per row),
+# in the writing transaction, whichever path wrote (ORM insert, fan-out or transition CTEs).
+event.listen(Base.metadata, "after_create", DDL(
+    "CREATE OR REPLACE FUNCTION count_submission_statuses() RETURNS trigger LANGUAGE plpgsql AS $$ "
+    "BEGIN "
+    "IF TG_OP = 'INSERT' THEN "
+    + _apply_status_deltas("SELECT {column}, status, 1 AS delta FROM new_rows")
+    + "ELSIF TG_OP = 'UPDATE' THEN "
+    + _apply_status_deltas("SELECT {column}, status, -1 AS delta FROM old_rows "
+                           "UNION ALL SELECT {column}, status, 1 FROM new_rows")
+    + "ELSE "
+    + _apply_status_deltas("SELECT {column}, status, -1 AS delta FROM old_rows")
+    + "END IF; "
+    "RETURN NULL; "
+    "END $$"
+))
+for _operation, _transition_tables in (("INSERT", "NEW TABLE AS new_rows"),
+                                       ("UPDATE", "OLD TABLE AS old_rows NEW TABLE AS new_rows"),
+                                       ("DELETE", "OLD TABLE AS old_rows")):
+    event.listen(Base.metadata, "after_create", DDL(
+        f"CREATE OR REPLACE TRIGGER submissions_count_{_operation.lower()} AFTER {_operation} ON submissions "
+        f"REFERENCING {_transition_tables} FOR EACH STATEMENT EXECUTE FUNCTION count_submission_statuses()"
+    ))
+
+
+# Channel of the NOTIFY sent when submission events commit (see app/notifications.py).
+SUBMISSION_EVENTS_CHANNEL = "submission_events"
+
+# One NOTIFY per (workspace, producer) touched by an INSERT statement, delivered by
+# Postgres on commit; covers every write path, including the single-statement CTEs.
+event.listen(Base.metadata, "after_create", DDL(
+    "CREATE OR REPLACE FUNCTION notify_submission_events() RETURNS trigger LANGUAGE plpgsql AS $$ "
+    "BEGIN "
+    f"PERFORM pg_notify('{SUBMISSION_EVENTS_CHANNEL}', json_build_object("
+    "'workspace_id', changed.workspace_id, 'producer_profile_id', changed.producer_profile_id, "
+    "'txid', pg_current_xact_id()::text::bigint)::text) "
+    "FROM (SELECT DISTINCT workspace_id, owner_producer_profile_id AS producer_profile_id FROM new_events) AS changed; "
+    "RETURN NULL; "
+    "END $$"
+))
+event.listen(Base.metadata, "after_create", DDL(
+    "CREATE OR REPLACE TRIGGER submission_events_notify AFTER INSERT ON submission_events "
+    "REFERENCING NEW TABLE AS new_events FOR EACH STATEMENT EXECUTE FUNCTION notify_submission_events()"
+))
+
+
+# Copies the submission's producer into owner_producer_profile_id when an insert leaves it
+# NULL: the previous release doesn't know the column and keeps serving while the schema
+# step backfills it and enforces NOT NULL (constraints are checked after BEFORE triggers).
+event.listen(Base.metadata, "after_create", DDL(
+    "CREATE OR REPLACE FUNCTION fill_submission_event_owner() RETURNS trigger LANGUAGE plpgsql AS $$ "
+    "BEGIN "
+    "IF NEW.owner_producer_profile_id IS NULL THEN "
+    "SELECT producer_profile_id INTO NEW.owner_producer_profile_id FROM submissions WHERE id = NEW.submission_id; "
+    "END IF; "
+    "RETURN NEW; "
+    "END $$"
+))
+event.listen(Base.metadata, "after_create", DDL(
+    "CREATE OR REPLACE TRIGGER submission_events_fill_owner BEFORE INSERT ON submission_events "
+    "FOR EACH ROW EXECUTE FUNCTION fill_submission_event_owner()"
+))
+
 
 class SubmissionEvent(Base):
     __tablename__ = "submission_events"
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     status: Mapped[Status] = mapped_column(SAEnum(Status, name="status_enums"), nullable=False)
-    event_date: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
+    # partition key (monthly RANGE partitions, see app/partitions.py), hence part of the primary key
+    event_date: Mapped[datetime] = mapped_column(DateTime, primary_key=True, server_default=func.now())
+    # id of the inserting transaction; orders incremental sync, see SubmissionQueryService.sync_*
+    txid: Mapped[int] = mapped_column(BigInteger, server_default=text("(pg_current_xact_id()::text::bigint)"),
+                                      nullable=False)
     submission_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("submissions.id"), nullable=False)
     workspace_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("workspaces.id"), nullable=False)
     producer_profile_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("producer_profiles.id"), nullable=True, index=True)
     labelstaff_profile_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("labelstaff_profiles.id"), nullable=True, index=True)
+    # the submission's producer (producer_profile_id is the actor, NULL for label actions);
+    # copied on insert and never updated, so the producer timeline needs no join
+    owner_producer_profile_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("producer_profiles.id"), nullable=False)
 
     submission: Mapped["Submission"] = relationship(back_populates="events")
     workspace: Mapped["Workspace"] = relationship(back_populates="submission_events")
-    producer: Mapped["ProducerProfile"] = relationship(back_populates="submission_events")
+    producer: Mapped["ProducerProfile"] = relationship(back_populates="submission_events", foreign_keys=[producer_profile_id])
     labelstaff: Mapped["LabelStaffProfile"] = relationship(back_populates="submission_events")
 
     __table_args__ = (
@@ -168,4 +350,21 @@ class SubmissionEvent(Base):
             "(producer_profile_id IS NULL AND labelstaff_profile_id IS NOT NULL)",
             name="exactly_one_actor_provided"
         ),
-    )
\ No newline at end of file
+        # keyset pagination of a label's event history
+        Index("ix_submission_events_workspace_id_event_date_id", "workspace_id", "event_date", "id"),
+        Index("ix_submission_events_submission_id", "submission_id"),
+        # incremental sync of a label's events (since cursor)
+        Index("ix_submission_events_workspace_id_txid_id", "workspace_id", "txid", "id"),
+        # producer timeline (newest first) and sync: index-only range scans, no join
+        Index("ix_submission_events_owner_event_date_id", "owner_producer_profile_id", "event_date", "id",
+              postgresql_include=["status", "submission_id", "workspace_id", "producer_profile_id", "labelstaff_profile_id"]),
+        Index("ix_submission_events_owner_txid_id", "owner_producer_profile_id", "txid", "id"),
+        {"postgresql_partition_by": "RANGE (event_date)"},
+    )
+
+
+# Catches rows no monthly partition covers yet; app.partitions moves them out when it
+# creates that month's partition (ahead of time, so normally it stays empty).
+event.listen(SubmissionEvent.__table__, "after_create", DDL(
+    "CREATE TABLE IF NOT EXISTS submission_events_default PARTITION OF submission_events DEFAULT"
+))
\ No newline at end of file
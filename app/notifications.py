@@ -0,0 +1,222 @@
+import asyncio
+import json
+import logging
+from collections import defaultdict
+from typing import AsyncIterator, Awaitable, Callable, Sequence
+from uuid import UUID
+
+import psycopg
+from sqlalchemy.engine import make_url
+
+from app.models.models import SUBMISSION_EVENTS_CHANNEL, SubmissionEvent
+from app.pagination import decode_cursor, encode_cursor
+from app.schemas.schemas import SubmissionEventPublic
+from app.serialization import row_adapter
+from app.settings import settings
+
+
+logger = logging.getLogger(__name__)
+
+_RECONNECT_MAX_SECONDS = 30.0
+_HORIZON_RETRY_SECONDS = 0.25
+_SYNC_ORDER = (SubmissionEvent.txid, SubmissionEvent.id)
+
+
+class TooManySubscribersError(Exception):
+    """Raise when this process already holds settings.push_max_subscribers push connections."""
+    pass
+
+
+class PushUnavailableError(Exception):
+    """Raise when no connection URL can deliver LISTEN notifications (see listen_url)."""
+    pass
+
+
+def listen_url() -> str | None:
+    """URL of the listener's connection; None when the only one configured goes through a
+    transaction-mode pooler, which accepts LISTEN but never delivers the notifications."""
+    if settings.push_listen_database_url:
+        return settings.push_listen_database_url
+    if settings.db_pool_mode == "pgbouncer":
+        return None
+    return settings.database_url
+
+
+class Subscription:
+    """Wake-up signal of one push connection.
+
+    Notifications only carry the highest committed txid seen for the subscriber's key; the
+    connection reads the events themselves with the incremental sync query. Any number of
+    notifications between two reads collapse into one pending wake-up, so the per-connection
+    queue is bounded at one entry and a slow client never makes the process buffer events.
+    """
+
+    def __init__(self, key: tuple[str, UUID]):
+        self.key = key
+        self.pending_txid = 0
+        self._wakeup = asyncio.Event()
+
+
+    def notify(self, txid: int) -> bool:
+        """Record a commit; returns False when it was coalesced into an unread wake-up."""
+        coalesced = self._wakeup.is_set()
+        self.pending_txid = max(self.pending_txid, txid)
+        self._wakeup.set()
+        return not coalesced
+
+
+    async def wait(self, timeout: float) -> bool:
+        """Wait for a wake-up; False on timeout (time for a keepalive)."""
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout)
+        except TimeoutError:
+            return False
+        self._wakeup.clear()
+        return True
+
+
+class ChangeListener:
+    """One LISTEN connection per process, fanning submission event NOTIFYs out to the
+    in-process push subscribers of the affected workspace and producer.
+
+    Started on the first subscription and reconnected with backoff; after a reconnect
+    every subscriber is woken once so it re-syncs whatever was committed meanwhile.
+    """
+
+    def __init__(self):
+        self._subscribers: dict[tuple[str, UUID], set[Subscription]] = defaultdict(set)
+        self._task: asyncio.Task | None = None
+        self.connected = False
+        self.notifications = 0
+        self.wakeups = 0
+        self.coalesced = 0
+        self.reconnects = 0
+
+
+    @property
+    def subscriber_count(self) -> int:
+        return sum(len(subscriptions) for subscriptions in self._subscribers.values())
+
+
+    def subscribe(self, kind: str, key_id: UUID) -> Subscription:
+        if listen_url() is None:
+            raise PushUnavailableError("Live updates are not available, poll with ?since= instead.")
+        if self.subscriber_count >= settings.push_max_subscribers:
+            raise TooManySubscribersError("Too many live connections, retry later.")
+        subscription = Subscription((kind, key_id))
+        self._subscribers[subscription.key].add(subscription)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return subscription
+
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        subscriptions = self._subscribers.get(subscription.key)
+        if subscriptions is not None:
+            subscriptions.discard(subscription)
+            if not subscriptions:
+                del self._subscribers[subscription.key]
+
+
+    def dispatch(self, payload: str) -> None:
+        try:
+            change = json.loads(payload)
+            txid = int(change["txid"])
+            keys = [("workspace", UUID(change["workspace_id"])), ("producer", UUID(change["producer_profile_id"]))]
+        except (ValueError, KeyError, TypeError):
+            logger.warning("push: ignoring malformed notification %r", payload)
+            return
+
+        self.notifications += 1
+        for key in keys:
+            for subscription in self._subscribers.get(key, ()):
+                if subscription.notify(txid):
+                    self.wakeups += 1
+                else:
+                    self.coalesced += 1
+
+
+    def _wake_all(self) -> None:
+        for subscriptions in self._subscribers.values():
+            for subscription in subscriptions:
+                subscription.notify(0)
+
+
+    async def _run(self) -> None:
+        conninfo = make_url(listen_url()).set(drivername="postgresql").render_as_string(hide_password=False)
+        delay = 1.0
+        while True:
+            try:
+                async with await psycopg.AsyncConnection.connect(conninfo, autocommit=True) as conn:
+                    await conn.execute(f"LISTEN {SUBMISSION_EVENTS_CHANNEL}")
+                    self.connected = True
+                    delay = 1.0
+                    self._wake_all()
+                    async for notify in conn.notifies():
+                        self.dispatch(notify.payload)
+            except asyncio.CancelledError:
+                raise
+            except (psycopg.Error, OSError) as e:
+                logger.warning("push: listener connection lost (%r), reconnecting in %.0fs", e, delay)
+            finally:
+                self.connected = False
+            self.reconnects += 1
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, _RECONNECT_MAX_SECONDS)
+
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+    def stats(self) -> dict:
+        return {
+            "listener_connected": self.connected,
+            "subscribers": self.subscriber_count,
+            "notifications": self.notifications,
+            "wakeups": self.wakeups,
+            "coalesced": self.coalesced,
+            "reconnects": self.reconnects,
+        }
+
+
+change_listener = ChangeListener()
+
+
+async def live_events(subscription: Subscription,
+                      sync: Callable[[str], Awaitable[tuple[Sequence, str]]],
+                      cursor: str) -> AsyncIterator[str]:
+    """Server-sent events for one subscriber: every event after `cursor`, then new ones as they commit.
+
+    `sync(cursor)` runs one incremental sync round (at most page_size_max rows) on a
+    short-lived session, so an idle subscriber holds no database connection. Each event's
+    id is its sync cursor, so a reconnecting EventSource resumes via Last-Event-ID.
+    A notified commit that is still above the sync horizon (an older transaction is
+    in progress) is retried shortly instead of waiting for the next notification.
+    """
+    adapter = row_adapter(SubmissionEventPublic)
+    yield f"retry: {settings.push_retry_ms}\n\n"
+    retry_delay = _HORIZON_RETRY_SECONDS
+    while True:
+        rows, cursor = await sync(cursor)
+        for row in rows:
+            event_id = encode_cursor([getattr(row, column.key) for column in _SYNC_ORDER])
+            yield f"id: {event_id}\nevent: submission_event\ndata: {adapter.dump_json(row._asdict()).decode()}\n\n"
+        if len(rows) >= settings.page_size_max:
+            continue
+
+        synced_txid = decode_cursor(cursor, _SYNC_ORDER)[0]
+        if synced_txid < subscription.pending_txid:
+            await asyncio.sleep(retry_delay)
+            retry_delay = min(retry_delay * 2, settings.push_keepalive_seconds)
+            continue
+
+        retry_delay = _HORIZON_RETRY_SECONDS
+        if not await subscription.wait(settings.push_keepalive_seconds):
+            yield ": keepalive\n\n"
@@ -0,0 +1,91 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Sequence
+from uuid import UUID
+
+from sqlalchemy import Select, literal, tuple_
+
+
+class InvalidCursorError(Exception):
+    """Raise when a pagination cursor can't be decoded or doesn't match the requested ordering."""
+    pass
+
+
+def _dump(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+# JSON type a cursor value must have for a column of each python type (others: any)
+_CURSOR_JSON_TYPES = {datetime: str, UUID: str, str: str, int: int, float: (int, float)}
+
+
+def _load(column, value: Any) -> Any:
+    python_type = column.type.python_type
+    if (not isinstance(value, _CURSOR_JSON_TYPES.get(python_type, object))
+            or (isinstance(value, bool) and python_type is not bool)):
+        raise TypeError(f"{column.key}: unexpected {type(value).__name__} in cursor")
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is UUID:
+        return UUID(value)
+    return python_type(value)
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Opaque, URL-safe cursor for the sort key of the last row on a page."""
+    raw = json.dumps([_dump(value) for value in values], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str, columns: Sequence) -> list[Any]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+        if not isinstance(values, list) or len(values) != len(columns):
+            raise ValueError("cursor length mismatch")
+        return [_load(column, value) for column, value in zip(columns, values)]
+    except (binascii.Error, ValueError, TypeError) as e:
+        raise InvalidCursorError("Invalid cursor.") from e
+
+
+def keyset_after(stmt: Select, columns: Sequence, cursor: str | None, descending: bool = True) -> Select:
+    """Order `stmt` by `columns` (the last one must be unique, e.g. id), starting after `cursor`.
+
+    Uses a row comparison, so a composite index on the same columns serves both the
+    filter and the ordering. The leading column is also bounded on its own: row
+    comparisons don't prune partitions, a plain range on the partition key does.
+    """
+    if cursor:
+        values = decode_cursor(cursor, columns)
+        key = tuple_(*columns)
+        after = tuple_(*(literal(value, column.type) for column, value in zip(columns, values)))
+        stmt = stmt.where(key < after if descending else key > after)
+        if len(columns) > 1:
+            leading = literal(values[0], columns[0].type)
+            stmt = stmt.where(columns[0] <= leading if descending else columns[0] >= leading)
+    ordering = [column.desc() if descending else column.asc() for column in columns]
+    return stmt.order_by(*ordering)
+
+
+def keyset_paginate(stmt: Select, columns: Sequence, cursor: str | None, limit: int,
+                    descending: bool = True) -> Select:
+    """keyset_after plus limit + 1 rows; pass them to `keyset_page`."""
+    return keyset_after(stmt, columns, cursor, descending).limit(limit + 1)
+
+
+def keyset_page(rows: Sequence, columns: Sequence, limit: int) -> tuple[list, str | None]:
+    """Split the limit + 1 rows from `keyset_paginate` into the page and the cursor of the next one.
+
+    Rows must expose the sort values as attributes named like `columns` (entities or result rows).
+    """
+    items = list(rows[:limit])
+    if len(rows) <= limit:
+        return items, None
+    last = items[-1]
+    return items, encode_cursor([getattr(last, column.key) for column in columns])
@@ -0,0 +1,283 @@
+"""Monthly range partitions of submission_events: creation ahead of time, archival, restore.
+
+    python -m app.partitions list
+    python -m app.partitions ensure
+    python -m app.partitions archive [--before 2025-01]
+    python -m app.partitions restore submission_events_p202401
+
+Partitions are named submission_events_pYYYYMM and cover one calendar month of
+event_date; a DEFAULT partition catches rows no monthly partition covers yet (they are
+moved out when that month's partition is created). A table converted from the
+unpartitioned layout (migration 0005) keeps its history in submission_events_legacy
+(MINVALUE up to the first monthly partition).
+
+Archiving detaches a partition, copies it to <event_archive_dir>/<partition>.csv.gz plus
+a JSON manifest (bounds, row count), checks the row count and only then drops it.
+Restoring loads the file into a fresh table and attaches it again with the same bounds.
+"""
+import argparse
+import asyncio
+import gzip
+import json
+import logging
+import re
+from dataclasses import dataclass
+from datetime import date, datetime
+from pathlib import Path
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.settings import settings
+
+
+logger = logging.getLogger(__name__)
+
+EVENTS_TABLE = "submission_events"
+DEFAULT_PARTITION = f"{EVENTS_TABLE}_default"
+
+_BOUND_RE = re.compile(r"FOR VALUES FROM \((.+)\) TO \((.+)\)")
+_COPY_CHUNK = 1 << 16
+
+
+class PartitionArchiveError(Exception):
+    """Raise when an archive is missing, incomplete or conflicts with an attached partition."""
+    pass
+
+
+@dataclass(frozen=True)
+class EventPartition:
+    name: str
+    start: date | None  # None: MINVALUE (or the DEFAULT partition)
+    end: date | None    # None: MAXVALUE (or the DEFAULT partition)
+    is_default: bool = False
+
+
+def add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"{EVENTS_TABLE}_p{month:%Y%m}"
+
+
+def _parse_bound(value: str) -> date | None:
+    if value in ("MINVALUE", "MAXVALUE"):
+        return None
+    return datetime.fromisoformat(value.strip("'")).date()
+
+
+def _sql_bound(value: date | None, infinite: str) -> str:
+    return infinite if value is None else f"'{value.isoformat()}'"
+
+
+def _overlaps(partition: EventPartition, start: date | None, end: date | None) -> bool:
+    if partition.is_default:
+        return False
+    return ((partition.start is None or end is None or partition.start < end)
+            and (start is None or partition.end is None or start < partition.end))
+
+
+async def list_partitions(conn: AsyncConnection) -> list[EventPartition]:
+    result = await conn.execute(text(
+        "SELECT child.relname, pg_get_expr(child.relpartbound, child.oid) FROM pg_inherits "
+        "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+        "WHERE pg_inherits.inhparent = to_regclass(:table_name) ORDER BY child.relname"
+    ), {"table_name": EVENTS_TABLE})
+    partitions = []
+    for name, bound in result.tuples():
+        match = _BOUND_RE.match(bound)
+        if match:
+            partitions.append(EventPartition(name, _parse_bound(match.group(1)), _parse_bound(match.group(2))))
+        else:
+            partitions.append(EventPartition(name, None, None, is_default=True))
+    return sorted(partitions, key=lambda p: (p.is_default, p.start or date.min))
+
+
+async def _attach_new_partition(conn: AsyncConnection, name: str, start: date | None, end: date | None,
+                                load=None) -> None:
+    """Create `name` shaped like the parent, fill it (rows of its range parked in the DEFAULT
+    partition, then `load`), and attach it; runs in the caller's transaction."""
+    await conn.execute(text(
+        f"CREATE TABLE {name} (LIKE {EVENTS_TABLE} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+    ))
+    lower = "" if start is None else f"event_date >= '{start.isoformat()}'"
+    upper = "" if end is None else f"event_date < '{end.isoformat()}'"
+    in_range = " AND ".join(condition for condition in (lower, upper) if condition) or "true"
+    await conn.execute(text(
+        f"WITH moved AS (DELETE FROM {DEFAULT_PARTITION} WHERE {in_range} RETURNING *) "
+        f"INSERT INTO {name} SELECT * FROM moved"
+    ))
+    if load is not None:
+        await load(conn, name)
+    await conn.execute(text(
+        f"ALTER TABLE {EVENTS_TABLE} ATTACH PARTITION {name} "
+        f"FOR VALUES FROM ({_sql_bound(start, 'MINVALUE')}) TO ({_sql_bound(end, 'MAXVALUE')})"
+    ))
+
+
+async def ensure_partitions(conn: AsyncConnection, months_ahead: int) -> list[str]:
+    """Create the DEFAULT partition and the monthly partitions from the current month to
+    `months_ahead` months ahead that don't exist yet; returns the names created."""
+    await conn.execute(text("SELECT pg_advisory_xact_lock(hashtext(:table_name))"), {"table_name": EVENTS_TABLE})
+    await conn.execute(text(f"CREATE TABLE IF NOT EXISTS {DEFAULT_PARTITION} PARTITION OF {EVENTS_TABLE} DEFAULT"))
+
+    current_month = await conn.scalar(text("SELECT date_trunc('month', now())::date"))
+    partitions = await list_partitions(conn)
+    created = []
+    for offset in range(months_ahead + 1):
+        month = add_months(current_month, offset)
+        if await create_month_partition(conn, month, partitions):
+            created.append(partition_name(month))
+    return created
+
+
+async def create_month_partition(conn: AsyncConnection, month: date,
+                                 partitions: list[EventPartition] | None = None) -> bool:
+    """Create and attach the partition of `month` (a month start) unless an attached
+    partition already covers part of it; returns whether it was created."""
+    end = add_months(month, 1)
+    if partitions is None:
+        partitions = await list_partitions(conn)
+    if any(_overlaps(partition, month, end) for partition in partitions):
+        return False
+    await _attach_new_partition(conn, partition_name(month), month, end)
+    logger.info("partitions: created %s", partition_name(month))
+    return True
+
+
+def _archive_paths(archive_dir: Path, name: str) -> tuple[Path, Path]:
+    return archive_dir / f"{name}.csv.gz", archive_dir / f"{name}.json"
+
+
+async def archive_partition(conn: AsyncConnection, partition: EventPartition, archive_dir: Path) -> Path:
+    """Detach one partition, copy it to a gzip'd CSV, verify the row count, then drop it.
+
+    `conn` must not be inside a transaction. Detaching first means no write can reach the
+    table while it is copied (a late event of its month goes to the DEFAULT partition);
+    when the copy fails the table is attached back.
+    """
+    if partition.is_default:
+        raise PartitionArchiveError("The DEFAULT partition can't be archived.")
+    archive_dir.mkdir(parents=True, exist_ok=True)
+    data_path, manifest_path = _archive_paths(archive_dir, partition.name)
+    partial_path = data_path.with_suffix(".gz.partial")
+
+    async with conn.begin():
+        await conn.execute(text(f"SET LOCAL lock_timeout = '{settings.event_partition_lock_timeout_ms}ms'"))
+        await conn.execute(text(f"ALTER TABLE {EVENTS_TABLE} DETACH PARTITION {partition.name}"))
+    try:
+        async with conn.begin():
+            expected = await conn.scalar(text(f"SELECT count(*) FROM {partition.name}"))
+            raw_connection = await conn.get_raw_connection()
+            lines = 0
+            with gzip.open(partial_path, "wb") as archive:
+                async with raw_connection.driver_connection.cursor() as cursor:
+                    async with cursor.copy(f"COPY {partition.name} TO STDOUT (FORMAT csv, HEADER)") as copy:
+                        async for chunk in copy:
+                            archive.write(chunk)
+                            lines += bytes(chunk).count(b"\n")
+        # no column type of the table can contain a newline, so lines = header + rows
+        if lines - 1 != expected:
+            raise PartitionArchiveError(f"{partition.name}: copied {lines - 1} rows, expected {expected}.")
+    except Exception:
+        partial_path.unlink(missing_ok=True)
+        async with conn.begin():
+            await conn.execute(text(
+                f"ALTER TABLE {EVENTS_TABLE} ATTACH PARTITION {partition.name} FOR VALUES "
+                f"FROM ({_sql_bound(partition.start, 'MINVALUE')}) TO ({_sql_bound(partition.end, 'MAXVALUE')})"
+            ))
+        raise
+    partial_path.rename(data_path)
+    manifest_path.write_text(json.dumps({
+        "table": partition.name,
+        "from": partition.start and partition.start.isoformat(),
+        "to": partition.end and partition.end.isoformat(),
+        "rows": expected,
+        "archived_at": datetime.now().isoformat(timespec="seconds"),
+    }, indent=2))
+
+    async with conn.begin():
+        await conn.execute(text(f"DROP TABLE {partition.name}"))
+    logger.info("partitions: archived %s (%d rows) to %s", partition.name, expected, data_path)
+    return data_path
+
+
+async def archive_partitions(conn: AsyncConnection, before: date, archive_dir: Path) -> list[Path]:
+    """Archive every partition that ends on or before `before` (a month start)."""
+    async with conn.begin():
+        partitions = await list_partitions(conn)
+    return [await archive_partition(conn, partition, archive_dir) for partition in partitions
+            if not partition.is_default and partition.end is not None and partition.end <= before]
+
+
+async def restore_partition(conn: AsyncConnection, name: str, archive_dir: Path) -> int:
+    """Load an archived partition back and attach it with its original bounds; returns its row count."""
+    data_path, manifest_path = _archive_paths(archive_dir, name)
+    if not data_path.exists() or not manifest_path.exists():
+        raise PartitionArchiveError(f"No archive of {name} in {archive_dir}.")
+    manifest = json.loads(manifest_path.read_text())
+    start = manifest["from"] and date.fromisoformat(manifest["from"])
+    end = manifest["to"] and date.fromisoformat(manifest["to"])
+
+    async def load(conn: AsyncConnection, table_name: str) -> None:
+        with gzip.open(data_path, "rb") as archive:
+            columns = archive.readline().decode().strip()
+            raw_connection = await conn.get_raw_connection()
+            async with raw_connection.driver_connection.cursor() as cursor:
+                async with cursor.copy(f"COPY {table_name} ({columns}) FROM STDIN (FORMAT csv)") as copy:
+                    while chunk := archive.read(_COPY_CHUNK):
+                        await copy.write(chunk)
+        restored = await conn.scalar(text(f"SELECT count(*) FROM {table_name}"))
+        if restored < manifest["rows"]:
+            raise PartitionArchiveError(f"{name}: restored {restored} rows, the archive lists {manifest['rows']}.")
+
+    async with conn.begin():
+        if any(_overlaps(partition, start, end) for partition in await list_partitions(conn)):
+            raise PartitionArchiveError(f"{name}: its range overlaps an attached partition.")
+        await _attach_new_partition(conn, name, start, end, load=load)
+    logger.info("partitions: restored %s (%d rows)", name, manifest["rows"])
+    return manifest["rows"]
+
+
+async def _main(args: argparse.Namespace) -> None:
+    from app.database import engine
+
+    archive_dir = Path(settings.event_archive_dir)
+    try:
+        async with engine.connect() as conn:
+            if args.command == "list":
+                async with conn.begin():
+                    for partition in await list_partitions(conn):
+                        bounds = "DEFAULT" if partition.is_default else f"{partition.start or 'MINVALUE'} .. {partition.end or 'MAXVALUE'}"
+                        print(f"{partition.name}: {bounds}")
+            elif args.command == "ensure":
+                async with conn.begin():
+                    print("\n".join(await ensure_partitions(conn, settings.event_partitions_ahead)) or "nothing to create")
+            elif args.command == "archive":
+                async with conn.begin():
+                    current_month = await conn.scalar(text("SELECT date_trunc('month', now())::date"))
+                before = (date.fromisoformat(f"{args.before}-01") if args.before
+                          else add_months(current_month, -settings.event_retention_months))
+                for path in await archive_partitions(conn, before, archive_dir):
+                    print(path)
+            elif args.command == "restore":
+                rows = await restore_partition(conn, args.partition, archive_dir)
+                print(f"{args.partition}: {rows} rows restored")
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("list", help="list attached partitions and their bounds")
+    commands.add_parser("ensure", help="create the partitions up to EVENT_PARTITIONS_AHEAD months ahead")
+    archive = commands.add_parser("archive", help="archive and drop partitions older than the retention window")
+    archive.add_argument("--before", help="YYYY-MM: archive partitions ending on or before this month "
+                                          "(default: EVENT_RETENTION_MONTHS before the current month)")
+    restore = commands.add_parser("restore", help="load an archived partition back")
+    restore.add_argument("partition", help="partition name, e.g. submission_events_p202401")
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(_main(parser.parse_args()))
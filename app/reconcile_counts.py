@@ -0,0 +1,25 @@
+"""Status counter reconciliation job: `python -m app.reconcile_counts`.
+
+Recounts submissions per workspace and per producer in chunks of
+settings.counter_reconcile_batch_size keys and repairs counters that drifted.
+The migration that creates the counter tables seeds them itself; run this on
+a schedule.
+"""
+import asyncio
+
+import app.models.models  # noqa: F401
+from app.database import SessionLocal, engine
+from app.services.submissions import SubmissionCounterService
+from app.settings import settings
+
+
+async def main() -> None:
+    async with SessionLocal() as session:
+        report = await SubmissionCounterService(session).reconcile(settings.counter_reconcile_batch_size)
+    await engine.dispose()
+    for table, stats in report.items():
+        print(f"{table}: {stats['scanned']} keys scanned, {stats['repaired']} counters repaired")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,27 @@
+from fastapi import APIRouter, Depends, status
+
+from app.schemas.schemas import MetricsPublic
+from app.database import get_pool_stats, get_read_pool_stats
+from app.dependencies import require_metrics_token
+from app.instrumentation import get_query_stats, startup_metrics
+from app.services.auth import password_hash_executor
+from app.services.users import user_cache
+from app.services.memberships import membership_cache
+from app.notifications import change_listener
+
+
+router = APIRouter(tags=["Metrics"])
+
+
+@router.get("/metrics", status_code=status.HTTP_200_OK, response_model=MetricsPublic,
+            dependencies=[Depends(require_metrics_token)])
+async def read_metrics() -> MetricsPublic:
+    """Read process-level runtime metrics"""
+    return MetricsPublic(db_pool=get_pool_stats(),
+                         db_read_pool=get_read_pool_stats(),
+                         sql=get_query_stats(),
+                         user_cache=user_cache.stats(),
+                         membership_cache=membership_cache.stats(),
+                         password_hashing=password_hash_executor.stats(),
+                         startup=startup_metrics.stats(),
+                         push=change_listener.stats())
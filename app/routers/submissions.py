@@ -1,39 +1,207 @@
+from typing import Annotated, Literal
 from uuid import UUID
 
-from fastapi import APIRouter, status, HTTPException, Response
+from fastapi import APIRouter, Depends, status, Header, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
+from starlette.background import BackgroundTask
 
-from app.schemas.schemas import SubmissionCreate, SubmissionPublic, SubmissionEventPublic
-from app.dependencies import SubmissionQueryServiceDep, MembershipServiceDep, CurrentProducerProfileIdDep, SubmissionWorkflowServiceDep
-from app.services.submissions import SubmissionNotFoundError, TransitionNotAllowedError, ActorNotUniqueError
+from app.schemas.schemas import SubmissionCreate, SubmissionPublic, SubmissionQueueFilters, SubmissionStatusSummary, ResponseTimesPublic, SubmissionEventPublic, BulkTransitionCreate, BulkTransitionResult, SubmissionFanOutCreate, SubmissionFanOutPublic
+from app.dependencies import SubmissionQueryServiceDep, MembershipServiceDep, CurrentProducerProfileIdDep, SubmissionWorkflowServiceDep, ReadSessionFactoryDep, ReadSessionDep, SessionDep
+from app.services.submissions import SubmissionQueryService, SubmissionNotFoundError, TransitionNotAllowedError, ActorNotUniqueError, SourceTrackNotFoundError
 from app.services.memberships import MembershipNotFoundError
+from app.models.models import Status
+from app.notifications import PushUnavailableError, TooManySubscribersError, change_listener, live_events
+from app.pagination import InvalidCursorError, decode_cursor
+from app.serialization import RowsJSONResponse, ndjson_lines
+from app.settings import settings
 
 router = APIRouter(tags=["Submissions"])
 
+CursorQuery = Annotated[str | None, Query(description="Opaque cursor from the X-Next-Cursor header of the previous page")]
+LimitQuery = Annotated[int, Query(ge=1, le=settings.page_size_max)]
+
+
+SinceQuery = Annotated[str | None, Query(description="Incremental sync: only events after this cursor, oldest first "
+                                                     "('0' for the beginning); the next one is in X-Next-Cursor")]
+StreamQuery = Annotated[bool, Query(description="Stream the whole history as NDJSON (same as Accept: application/x-ndjson)")]
+
+
+LastEventIdHeader = Annotated[str | None, Header(description="Resume a live stream after this event id (sent by EventSource on reconnect)")]
+
+
+def wants_ndjson(request: Request, stream: bool) -> bool:
+    return stream or "application/x-ndjson" in request.headers.get("accept", "")
+
+
+def next_cursor_headers(next_cursor: str | None) -> dict[str, str]:
+    return {"X-Next-Cursor": next_cursor} if next_cursor else {}
+
+
+def change_etag(scope: str, version: str | None) -> str | None:
+    """ETag from a change watermark; the URL (filters, cursor, limit) is implied by the request."""
+    return f'"{scope}.{version}"' if version is not None else None
+
+
+def is_not_modified(request: Request, etag: str | None) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if not etag or not if_none_match:
+        return False
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in tags or etag in tags
+
+
+def etag_headers(etag: str | None) -> dict[str, str]:
+    return {"ETag": etag, "Cache-Control": "private, no-cache"} if etag else {}
+
+
+def not_modified_response(etag: str) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=etag_headers(etag))
+
+
+def live_events_response(kind: str, key_id: UUID, cursor: str, sync) -> StreamingResponse:
+    """text/event-stream of the events after `cursor`, pushed as they commit (see app.notifications)."""
+    try:
+        subscription = change_listener.subscribe(kind, key_id)
+    except TooManySubscribersError as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e), headers={"Retry-After": "5"})
+    except PushUnavailableError as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e))
+    # background runs even when the client disconnects before the first event
+    return StreamingResponse(live_events(subscription, sync, cursor), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+                             background=BackgroundTask(change_listener.unsubscribe, subscription))
+
+
+def get_queue_filters(status: Annotated[list[Status] | None, Query()] = None,
+                      tempo_min: float | None = None,
+                      tempo_max: float | None = None,
+                      key: str | None = None,
+                      genre: Annotated[list[str] | None, Query()] = None,
+                      sort: Literal["newest", "oldest", "tempo_asc", "tempo_desc"] = "newest",
+                      ) -> SubmissionQueueFilters:
+    try:
+        return SubmissionQueueFilters(status=status, tempo_min=tempo_min, tempo_max=tempo_max,
+                                      key=key, genre=genre, sort=sort)
+    except ValidationError as e:
+        raise RequestValidationError(e.errors(include_url=False, include_context=False))
+
+QueueFiltersDep = Annotated[SubmissionQueueFilters, Depends(get_queue_filters)]
+
 
 # -------------- READ Operations (SubmissionQueryService) ---------------------
 @router.get("/submissions", status_code=status.HTTP_200_OK, response_model=list[SubmissionPublic])
 async def list_producer_submissions(submission_query_service: SubmissionQueryServiceDep,
-                                    producer_profile_id: CurrentProducerProfileIdDep
-                                    ) -> list[SubmissionPublic]:
-    """Read submissions | Producer side"""
-    submissions = await submission_query_service.list_producer_submissions(producer_profile_id)
-    return submissions
+                                    producer_profile_id: CurrentProducerProfileIdDep,
+                                    request: Request,
+                                    cursor: CursorQuery = None,
+                                    limit: LimitQuery = settings.page_size_default,
+                                    ) -> Response:
+    """Read submissions | Producer side (newest first, paginated; ETag / If-None-Match)"""
+    try:
+        etag = change_etag("p", await submission_query_service.producer_version(producer_profile_id))
+        if is_not_modified(request, etag):
+            return not_modified_response(etag)
+        submissions, next_cursor = await submission_query_service.list_producer_submissions(producer_profile_id, cursor, limit)
+        return RowsJSONResponse(SubmissionPublic, submissions,
+                                headers={**next_cursor_headers(next_cursor), **etag_headers(etag)})
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
 @router.get("/workspaces/{workspace_id}/submissions", status_code=status.HTTP_200_OK, response_model=list[SubmissionPublic])
 async def list_label_submissions(submission_query_service: SubmissionQueryServiceDep,
                                  workspace_id: UUID,
                                  membership_service: MembershipServiceDep,
-                                 ) -> list[SubmissionPublic]:
-    """Read submissions | Label side"""
+                                 request: Request,
+                                 filters: QueueFiltersDep,
+                                 cursor: CursorQuery = None,
+                                 limit: LimitQuery = settings.page_size_default,
+                                 ) -> Response:
+    """Read submissions | Label side (filtered by status, tempo range, key, genre; sorted, paginated; ETag / If-None-Match)"""
+    try:
+        await membership_service.is_member_of_label(workspace_id)
+        etag = change_etag("w", await submission_query_service.workspace_version(workspace_id))
+        if is_not_modified(request, etag):
+            return not_modified_response(etag)
+        submissions, next_cursor = await submission_query_service.list_label_submissions(workspace_id, filters,
+                                                                                         cursor, limit)
+        return RowsJSONResponse(SubmissionPublic, submissions,
+                                headers={**next_cursor_headers(next_cursor), **etag_headers(etag)})
+    except MembershipNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+
+@router.get("/submissions/summary", status_code=status.HTTP_200_OK, response_model=SubmissionStatusSummary)
+async def read_producer_submission_summary(submission_query_service: SubmissionQueryServiceDep,
+                                           producer_profile_id: CurrentProducerProfileIdDep,
+                                           ) -> SubmissionStatusSummary:
+    """Read submission counts per status | Producer side"""
+    return await submission_query_service.producer_status_summary(producer_profile_id)
+
+
+@router.get("/workspaces/{workspace_id}/submissions/summary", status_code=status.HTTP_200_OK, response_model=SubmissionStatusSummary)
+async def read_label_submission_summary(submission_query_service: SubmissionQueryServiceDep,
+                                        workspace_id: UUID,
+                                        membership_service: MembershipServiceDep,
+                                        ) -> SubmissionStatusSummary:
+    """Read submission counts per status | Label side"""
     try:
         await membership_service.is_member_of_label(workspace_id)
-        submissions = await submission_query_service.list_label_submissions(workspace_id)
-        return submissions
+        return await submission_query_service.label_status_summary(workspace_id)
     except MembershipNotFoundError as e:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
 
 
+@router.get("/workspaces/{workspace_id}/submissions/stale", status_code=status.HTTP_200_OK, response_model=list[SubmissionPublic])
+async def list_stale_label_submissions(submission_query_service: SubmissionQueryServiceDep,
+                                       workspace_id: UUID,
+                                       membership_service: MembershipServiceDep,
+                                       days: Annotated[int, Query(ge=0, le=3650)] = settings.stale_pending_days_default,
+                                       cursor: CursorQuery = None,
+                                       limit: LimitQuery = settings.page_size_default,
+                                       ) -> Response:
+    """Read stale submissions | Label side (PENDING for more than `days`, longest waiting first, paginated)"""
+    try:
+        await membership_service.is_member_of_label(workspace_id)
+        submissions, next_cursor = await submission_query_service.list_stale_label_submissions(workspace_id, days, cursor, limit)
+        return RowsJSONResponse(SubmissionPublic, submissions, headers=next_cursor_headers(next_cursor))
+    except MembershipNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.get("/workspaces/{workspace_id}/response-times", status_code=status.HTTP_200_OK, response_model=ResponseTimesPublic)
+async def read_label_response_times(submission_query_service: SubmissionQueryServiceDep,
+                                    workspace_id: UUID,
+                                    ) -> ResponseTimesPublic:
+    """Read a label's time to first review (mean, p50, p90) | Any signed-in user, so producers can compare labels"""
+    return await submission_query_service.label_response_times(workspace_id)
+
+
+@router.get("/workspaces/{workspace_id}/submissions/search", status_code=status.HTTP_200_OK, response_model=list[SubmissionPublic])
+async def search_label_submissions(submission_query_service: SubmissionQueryServiceDep,
+                                   workspace_id: UUID,
+                                   membership_service: MembershipServiceDep,
+                                   q: Annotated[str, Query(min_length=1, max_length=200)],
+                                   cursor: CursorQuery = None,
+                                   limit: LimitQuery = settings.page_size_default,
+                                   ) -> Response:
+    """Search submissions | Label side (title, genre, metadata; prefix match, best match first, paginated)"""
+    try:
+        await membership_service.is_member_of_label(workspace_id)
+        submissions, next_cursor = await submission_query_service.search_label_submissions(workspace_id, q, cursor, limit)
+        return RowsJSONResponse(SubmissionPublic, submissions, headers=next_cursor_headers(next_cursor))
+    except MembershipNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
 
 # -------------- STATE Transitions (SubmissionWorkflowService) ----------------
 @router.post("/submissions", status_code=status.HTTP_201_CREATED, response_model=SubmissionPublic)
@@ -49,6 +217,23 @@ async def create_submission(submission_data: SubmissionCreate,
     return new_submission
 
 
+@router.post("/submissions/fan-out", status_code=status.HTTP_201_CREATED, response_model=SubmissionFanOutPublic)
+async def fan_out_submission(fan_out_data: SubmissionFanOutCreate,
+                             producer_profile_id: CurrentProducerProfileIdDep,
+                             submission_workflow_service: SubmissionWorkflowServiceDep) -> SubmissionFanOutPublic:
+    """
+    Submit an existing track to many labels at once:
+    1. Snapshots the track into one Submission per workspace
+    2. Creates their first events (Status: PENDING)
+    """
+    try:
+        return await submission_workflow_service.fan_out_track(fan_out_data.track_id,
+                                                               fan_out_data.workspace_ids,
+                                                               producer_profile_id)
+    except SourceTrackNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+
 @router.post("/submissions/{submission_id}/withdraw", status_code=status.HTTP_204_NO_CONTENT)
 async def transition_to_withdrawn(submission_id: UUID,
                                   submission_workflow_service: SubmissionWorkflowServiceDep,
@@ -157,23 +342,149 @@ async def transition_to_rejected(workspace_id: UUID,
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))    
     
 
+@router.post("/workspaces/{workspace_id}/submissions/transitions",
+             status_code=status.HTTP_200_OK, response_model=list[BulkTransitionResult])
+async def bulk_transition(workspace_id: UUID,
+                          transition_data: BulkTransitionCreate,
+                          submission_workflow_service: SubmissionWorkflowServiceDep,
+                          membership_service: MembershipServiceDep
+                          ) -> list[BulkTransitionResult]:
+    """Bulk transition: apply one target status to many submissions, with a per-id outcome"""
+    try:
+        await membership_service.is_member_of_label(workspace_id)
+        actor_id = membership_service.labelstaff_profile_id
+        return await submission_workflow_service.bulk_transition(transition_data.submission_ids,
+                                                                 transition_data.target_status,
+                                                                 workspace_id,
+                                                                 actor_id)
+    except MembershipNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
+    except TransitionNotAllowedError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+
+
 # -------------- READ Events (..) ----------------
 @router.get("/submissions/events", status_code=status.HTTP_200_OK, response_model=list[SubmissionEventPublic])
 async def list_producer_submission_events(submission_query_service: SubmissionQueryServiceDep,
-                                          producer_profile_id: CurrentProducerProfileIdDep) -> list[SubmissionEventPublic]:
-    """Read submission events | Producer side"""
-    submission_events = await submission_query_service.list_producer_submission_events(producer_profile_id)
-    return submission_events
+                                          producer_profile_id: CurrentProducerProfileIdDep,
+                                          request: Request,
+                                          cursor: CursorQuery = None,
+                                          limit: LimitQuery = settings.page_size_default,
+                                          since: SinceQuery = None,
+                                          stream: StreamQuery = False,
+                                          ) -> Response:
+    """Read submission events | Producer side (newest first, paginated, synced since a cursor or streamed as NDJSON)"""
+    try:
+        if since is not None:
+            submission_events, next_cursor = await submission_query_service.sync_producer_submission_events(
+                producer_profile_id, None if since == "0" else since, limit
+            )
+            return RowsJSONResponse(SubmissionEventPublic, submission_events, headers=next_cursor_headers(next_cursor))
+        if wants_ndjson(request, stream):
+            partitions = await submission_query_service.stream_producer_submission_events(producer_profile_id, cursor)
+            return StreamingResponse(ndjson_lines(SubmissionEventPublic, partitions), media_type="application/x-ndjson")
+        submission_events, next_cursor = await submission_query_service.list_producer_submission_events(producer_profile_id, cursor, limit)
+        return RowsJSONResponse(SubmissionEventPublic, submission_events, headers=next_cursor_headers(next_cursor))
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
 @router.get("/workspaces/{workspace_id}/submissions/events", status_code=status.HTTP_200_OK, response_model=list[SubmissionEventPublic])
 async def list_label_submission_events(submission_query_service: SubmissionQueryServiceDep,
                                        workspace_id: UUID,
-                                       membership_service: MembershipServiceDep) -> list[SubmissionEventPublic]:
-    """Read submission events | Label side"""
+                                       membership_service: MembershipServiceDep,
+                                       request: Request,
+                                       cursor: CursorQuery = None,
+                                       limit: LimitQuery = settings.page_size_default,
+                                       since: SinceQuery = None,
+                                       stream: StreamQuery = False,
+                                       ) -> Response:
+    """Read submission events | Label side (newest first, paginated with ETag / If-None-Match,
+    synced since a cursor, or streamed as NDJSON)"""
     try:
         await membership_service.is_member_of_label(workspace_id)
-        submission_events = await submission_query_service.list_label_submission_events(workspace_id)
-        return submission_events
+        if since is not None:
+            submission_events, next_cursor = await submission_query_service.sync_label_submission_events(
+                workspace_id, None if since == "0" else since, limit
+            )
+            return RowsJSONResponse(SubmissionEventPublic, submission_events, headers=next_cursor_headers(next_cursor))
+        if wants_ndjson(request, stream):
+            partitions = await submission_query_service.stream_label_submission_events(workspace_id, cursor)
+            return StreamingResponse(ndjson_lines(SubmissionEventPublic, partitions), media_type="application/x-ndjson")
+        etag = change_etag("w", await submission_query_service.workspace_version(workspace_id))
+        if is_not_modified(request, etag):
+            return not_modified_response(etag)
+        submission_events, next_cursor = await submission_query_service.list_label_submission_events(workspace_id, cursor, limit)
+        return RowsJSONResponse(SubmissionEventPublic, submission_events,
+                                headers={**next_cursor_headers(next_cursor), **etag_headers(etag)})
     except MembershipNotFoundError as e:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.get("/submissions/events/live", status_code=status.HTTP_200_OK, response_class=StreamingResponse)
+async def live_producer_submission_events(submission_query_service: SubmissionQueryServiceDep,
+                                          producer_profile_id: CurrentProducerProfileIdDep,
+                                          read_session_factory: ReadSessionFactoryDep,
+                                          session: SessionDep,
+                                          read_session: ReadSessionDep,
+                                          since: SinceQuery = None,
+                                          last_event_id: LastEventIdHeader = None,
+                                          ) -> StreamingResponse:
+    """Push submission events | Producer side (server-sent events from now on, or after Last-Event-ID / since)"""
+    try:
+        cursor = last_event_id or since
+        if cursor is None:
+            cursor = await submission_query_service.producer_sync_head(producer_profile_id)
+        elif cursor == "0":
+            cursor = SubmissionQueryService.sync_start
+        decode_cursor(cursor, SubmissionQueryService.sync_order)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    # an idle subscriber must not pin pool connections; every sync round opens its own session
+    await session.close()
+    await read_session.close()
+
+    async def sync(cursor: str):
+        async with read_session_factory() as sync_session:
+            return await SubmissionQueryService(sync_session).sync_producer_submission_events(
+                producer_profile_id, cursor, settings.page_size_max
+            )
+
+    return live_events_response("producer", producer_profile_id, cursor, sync)
+
+
+@router.get("/workspaces/{workspace_id}/submissions/events/live", status_code=status.HTTP_200_OK, response_class=StreamingResponse)
+async def live_label_submission_events(submission_query_service: SubmissionQueryServiceDep,
+                                       workspace_id: UUID,
+                                       membership_service: MembershipServiceDep,
+                                       read_session_factory: ReadSessionFactoryDep,
+                                       session: SessionDep,
+                                       read_session: ReadSessionDep,
+                                       since: SinceQuery = None,
+                                       last_event_id: LastEventIdHeader = None,
+                                       ) -> StreamingResponse:
+    """Push submission events | Label side (server-sent events from now on, or after Last-Event-ID / since)"""
+    try:
+        await membership_service.is_member_of_label(workspace_id)
+        cursor = last_event_id or since
+        if cursor is None:
+            cursor = await submission_query_service.label_sync_head(workspace_id)
+        elif cursor == "0":
+            cursor = SubmissionQueryService.sync_start
+        decode_cursor(cursor, SubmissionQueryService.sync_order)
+    except MembershipNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    await session.close()
+    await read_session.close()
+
+    async def sync(cursor: str):
+        async with read_session_factory() as sync_session:
+            return await SubmissionQueryService(sync_session).sync_label_submission_events(
+                workspace_id, cursor, settings.page_size_max
+            )
+
+    return live_events_response("workspace", workspace_id, cursor, sync)
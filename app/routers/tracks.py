@@ -1,10 +1,11 @@
 from uuid import UUID
 
-from fastapi import APIRouter, status, HTTPException, Response
+from fastapi import APIRouter, status, HTTPException, Request, Response
 
-from app.schemas.schemas import TrackCreate, TrackPublic, TrackUpdate
+from app.schemas.schemas import TrackCreate, TrackPublic, TrackUpdate, TrackImportReport
 from app.dependencies import TrackServiceDep
-from app.services.tracks import TrackNotFoundError, TrackForbiddenError
+from app.serialization import RowsJSONResponse
+from app.services.tracks import TrackNotFoundError, TrackForbiddenError, TrackImportFormatError
 
 
 router = APIRouter(tags=["Tracks"])
@@ -17,6 +18,23 @@ async def add_track(track_data: TrackCreate, track_service: TrackServiceDep) ->
     return new_track
 
 
+@router.post("/tracks/import", status_code=status.HTTP_200_OK, response_model=TrackImportReport,
+             openapi_extra={"requestBody": {"required": True, "content": {
+                 "text/csv": {"schema": {"type": "string"}},
+                 "application/x-ndjson": {"schema": {"type": "string"}},
+             }}})
+async def import_tracks(request: Request, track_service: TrackServiceDep) -> TrackImportReport:
+    """Bulk import tracks from a streamed CSV or NDJSON body, with a per-row error report"""
+    content_type = request.headers.get("content-type", "")
+    if not content_type.startswith(("text/csv", "application/x-ndjson", "application/jsonl")):
+        raise HTTPException(status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+                            detail="Send text/csv or application/x-ndjson.")
+    try:
+        return await track_service.import_tracks(request.stream(), content_type)
+    except TrackImportFormatError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
 @router.patch("/tracks/{track_id}", status_code=status.HTTP_200_OK, response_model=TrackPublic)
 async def edit_track(track_data: TrackUpdate, track_id: UUID, track_service: TrackServiceDep) -> TrackPublic:
     """Update track"""
@@ -42,7 +60,7 @@ async def delete_track(track_id: UUID, track_service: TrackServiceDep) -> Respon
 
 
 @router.get("/tracks", status_code=status.HTTP_200_OK, response_model=list[TrackPublic])
-async def list_tracks(track_service: TrackServiceDep) -> list[TrackPublic]:
+async def list_tracks(track_service: TrackServiceDep) -> Response:
     """Read tracks"""
     tracks = await track_service.list_tracks()
-    return tracks
\ No newline at end of file
+    return RowsJSONResponse(TrackPublic, tracks)
\ No newline at end of file
@@ -5,6 +5,7 @@ from fastapi.security import OAuth2PasswordRequestForm
 
 from app.schemas.schemas import UserCreate, UserPrivate, UserPublic, UserUpdate, Token, LabelStaffProfileUpdate, LabelStaffProfilePublic, ProducerProfilePublic, ProducerProfileUpdate
 from app.dependencies import CurrentUserDep, UserServiceDep
+from app.services.auth import HashingBusyError
 from app.services.users import AuthenticationError, PasswordTooWeakError, UserMissingError, UsernameAlreadyTakenError, LabelStaffProfileMissingError, ProducerProfileMissingError
 
 
@@ -21,6 +22,8 @@ async def register(user_data: UserCreate, service: UserServiceDep) -> UserPublic
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except UsernameAlreadyTakenError as e:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except HashingBusyError as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e), headers={"Retry-After": "1"})
 
 
 @router.post("/token", status_code=status.HTTP_200_OK, response_model=Token)
@@ -29,10 +32,12 @@ async def login_user(form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
     """Login"""
     try:
         user = await user_service.authenticate_user(form_data.username, form_data.password)
-        token = user_service.auth_service.generate_access_token(user.id)
+        token = await user_service.create_access_token(user)
         return Token(access_token=token, token_type="bearer")
     except AuthenticationError as e:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(e))
+    except HashingBusyError as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e), headers={"Retry-After": "1"})
     
 
 # ----------------------------- Users ---------------------------------------
@@ -1,7 +1,8 @@
 from uuid import UUID
 from datetime import datetime
+from typing import Literal
 
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, Field, model_validator
 
 from app.models.models import Gender, LabelRole, UserType, Status
 
@@ -119,6 +120,17 @@ class TrackPublic(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class TrackImportRowError(BaseModel):
+    line: int
+    detail: str
+
+
+class TrackImportReport(BaseModel):
+    imported: int
+    failed: int
+    errors: list[TrackImportRowError]
+
+
 class TrackUpdate(BaseModel):
     title: str | None
     streaming_url: str | None
@@ -186,10 +198,69 @@ class SubmissionPublic(BaseModel):
     extra_metadata: dict | None = None
 
     status: Status
+    created_at: datetime
 
     model_config = {"from_attributes": True}
 
 
+class SubmissionQueueFilters(BaseModel):
+    """Label queue query parameters; repeat status/genre to match any of several values."""
+    status: list[Status] | None = None
+    tempo_min: float | None = None
+    tempo_max: float | None = None
+    key: str | None = None
+    genre: list[str] | None = None
+    sort: Literal["newest", "oldest", "tempo_asc", "tempo_desc"] = "newest"
+
+    @model_validator(mode="after")
+    def check_tempo_range(self):
+        if self.tempo_min is not None and self.tempo_max is not None and self.tempo_min > self.tempo_max:
+            raise ValueError("tempo_min must not be greater than tempo_max")
+        return self
+
+
+class SubmissionStatusSummary(BaseModel):
+    """Submission counts per status (every status listed, zeros included)."""
+    counts: dict[Status, int]
+    total: int
+
+
+class ResponseTimesPublic(BaseModel):
+    """Time from submission to first review over the last `window_months` calendar months;
+    percentiles are estimates within 2% (see app.sketch)."""
+    window_months: int
+    reviews: int
+    mean_seconds: float | None = None
+    p50_seconds: float | None = None
+    p90_seconds: float | None = None
+
+
+class SubmissionFanOutCreate(BaseModel):
+    track_id: UUID
+    workspace_ids: list[UUID] = Field(min_length=1, max_length=100)
+
+
+class SubmissionFanOutItem(BaseModel):
+    submission_id: UUID
+    workspace_id: UUID
+
+
+class SubmissionFanOutPublic(BaseModel):
+    submissions: list[SubmissionFanOutItem]
+    unknown_workspace_ids: list[UUID]
+
+
+class BulkTransitionCreate(BaseModel):
+    target_status: Literal[Status.IN_REVIEW, Status.SHORTLISTED, Status.ACCEPTED, Status.REJECTED]
+    submission_ids: list[UUID] = Field(min_length=1, max_length=500)
+
+
+class BulkTransitionResult(BaseModel):
+    submission_id: UUID
+    outcome: Literal["transitioned", "not_allowed", "not_found"]
+    status: Status | None = None
+
+
 # -------------------- SubmissionEvents -----------------------------
 class SubmissionEventPublic(BaseModel):
     id: UUID
@@ -200,4 +271,75 @@ class SubmissionEventPublic(BaseModel):
     producer_profile_id: UUID | None
     labelstaff_profile_id: UUID | None
 
-    model_config = {"from_attributes": True}
\ No newline at end of file
+    model_config = {"from_attributes": True}
+
+# -------------------- Metrics -----------------------------
+class PoolStatsPublic(BaseModel):
+    mode: str
+    connects: int
+    checkouts: int
+    checkins: int
+    timeouts: int
+    acquire_avg_ms: float
+    acquire_max_ms: float
+    size: int | None = None
+    checked_out: int | None = None
+    checked_in: int | None = None
+    overflow: int | None = None
+
+
+class QueryStatsPublic(BaseModel):
+    enabled: bool
+    sample_rate: float
+    sampled_requests: int
+    queries: int
+    db_time_ms: float
+    slow_queries: int
+    n_plus_one_requests: int
+
+
+class CacheStatsPublic(BaseModel):
+    size: int
+    maxsize: int
+    ttl_seconds: float
+    hits: int
+    misses: int
+    evictions: int
+
+
+class PasswordHashStatsPublic(BaseModel):
+    workers: int
+    max_pending: int
+    pending: int
+    completed: int
+    rejected: int
+    hash_avg_ms: float
+    hash_max_ms: float
+    total_avg_ms: float
+
+
+class StartupStatsPublic(BaseModel):
+    ready_ms: float | None = None
+    first_response_ms: float | None = None
+    schema_created: bool
+    warmed_connections: int
+
+
+class PushStatsPublic(BaseModel):
+    listener_connected: bool
+    subscribers: int
+    notifications: int
+    wakeups: int
+    coalesced: int
+    reconnects: int
+
+
+class MetricsPublic(BaseModel):
+    db_pool: PoolStatsPublic
+    db_read_pool: PoolStatsPublic | None = None
+    sql: QueryStatsPublic
+    user_cache: CacheStatsPublic
+    membership_cache: CacheStatsPublic
+    password_hashing: PasswordHashStatsPublic
+    startup: StartupStatsPublic
+    push: PushStatsPublic
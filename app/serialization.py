@@ -0,0 +1,49 @@
+from functools import cache
+from typing import Any, AsyncIterator, Mapping, Sequence, TypedDict
+
+from fastapi import Response, status
+from pydantic import BaseModel, TypeAdapter
+
+
+def public_columns(schema: type[BaseModel], entity: Any) -> list:
+    """The mapped columns behind `schema`'s fields, for column-only selects that skip the identity map."""
+    return [getattr(entity, name) for name in schema.model_fields]
+
+
+@cache
+def _row_type(schema: type[BaseModel]) -> type:
+    """TypedDict mirror of `schema`, so plain rows serialize without building model instances."""
+    return TypedDict(f"{schema.__name__}Row", {name: field.annotation for name, field in schema.model_fields.items()})
+
+
+@cache
+def rows_adapter(schema: type[BaseModel]) -> TypeAdapter:
+    """Cached list serializer for plain rows shaped like `schema`."""
+    return TypeAdapter(list[_row_type(schema)])
+
+
+@cache
+def row_adapter(schema: type[BaseModel]) -> TypeAdapter:
+    """Cached single-row serializer for rows shaped like `schema`."""
+    return TypeAdapter(_row_type(schema))
+
+
+class RowsJSONResponse(Response):
+    """JSON array of result rows, serialized in one pass by pydantic-core straight to bytes.
+
+    Endpoints still declare response_model for the OpenAPI schema; FastAPI skips
+    re-validating it when a Response is returned.
+    """
+    media_type = "application/json"
+
+    def __init__(self, schema: type[BaseModel], rows: Sequence, status_code: int = status.HTTP_200_OK,
+                 headers: Mapping[str, str] | None = None):
+        body = rows_adapter(schema).dump_json([row._asdict() for row in rows])
+        super().__init__(content=body, status_code=status_code, headers=headers)
+
+
+async def ndjson_lines(schema: type[BaseModel], partitions: AsyncIterator[Sequence]) -> AsyncIterator[bytes]:
+    """One JSON document per row, one chunk per partition, so memory stays bounded by a partition."""
+    adapter = row_adapter(schema)
+    async for rows in partitions:
+        yield b"".join(adapter.dump_json(row._asdict()) + b"\n" for row in rows)
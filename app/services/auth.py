@@ -1,3 +1,6 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
 from uuid import UUID
 from datetime import timedelta, timezone, datetime
 
@@ -15,6 +18,73 @@ class InvalidTokenError(Exception):
     pass
 
 
+class HashingBusyError(Exception):
+    """Raise when the password hashing queue is full."""
+    pass
+
+
+class PasswordHashExecutor:
+    """Runs Argon2 off the event loop on a small thread pool with admission control.
+
+    argon2-cffi releases the GIL while hashing, so worker threads don't stall the
+    loop. Calls beyond max_pending (running + queued) are rejected immediately
+    instead of piling up behind a burst of logins.
+    """
+
+    def __init__(self, workers: int, max_pending: int):
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="argon2")
+        self.workers = workers
+        self.max_pending = max_pending
+        self.pending = 0
+        self.completed = 0
+        self.rejected = 0
+        self.hash_total_s = 0.0
+        self.hash_max_s = 0.0
+        self.wait_total_s = 0.0
+
+
+    def _timed(self, fn, *args):
+        start = time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            elapsed = time.perf_counter() - start
+            self.hash_total_s += elapsed
+            self.hash_max_s = max(self.hash_max_s, elapsed)
+
+
+    async def run(self, fn, *args):
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            raise HashingBusyError("Too many concurrent sign-ins, try again shortly.")
+
+        self.pending += 1
+        start = time.perf_counter()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, self._timed, fn, *args)
+        finally:
+            self.pending -= 1
+            self.completed += 1
+            self.wait_total_s += time.perf_counter() - start
+
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            "pending": self.pending,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "hash_avg_ms": (self.hash_total_s / self.completed * 1000) if self.completed else 0.0,
+            "hash_max_ms": self.hash_max_s * 1000,
+            "total_avg_ms": (self.wait_total_s / self.completed * 1000) if self.completed else 0.0,
+        }
+
+
+password_hash_executor = PasswordHashExecutor(workers=settings.password_hash_workers,
+                                              max_pending=settings.password_hash_max_pending)
+
+
 class AuthService:
     def __init__(self):
         self.ph = PasswordHasher()
@@ -23,18 +93,24 @@ class AuthService:
         self.access_token_expire_days = 3
 
 
-    def hash_password(self, password: str) -> str:
-        return self.ph.hash(password)
+    async def hash_password(self, password: str) -> str:
+        return await password_hash_executor.run(self.ph.hash, password)
     
 
-    def verify_password(self, plain_password: str, hashed_password: str) -> bool:
+    async def verify_password(self, plain_password: str, hashed_password: str) -> bool:
+        return await password_hash_executor.run(self._verify_password, plain_password, hashed_password)
+
+
+    def _verify_password(self, plain_password: str, hashed_password: str) -> bool:
         try:
             return self.ph.verify(hash=hashed_password, password=plain_password)
         except VerifyMismatchError:
             return False
     
 
-    def generate_access_token(self, user_id: UUID) -> str:
+    def generate_access_token(self, user_id: UUID, user_type: str | None = None, profile_id: UUID | None = None) -> str:
+        """user_type and profile_id are immutable, so they can ride along as signed claims
+        ("utype", "pid") and spare profile-scoped endpoints a database lookup."""
         now = datetime.now(timezone.utc)
         expire = now + timedelta(days=self.access_token_expire_days)
 
@@ -43,6 +119,9 @@ class AuthService:
             "iat": now,
             "exp": expire,
         }
+        if user_type and profile_id:
+            payload["utype"] = user_type
+            payload["pid"] = str(profile_id)
 
         return jwt.encode(payload=payload, key=self.secret_key, algorithm=self.algorithm)
 
@@ -51,6 +130,8 @@ class AuthService:
         try:
             payload: dict = jwt.decode(jwt=token, key=self.secret_key, algorithms=[self.algorithm])
             payload["sub"] = UUID(payload.get("sub"))
+            if "pid" in payload:
+                payload["pid"] = UUID(payload["pid"])
             return payload
         except (jwt.exceptions.PyJWTError, ValueError, TypeError):
             raise InvalidTokenError
\ No newline at end of file
@@ -3,8 +3,39 @@ from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import delete, select
 
-from app.models.models import LabelStaffProfile, Membership
+from app.models.models import LabelStaffProfile, Membership, LabelRole
 from app.schemas.schemas import MembershipCreate
+from app.cache import TTLCache
+from app.settings import settings
+
+
+# (labelstaff_profile_id, workspace_id) -> LabelRole, or NOT_A_MEMBER for cached negatives
+membership_cache = TTLCache(maxsize=settings.membership_cache_size, ttl=settings.membership_cache_ttl_seconds)
+NOT_A_MEMBER = "not_a_member"
+
+
+async def get_member_role(session: AsyncSession, labelstaff_profile_id: UUID, workspace_id: UUID) -> LabelRole | None:
+    """Role of the labelstaff profile in the workspace (None if not a member), behind membership_cache."""
+    key = (labelstaff_profile_id, workspace_id)
+    cached = membership_cache.get(key)
+    if cached is not None:
+        return None if cached == NOT_A_MEMBER else cached
+
+    result = await session.execute(select(Membership.role).where(
+        Membership.labelstaff_profile_id == labelstaff_profile_id,
+        Membership.workspace_id == workspace_id
+    ))
+    role = result.scalar_one_or_none()
+
+    if role is None:
+        membership_cache.set(key, NOT_A_MEMBER, ttl=settings.membership_cache_negative_ttl_seconds)
+    else:
+        membership_cache.set(key, role)
+    return role
+
+
+def invalidate_workspace_memberships(workspace_id: UUID) -> None:
+    membership_cache.invalidate_where(lambda key: key[1] == workspace_id)
 
 
 class MembershipNotFoundError(Exception):
@@ -29,17 +60,12 @@ class MembershipService:
 
 
     async def _ensure_admin(self, workspace_id: UUID) -> None:
-        result = await self.session.execute(select(Membership).where(
-            Membership.labelstaff_profile_id == self.labelstaff_profile_id,
-            Membership.workspace_id == workspace_id
-        ))
-
-        membership = result.scalar_one_or_none()
+        role = await get_member_role(self.session, self.labelstaff_profile_id, workspace_id)
 
-        if not membership:
+        if not role:
             raise MembershipForbiddenError("Only label admins can edit memberships.")
         
-        if membership.role != "admin":
+        if role != "admin":
             raise MembershipForbiddenError("Only label admins can edit memberships.")
 
 
@@ -56,6 +82,7 @@ class MembershipService:
                                 workspace_id=workspace_id)
         self.session.add(new_member)
         await self.session.commit()
+        membership_cache.invalidate((labelstaff_profile_id, workspace_id))
         await self.session.refresh(new_member)
 
         return new_member
@@ -83,25 +110,21 @@ class MembershipService:
             )
         )
         await self.session.commit()
+        membership_cache.invalidate((labelstaff_profile_id, workspace_id))
 
     
     async def is_member_of_label(self, workspace_id: UUID) -> None:
-        result = await self.session.execute(select(Membership).where(
-            Membership.labelstaff_profile_id == self.labelstaff_profile_id,
-            Membership.workspace_id == workspace_id
-        ))
-        member = result.scalar_one_or_none()
+        role = await get_member_role(self.session, self.labelstaff_profile_id, workspace_id)
 
-        if not member:
+        if not role:
             raise MembershipNotFoundError("Membership not found.")
     
 
     async def get_membership(self, workspace_id: UUID) -> Membership | None:
-        result = await self.session.execute(select(Membership).where(
-            Membership.labelstaff_profile_id == self.labelstaff_profile_id,
-            Membership.workspace_id == workspace_id
-        ))
-        return result.scalar_one_or_none()
+        role = await get_member_role(self.session, self.labelstaff_profile_id, workspace_id)
+        if not role:
+            return None
+        return Membership(labelstaff_profile_id=self.labelstaff_profile_id, workspace_id=workspace_id, role=role)
 
 
     async def list_memberships(self, workspace_id: UUID) -> list[Membership]:
@@ -1,10 +1,20 @@
+import re
+from typing import AsyncIterator, Sequence
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import Date, Float, and_, cast, extract, func, insert, literal, literal_column, select, text, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import aliased
 
-from app.models.models import Submission, Status, SubmissionEvent
-from app.schemas.schemas import SubmissionCreate
+from app.models.models import (COUNTERS_PENDING_COMMENT, ProducerProfile, ProducerStatusCount, ReviewLatencyBucket,
+                               Submission, Status, SubmissionEvent, Track, Workspace, WorkspaceStatusCount)
+from app.pagination import encode_cursor, keyset_after, keyset_page, keyset_paginate
+from app.schemas.schemas import SubmissionCreate, SubmissionEventPublic, SubmissionPublic, SubmissionQueueFilters
+from app.serialization import public_columns
+from app.settings import settings
+from app.sketch import bucket_expression, quantile
 
 
 class SubmissionNotFoundError(Exception):
@@ -22,39 +32,264 @@ class ActorNotUniqueError(Exception):
     pass
 
 
+class SourceTrackNotFoundError(Exception):
+    """Raise when the track to submit doesn't exist or belongs to another producer."""
+    pass
+
+
 class SubmissionQueryService:
+    """Read-only queries; the session may be bound to the read replica.
+
+    Lists are keyset-paginated, newest first: submissions on (created_at, id), events
+    on (event_date, id). Each method returns the page and the cursor of the next one
+    (None on the last page); composite indexes on the scoping column plus the sort
+    key keep every page an index range scan.
+
+    Pages are plain row tuples of the public columns (no ORM entities, nothing kept in
+    the identity map), meant for RowsJSONResponse.
+    """
+    submission_columns = public_columns(SubmissionPublic, Submission)
+    event_columns = public_columns(SubmissionEventPublic, SubmissionEvent)
+    submission_order = (Submission.created_at, Submission.id)
+    stale_order = (Submission.last_transition_at, Submission.id)
+    event_order = (SubmissionEvent.event_date, SubmissionEvent.id)
+    sync_order = (SubmissionEvent.txid, SubmissionEvent.id)
+    sync_horizon = SubmissionEvent.txid < literal_column("pg_snapshot_xmin(pg_current_snapshot())::text::bigint")
+    sync_start = encode_cursor([0, UUID(int=0)])
+    # label queue sort -> (keyset columns, descending)
+    queue_sorts = {
+        "newest": (submission_order, True),
+        "oldest": (submission_order, False),
+        "tempo_asc": ((Submission.tempo, Submission.id), False),
+        "tempo_desc": ((Submission.tempo, Submission.id), True),
+    }
+
+
     def __init__(self, session: AsyncSession):
         self.session = session
 
 
-    async def list_producer_submissions(self, producer_profile_id: UUID) -> list[Submission]:
-        result = await self.session.execute(select(Submission).where(Submission.producer_profile_id == producer_profile_id))
-        submissions = result.scalars().all()
+    async def _events_version(self, key_column, key_id: UUID) -> str:
+        """Change watermark of the submissions under one key, read from its events (every
+        create and transition writes one): the newest event's txid (a backward scan of the
+        (key, txid, id) index), plus the transactions still in flight below it, whose events
+        will appear without raising that maximum. Nothing is written to keep it, so writers
+        in the same workspace don't queue on a shared row.
+        """
+        newest = await self.session.scalar(
+            select(SubmissionEvent.txid).where(key_column == key_id).order_by(SubmissionEvent.txid.desc()).limit(1)
+        )
+        if newest is None:
+            return "0"
+        in_flight = await self.session.scalar(text(
+            "SELECT string_agg(xip::text, '-' ORDER BY xip) FROM pg_snapshot_xip(pg_current_snapshot()) AS xip "
+            "WHERE xip < CAST(CAST(:txid AS text) AS xid8)"
+        ), {"txid": newest})
+        return f"{newest}-{in_flight}" if in_flight else str(newest)
 
-        return submissions
 
+    async def workspace_version(self, workspace_id: UUID) -> str:
+        """Change watermark of a workspace's submissions and events."""
+        return await self._events_version(SubmissionEvent.workspace_id, workspace_id)
 
-    async def list_label_submissions(self, workspace_id: UUID) -> list[Submission]:
-        result = await self.session.execute(select(Submission).where(Submission.workspace_id == workspace_id))
-        submissions = result.scalars().all()
 
-        return submissions
-    
-    
-    async def list_producer_submission_events(self, producer_profile_id: UUID) -> list[SubmissionEvent]:
+    async def producer_version(self, producer_profile_id: UUID) -> str:
+        """Change watermark of a producer's submissions."""
+        return await self._events_version(SubmissionEvent.owner_producer_profile_id, producer_profile_id)
+
+
+    async def _status_summary(self, counter, key_column, key_id: UUID) -> dict:
+        """Submission counts per status from the maintained counters: one index range
+        of at most len(Status) rows, however many submissions there are."""
+        result = await self.session.execute(select(counter.status, counter.count).where(key_column == key_id))
+        counts = {status: 0 for status in Status}
+        counts.update(result.tuples().all())
+        return {"counts": counts, "total": sum(counts.values())}
+
+
+    async def label_status_summary(self, workspace_id: UUID) -> dict:
+        return await self._status_summary(WorkspaceStatusCount, WorkspaceStatusCount.workspace_id, workspace_id)
+
+
+    async def producer_status_summary(self, producer_profile_id: UUID) -> dict:
+        return await self._status_summary(ProducerStatusCount, ProducerStatusCount.producer_profile_id, producer_profile_id)
+
+
+    async def label_response_times(self, workspace_id: UUID) -> dict:
+        """Time to first review over the last settings.response_time_window_months calendar
+        months, merged from the monthly sketch buckets (at most a few hundred rows per month)."""
+        window_start = cast(func.date_trunc("month", func.now())
+                            - func.make_interval(0, settings.response_time_window_months - 1), Date)
         result = await self.session.execute(
-            select(SubmissionEvent)
-            .join(Submission, SubmissionEvent.submission_id == Submission.id)
-            .where(Submission.producer_profile_id == producer_profile_id)
+            select(ReviewLatencyBucket.bucket, func.sum(ReviewLatencyBucket.reviews),
+                   func.sum(ReviewLatencyBucket.latency_seconds))
+            .where(ReviewLatencyBucket.workspace_id == workspace_id, ReviewLatencyBucket.period_start >= window_start)
+            .group_by(ReviewLatencyBucket.bucket)
         )
-        return result.scalars().all()
+        counts, total_seconds = {}, 0.0
+        for bucket, reviews, latency_seconds in result.tuples():
+            counts[bucket] = reviews
+            total_seconds += latency_seconds
+        reviews = sum(counts.values())
+        return {
+            "window_months": settings.response_time_window_months,
+            "reviews": reviews,
+            "mean_seconds": total_seconds / reviews if reviews else None,
+            "p50_seconds": quantile(counts, 0.5),
+            "p90_seconds": quantile(counts, 0.9),
+        }
+
+
+    def stale_query(self, workspace_id: UUID, older_than_days: int):
+        """PENDING for more than `older_than_days`: one range of the
+        (workspace_id, status, last_transition_at, id) index."""
+        return (
+            select(*self.submission_columns)
+            .add_columns(Submission.last_transition_at)
+            .where(Submission.workspace_id == workspace_id,
+                   Submission.status == Status.PENDING,
+                   Submission.last_transition_at < func.now() - func.make_interval(0, 0, 0, older_than_days))
+        )
+
+
+    async def list_stale_label_submissions(self, workspace_id: UUID, older_than_days: int,
+                                           cursor: str | None, limit: int) -> tuple[list[Row], str | None]:
+        """Longest waiting first."""
+        return await self._page(self.stale_query(workspace_id, older_than_days), self.stale_order, cursor, limit,
+                                descending=False)
+
+
+    async def _page(self, stmt, columns, cursor: str | None, limit: int,
+                    descending: bool = True) -> tuple[list, str | None]:
+        result = await self.session.execute(keyset_paginate(stmt, columns, cursor, limit, descending))
+        return keyset_page(result.all(), columns, limit)
 
 
-    async def list_label_submission_events(self, workspace_id: UUID) -> list[SubmissionEvent]:
-        result = await self.session.execute(select(SubmissionEvent).where(SubmissionEvent.workspace_id == workspace_id))
-        submission_events = result.scalars().all()
+    async def _stream(self, stmt, columns, cursor: str | None) -> AsyncIterator[Sequence[Row]]:
+        """Whole result after `cursor` from a server-side cursor, in partitions of
+        settings.stream_batch_size rows. The query runs (and the cursor is validated)
+        before this returns; rows are fetched as the partitions are consumed."""
+        stmt = keyset_after(stmt, columns, cursor).execution_options(yield_per=settings.stream_batch_size)
+        result = await self.session.stream(stmt)
+        return result.partitions()
 
-        return submission_events
+
+    def label_queue_query(self, workspace_id: UUID, filters: SubmissionQueueFilters):
+        """Filtered label queue statement (before pagination); each filter maps onto a workspace-scoped index."""
+        stmt = select(*self.submission_columns).where(Submission.workspace_id == workspace_id)
+        if filters.status:
+            stmt = stmt.where(Submission.status.in_(filters.status))
+        if filters.tempo_min is not None:
+            stmt = stmt.where(Submission.tempo >= filters.tempo_min)
+        if filters.tempo_max is not None:
+            stmt = stmt.where(Submission.tempo <= filters.tempo_max)
+        if filters.key:
+            stmt = stmt.where(Submission.key == filters.key)
+        if filters.genre:
+            stmt = stmt.where(Submission.genre.overlap(cast(filters.genre, Submission.genre.type)))
+        return stmt
+
+
+    async def list_producer_submissions(self, producer_profile_id: UUID,
+                                        cursor: str | None, limit: int) -> tuple[list[Row], str | None]:
+        return await self._page(select(*self.submission_columns).where(Submission.producer_profile_id == producer_profile_id),
+                                self.submission_order, cursor, limit)
+
+
+    async def list_label_submissions(self, workspace_id: UUID, filters: SubmissionQueueFilters,
+                                     cursor: str | None, limit: int) -> tuple[list[Row], str | None]:
+        columns, descending = self.queue_sorts[filters.sort]
+        return await self._page(self.label_queue_query(workspace_id, filters), columns, cursor, limit, descending)
+    
+    
+    async def search_label_submissions(self, workspace_id: UUID, query: str,
+                                       cursor: str | None, limit: int) -> tuple[list[Row], str | None]:
+        """Full-text search over title, genre and selected extra_metadata keys, best match first.
+
+        Every word is matched as a prefix (typeahead: "deep ho voc" finds "deep house ... vocal"),
+        all words must match. Title hits rank above genre hits above metadata hits.
+        Paginated on (rank, id).
+        """
+        terms = re.findall(r"\w+", query.lower())
+        if not terms:
+            return [], None
+
+        tsquery = func.to_tsquery(literal_column("'simple'::regconfig"), " & ".join(f"{term}:*" for term in terms))
+        rank = func.ts_rank(Submission.search_vector, tsquery, type_=Float).label("rank")
+        stmt = (select(*self.submission_columns, rank)
+                .where(Submission.workspace_id == workspace_id, Submission.search_vector.bool_op("@@")(tsquery)))
+        return await self._page(stmt, (rank, Submission.id), cursor, limit)
+
+
+    def _producer_events_query(self, producer_profile_id: UUID):
+        return select(*self.event_columns).where(SubmissionEvent.owner_producer_profile_id == producer_profile_id)
+
+
+    def _label_events_query(self, workspace_id: UUID):
+        return select(*self.event_columns).where(SubmissionEvent.workspace_id == workspace_id)
+
+
+    async def _sync(self, stmt, since: str | None, limit: int) -> tuple[list[Row], str]:
+        """Events committed after `since` (None: from the beginning), oldest first, plus the
+        cursor to sync from next time (returned even when nothing is new).
+
+        Ordered by the inserting transaction id, and only up to the oldest transaction
+        still in progress (pg_snapshot_xmin): event_date is the transaction start time
+        and ids are random, so neither can tell whether an older, slower transaction
+        will still commit rows behind a cursor. Below xmin nothing new can appear, so
+        a client that follows the cursor never misses an event.
+        """
+        stmt = stmt.add_columns(SubmissionEvent.txid).where(self.sync_horizon)
+        rows, next_cursor = await self._page(stmt, self.sync_order, since, limit, descending=False)
+        if next_cursor is None and rows:
+            next_cursor = encode_cursor([getattr(rows[-1], column.key) for column in self.sync_order])
+        return rows, next_cursor or since or self.sync_start
+
+
+    async def _sync_head(self, stmt) -> str:
+        """Sync cursor meaning "from now on": the newest event already below the horizon."""
+        stmt = stmt.add_columns(SubmissionEvent.txid).where(self.sync_horizon)
+        result = await self.session.execute(keyset_after(stmt, self.sync_order, None).limit(1))
+        row = result.first()
+        return encode_cursor([getattr(row, column.key) for column in self.sync_order]) if row else self.sync_start
+
+
+    async def list_producer_submission_events(self, producer_profile_id: UUID,
+                                              cursor: str | None, limit: int) -> tuple[list[Row], str | None]:
+        return await self._page(self._producer_events_query(producer_profile_id), self.event_order, cursor, limit)
+
+
+    async def list_label_submission_events(self, workspace_id: UUID,
+                                           cursor: str | None, limit: int) -> tuple[list[Row], str | None]:
+        return await self._page(self._label_events_query(workspace_id), self.event_order, cursor, limit)
+
+
+    async def sync_producer_submission_events(self, producer_profile_id: UUID,
+                                              since: str | None, limit: int) -> tuple[list[Row], str]:
+        return await self._sync(self._producer_events_query(producer_profile_id), since, limit)
+
+
+    async def sync_label_submission_events(self, workspace_id: UUID,
+                                           since: str | None, limit: int) -> tuple[list[Row], str]:
+        return await self._sync(self._label_events_query(workspace_id), since, limit)
+
+
+    async def producer_sync_head(self, producer_profile_id: UUID) -> str:
+        return await self._sync_head(self._producer_events_query(producer_profile_id))
+
+
+    async def label_sync_head(self, workspace_id: UUID) -> str:
+        return await self._sync_head(self._label_events_query(workspace_id))
+
+
+    async def stream_producer_submission_events(self, producer_profile_id: UUID,
+                                                cursor: str | None) -> AsyncIterator[Sequence[Row]]:
+        return await self._stream(self._producer_events_query(producer_profile_id), self.event_order, cursor)
+
+
+    async def stream_label_submission_events(self, workspace_id: UUID,
+                                             cursor: str | None) -> AsyncIterator[Sequence[Row]]:
+        return await self._stream(self._label_events_query(workspace_id), self.event_order, cursor)
     
 
 class SubmissionWorkflowService:
@@ -66,6 +301,7 @@ class SubmissionWorkflowService:
         Status.ACCEPTED: {},
         Status.REJECTED: {},
     }
+    label_target_statuses = {Status.IN_REVIEW, Status.SHORTLISTED, Status.ACCEPTED, Status.REJECTED}
 
 
     def __init__(self, session: AsyncSession):
@@ -79,51 +315,163 @@ class SubmissionWorkflowService:
             return False
         
     
-    async def _execute_transition(self, submission_id: UUID,
-                                  target_status: Status,
-                                  producer_profile_id: UUID | None = None,
-                                  workspace_id: UUID | None = None,
-                                  labelstaff_profile_id: UUID | None = None
-                                  ) -> Submission:
-        stmt = select(Submission).where(Submission.id == submission_id)
+    def _source_statuses(self, target_status: Status) -> list[Status]:
+        """Statuses from which target_status may be reached (inverse of allowed_transitions)."""
+        return [from_status for from_status, targets in self.allowed_transitions.items() if target_status in targets]
+
 
+    def _scope(self, stmt, workspace_id: UUID | None, producer_profile_id: UUID | None):
         if workspace_id:
             stmt = stmt.where(Submission.workspace_id == workspace_id)
         if producer_profile_id:
             stmt = stmt.where(Submission.producer_profile_id == producer_profile_id)
+        return stmt
+
+
+    def _transition_ctes(self, selector, target_status: Status,
+                         workspace_id: UUID | None,
+                         producer_profile_id: UUID | None,
+                         labelstaff_profile_id: UUID | None):
+        """UPDATE ... RETURNING of the selected submissions that may legally move to
+        target_status, plus the side-effect CTEs: one SubmissionEvent per updated row (and
+        the review latency sketch update when entering IN_REVIEW)."""
+        values = {"status": target_status, "last_transition_at": func.now()}
+        if target_status == Status.IN_REVIEW:
+            values["first_reviewed_at"] = func.coalesce(Submission.first_reviewed_at, func.now())
+        legal = (selector, Submission.status.in_(self._source_statuses(target_status)))
+        # rows are locked in id order, so overlapping bulk transitions can't deadlock;
+        # the UPDATE re-checks the status of rows that changed while we waited
+        locked = self._scope(select(Submission.id).where(*legal), workspace_id, producer_profile_id)
+        updated = self._scope(
+            update(Submission)
+            .where(Submission.id.in_(locked.order_by(Submission.id).with_for_update()), *legal),
+            workspace_id, producer_profile_id
+        ).values(**values).returning(*Submission.__table__.c).cte("updated")
+
+        event_table = SubmissionEvent.__table__
+        inserted_event = insert(SubmissionEvent).from_select(
+            ["id", "status", "submission_id", "workspace_id", "owner_producer_profile_id",
+             "producer_profile_id", "labelstaff_profile_id"],
+            select(func.gen_random_uuid(),
+                   cast(literal(target_status, event_table.c.status.type), event_table.c.status.type),
+                   updated.c.id,
+                   updated.c.workspace_id,
+                   updated.c.producer_profile_id,
+                   literal(producer_profile_id, event_table.c.producer_profile_id.type),
+                   literal(labelstaff_profile_id, event_table.c.labelstaff_profile_id.type))
+        ).cte("inserted_event")
+
+        side_effects = (inserted_event,)
+        if target_status == Status.IN_REVIEW:
+            side_effects += (self._review_latency_upsert(updated).cte("recorded_latency"),)
+        return updated, side_effects
+
+
+    def _review_latency_upsert(self, reviewed):
+        """Add the PENDING -> IN_REVIEW latencies of the `reviewed` rows (IN_REVIEW is only
+        reachable from PENDING, so these are first reviews) to this month's sketch buckets."""
+        latency = extract("epoch", func.now() - reviewed.c.created_at)
+        bucket = bucket_expression(latency)
+        period_start = cast(func.date_trunc("month", func.now()), Date)
+        stmt = pg_insert(ReviewLatencyBucket).from_select(
+            ["workspace_id", "period_start", "bucket", "reviews", "latency_seconds"],
+            select(reviewed.c.workspace_id, period_start, bucket, func.count(), func.sum(latency))
+            .group_by(reviewed.c.workspace_id, bucket)
+            .order_by(reviewed.c.workspace_id, bucket)
+        )
+        return stmt.on_conflict_do_update(
+            index_elements=["workspace_id", "period_start", "bucket"],
+            set_={"reviews": ReviewLatencyBucket.reviews + stmt.excluded.reviews,
+                  "latency_seconds": ReviewLatencyBucket.latency_seconds + stmt.excluded.latency_seconds},
+        )
 
-        stmt = stmt.with_for_update()
-
-        result = await self.session.execute(stmt)
-        submission = result.scalar_one_or_none()
-
-        if not submission:
-            raise SubmissionNotFoundError("Could not find submission.")
-        
-        allowed = self.allowed_transitions.get(submission.status, set())
-        if target_status not in allowed:
-            raise TransitionNotAllowedError(f"Cannot transition from {submission.status} to {target_status}")
 
+    async def _execute_transition(self, submission_id: UUID,
+                                  target_status: Status,
+                                  producer_profile_id: UUID | None = None,
+                                  workspace_id: UUID | None = None,
+                                  labelstaff_profile_id: UUID | None = None
+                                  ) -> Submission:
+        """Check, update and log a transition in one statement.
+
+        A conditional UPDATE ... RETURNING (status must be a legal source state)
+        feeds the SubmissionEvent INSERT through a CTE, so the row lock lives only
+        for that statement plus the commit. Concurrent callers re-check the status
+        after the first one commits, so a submission can't transition twice.
+        Only when nothing was updated do we look the row up again to report
+        not-found vs illegal-transition.
+        """
         if bool(producer_profile_id) == bool(labelstaff_profile_id):
             raise ActorNotUniqueError("Exactly one actor must be provided")
 
-        submission.status = target_status
-        await self.session.flush()
+        updated, side_effects = self._transition_ctes(
+            Submission.id == submission_id, target_status, workspace_id, producer_profile_id, labelstaff_profile_id
+        )
 
-        event = SubmissionEvent(
-                status=target_status,
-                submission_id=submission.id,
-                workspace_id=submission.workspace_id,
-                producer_profile_id=producer_profile_id,
-                labelstaff_profile_id=labelstaff_profile_id
+        updated_submission = aliased(Submission, updated)
+        result = await self.session.execute(
+            select(updated_submission).add_cte(*side_effects),
+            execution_options={"populate_existing": True},
         )
-        self.session.add(event)
+        submission = result.scalar_one_or_none()
+
+        if not submission:
+            current = await self.session.execute(
+                self._scope(select(Submission.status).where(Submission.id == submission_id),
+                            workspace_id, producer_profile_id)
+            )
+            current_status = current.scalar_one_or_none()
+            if current_status is None:
+                raise SubmissionNotFoundError("Could not find submission.")
+            raise TransitionNotAllowedError(f"Cannot transition from {current_status} to {target_status}")
 
         await self.session.commit()
-        await self.session.refresh(submission)
         return submission
     
 
+    async def bulk_transition(self, submission_ids: list[UUID],
+                              target_status: Status,
+                              workspace_id: UUID,
+                              labelstaff_profile_id: UUID) -> list[dict]:
+        """Move many submissions of one workspace to target_status in one transaction.
+
+        The legality check, status update and event inserts happen in one set-based
+        statement, committed at once; a second query classifies the ids that didn't move. Returns one
+        outcome per distinct id, in request order: transitioned, not_allowed (with the
+        current status) or not_found.
+        """
+        if target_status not in self.label_target_statuses:
+            raise TransitionNotAllowedError(f"Labels cannot transition submissions to {target_status}")
+
+        submission_ids = list(dict.fromkeys(submission_ids))
+        updated, side_effects = self._transition_ctes(
+            Submission.id.in_(submission_ids), target_status, workspace_id, None, labelstaff_profile_id
+        )
+        result = await self.session.execute(select(updated.c.id).add_cte(*side_effects))
+        transitioned = set(result.scalars().all())
+        # commit right away: the status counters the statement updated stay locked until then
+        await self.session.commit()
+
+        untouched = [submission_id for submission_id in submission_ids if submission_id not in transitioned]
+        current_statuses = {}
+        if untouched:
+            current = await self.session.execute(
+                select(Submission.id, Submission.status)
+                .where(Submission.id.in_(untouched), Submission.workspace_id == workspace_id)
+            )
+            current_statuses = dict(current.tuples().all())
+
+        outcomes = []
+        for submission_id in submission_ids:
+            if submission_id in transitioned:
+                outcomes.append({"submission_id": submission_id, "outcome": "transitioned", "status": target_status})
+            elif submission_id in current_statuses:
+                outcomes.append({"submission_id": submission_id, "outcome": "not_allowed", "status": current_statuses[submission_id]})
+            else:
+                outcomes.append({"submission_id": submission_id, "outcome": "not_found", "status": None})
+        return outcomes
+
+
     async def create_submission(self, submission_data: SubmissionCreate, 
                                 producer_profile_id: UUID,) -> Submission:
         new_submission = Submission(producer_profile_id=producer_profile_id,
@@ -137,11 +485,81 @@ class SubmissionWorkflowService:
                                     status=Status.PENDING)
         
         self.session.add(new_submission)
+        await self.session.flush()
+        self.session.add(SubmissionEvent(status=Status.PENDING,
+                                         submission_id=new_submission.id,
+                                         workspace_id=new_submission.workspace_id,
+                                         owner_producer_profile_id=producer_profile_id,
+                                         producer_profile_id=producer_profile_id))
         await self.session.commit()
         await self.session.refresh(new_submission)
         return new_submission
 
 
+    async def fan_out_track(self, track_id: UUID, workspace_ids: list[UUID], producer_profile_id: UUID) -> dict:
+        """Submit one of the producer's tracks to many workspaces in a single statement.
+
+        INSERT ... SELECT snapshots the Track row into one PENDING Submission per
+        existing workspace, and a chained CTE writes the matching PENDING events.
+        Unknown workspace ids are skipped and reported back.
+        """
+        workspace_ids = list(dict.fromkeys(workspace_ids))
+        submission_table = Submission.__table__
+        event_table = SubmissionEvent.__table__
+
+        snapshot = (
+            select(func.gen_random_uuid(),
+                   Track.producer_profile_id,
+                   Workspace.id,
+                   Track.title,
+                   Track.streaming_url,
+                   Track.tempo,
+                   Track.genre,
+                   Track.key,
+                   Track.extra_metadata,
+                   cast(literal(Status.PENDING, submission_table.c.status.type), submission_table.c.status.type))
+            .select_from(Track)
+            .join(Workspace, Workspace.id.in_(workspace_ids))
+            .where(Track.id == track_id, Track.producer_profile_id == producer_profile_id)
+        )
+        inserted = insert(Submission).from_select(
+            ["id", "producer_profile_id", "workspace_id", "title", "streaming_url",
+             "tempo", "genre", "key", "extra_metadata", "status"],
+            snapshot
+        ).returning(Submission.id, Submission.workspace_id).cte("inserted")
+
+        inserted_events = insert(SubmissionEvent).from_select(
+            ["id", "status", "submission_id", "workspace_id", "owner_producer_profile_id", "producer_profile_id"],
+            select(func.gen_random_uuid(),
+                   cast(literal(Status.PENDING, event_table.c.status.type), event_table.c.status.type),
+                   inserted.c.id,
+                   inserted.c.workspace_id,
+                   literal(producer_profile_id, event_table.c.owner_producer_profile_id.type),
+                   literal(producer_profile_id, event_table.c.producer_profile_id.type))
+        ).cte("inserted_events")
+
+        result = await self.session.execute(
+            select(inserted.c.id, inserted.c.workspace_id).add_cte(inserted_events)
+        )
+        created = result.all()
+
+        if not created:
+            track = await self.session.execute(
+                select(Track.id).where(Track.id == track_id, Track.producer_profile_id == producer_profile_id)
+            )
+            if track.scalar_one_or_none() is None:
+                raise SourceTrackNotFoundError("Track not found.")
+
+        await self.session.commit()
+
+        created_workspaces = {workspace_id for _, workspace_id in created}
+        return {
+            "submissions": [{"submission_id": submission_id, "workspace_id": workspace_id}
+                            for submission_id, workspace_id in created],
+            "unknown_workspace_ids": [workspace_id for workspace_id in workspace_ids if workspace_id not in created_workspaces],
+        }
+
+
     async def withdraw(self, submission_id: UUID, producer_profile_id: UUID) -> Submission:
         return await self._execute_transition(
             submission_id=submission_id, target_status=Status.WITHDRAWN, producer_profile_id=producer_profile_id
@@ -169,4 +587,96 @@ class SubmissionWorkflowService:
     async def reject(self, submission_id: UUID, workspace_id: UUID, labelstaff_profile_id: UUID) -> Submission:
         return await self._execute_transition(
             submission_id=submission_id, target_status=Status.REJECTED, workspace_id=workspace_id, labelstaff_profile_id=labelstaff_profile_id
-        )
\ No newline at end of file
+        )
+
+
+class SubmissionCounterService:
+    """Repairs drift between the status counters and the submissions they count.
+
+    The counters are maintained by a trigger in the writing transaction, so they only
+    drift through writes that bypass it (manual fixes, restores, rows that predate the
+    counter tables). Keys are reconciled in chunks, one short transaction each.
+    """
+    counters = (
+        (WorkspaceStatusCount, WorkspaceStatusCount.workspace_id, Submission.workspace_id, Workspace.id),
+        (ProducerStatusCount, ProducerStatusCount.producer_profile_id, Submission.producer_profile_id, ProducerProfile.id),
+    )
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+
+    def _repair_statement(self, counter, key_column, submission_column, key_ids: list[UUID]):
+        """Add (actual - stored) to every counter of the given keys that is off.
+
+        Actual and stored counts come from one statement snapshot, where they agree
+        unless there is real drift; applying the difference as a delta (rather than
+        overwriting) keeps increments committed concurrently after that snapshot.
+        """
+        actual = (
+            select(submission_column.label("key_id"), Submission.status, func.count().label("count"))
+            .where(submission_column.in_(key_ids))
+            .group_by(submission_column, Submission.status)
+            .subquery("actual")
+        )
+        stored = (
+            select(key_column.label("key_id"), counter.status, counter.count)
+            .where(key_column.in_(key_ids))
+            .subquery("stored")
+        )
+        delta = func.coalesce(actual.c.count, 0) - func.coalesce(stored.c.count, 0)
+        drift = (
+            select(func.coalesce(actual.c.key_id, stored.c.key_id),
+                   func.coalesce(actual.c.status, stored.c.status),
+                   delta)
+            .select_from(actual.outerjoin(stored, and_(actual.c.key_id == stored.c.key_id,
+                                                       actual.c.status == stored.c.status), full=True))
+            .where(delta != 0)
+            .order_by(func.coalesce(actual.c.key_id, stored.c.key_id), func.coalesce(actual.c.status, stored.c.status))
+        )
+        stmt = pg_insert(counter).from_select([key_column.key, "status", "count"], drift)
+        return stmt.on_conflict_do_update(
+            index_elements=[key_column.key, "status"], set_={"count": counter.count + stmt.excluded.count}
+        ).returning(key_column)
+
+
+    async def reconcile(self, batch_size: int) -> dict[str, dict[str, int]]:
+        """Recount every workspace's and producer's submissions, `batch_size` keys per
+        transaction; returns keys scanned and counters repaired per counter table."""
+        report = {}
+        for counter, key_column, submission_column, owner_id in self.counters:
+            scanned = repaired = 0
+            last_id = None
+            while True:
+                stmt = select(owner_id).order_by(owner_id).limit(batch_size)
+                if last_id is not None:
+                    stmt = stmt.where(owner_id > last_id)
+                key_ids = (await self.session.execute(stmt)).scalars().all()
+                if not key_ids:
+                    break
+                result = await self.session.execute(self._repair_statement(counter, key_column, submission_column, key_ids))
+                repaired += len(result.all())
+                await self.session.commit()
+                scanned += len(key_ids)
+                last_id = key_ids[-1]
+            report[counter.__tablename__] = {"scanned": scanned, "repaired": repaired}
+        return report
+
+
+    async def reconcile_pending(self, batch_size: int) -> dict[str, dict[str, int]] | None:
+        """Seed counter tables created since the last schema step (the submissions predate
+        them), then clear their pending mark; None when none is pending."""
+        pending = []
+        for counter, *_ in self.counters:
+            description = await self.session.scalar(text("SELECT obj_description(to_regclass(:table_name), 'pg_class')"),
+                                                    {"table_name": counter.__tablename__})
+            if description == COUNTERS_PENDING_COMMENT:
+                pending.append(counter.__tablename__)
+        await self.session.commit()
+        if not pending:
+            return None
+        report = await self.reconcile(batch_size)
+        for table in pending:
+            await self.session.execute(text(f"COMMENT ON TABLE {table} IS NULL"))
+        await self.session.commit()
+        return report
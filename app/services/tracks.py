@@ -1,10 +1,32 @@
-from uuid import UUID
+import codecs
+import csv
+import io
+import json
+import tempfile
+from typing import AsyncIterator, BinaryIO, Iterator
+from uuid import UUID, uuid4
 
+import psycopg
+from psycopg.types.json import Jsonb
+from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import delete, select
+from sqlalchemy import String, delete, select
+from sqlalchemy.engine import Row
 
 from app.models.models import Track
-from app.schemas.schemas import TrackCreate, TrackUpdate
+from app.schemas.schemas import TrackCreate, TrackPublic, TrackUpdate
+from app.serialization import public_columns
+from app.settings import settings
+
+
+_COPY_TRACKS = ("COPY tracks (id, producer_profile_id, title, streaming_url, tempo, genre, key, extra_metadata) "
+                "FROM STDIN")
+_COPY_TYPES = ["uuid", "uuid", "varchar", "text", "float8", "varchar[]", "varchar", "jsonb"]
+_MAX_LINE_BYTES = 64 * 1024
+_SPOOL_MEMORY_BYTES = 8 * 1024 * 1024
+_MAX_REPORTED_ERRORS = 1000
+_STRING_LIMITS = {column.key: column.type.length for column in Track.__table__.columns
+                  if isinstance(column.type, String) and column.type.length}
 
 
 class TrackNotFoundError(Exception):
@@ -17,10 +39,87 @@ class TrackForbiddenError(Exception):
     pass
 
 
+class TrackImportFormatError(Exception):
+    """Raise when an import body can't be read at all (encoding, header, oversized line)."""
+    pass
+
+
+async def _spool_body(chunks: AsyncIterator[bytes]) -> BinaryIO:
+    """Copy a streamed body to a temporary file, kept in memory up to _SPOOL_MEMORY_BYTES.
+
+    The format is checked on the way, before any row is stored: the body must be UTF-8
+    and no line longer than _MAX_LINE_BYTES bytes.
+    """
+    body = tempfile.SpooledTemporaryFile(max_size=_SPOOL_MEMORY_BYTES)
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    line_no, line_bytes = 1, 0
+    try:
+        async for chunk in chunks:
+            decoder.decode(chunk)
+            lengths = [len(segment) for segment in chunk.split(b"\n")]
+            lengths[0] += line_bytes
+            for offset, length in enumerate(lengths):
+                if length > _MAX_LINE_BYTES:
+                    raise TrackImportFormatError(f"Line {line_no + offset} longer than {_MAX_LINE_BYTES} bytes.")
+            line_no, line_bytes = line_no + len(lengths) - 1, lengths[-1]
+            body.write(chunk)
+        decoder.decode(b"", final=True)
+    except UnicodeDecodeError:
+        body.close()
+        raise TrackImportFormatError("Body is not valid UTF-8.")
+    except BaseException:
+        body.close()
+        raise
+    body.seek(0)
+    return body
+
+
+def _iter_ndjson_records(lines: Iterator[str]) -> Iterator[tuple[int, str]]:
+    """Non-blank lines with their line numbers."""
+    for line_no, line in enumerate(lines, 1):
+        if line.strip():
+            yield line_no, line
+
+
+def _iter_csv_records(lines: Iterator[str]) -> Iterator[tuple[int, list[str]]]:
+    """Records of one csv.reader over the lines, with the number of their first line (a
+    quoted field may span lines)."""
+    reader = csv.reader(lines)
+    first_line = 1
+    try:
+        for values in reader:
+            if values:
+                yield first_line, values
+            first_line = reader.line_num + 1
+    except csv.Error as e:
+        # the reader can't resync after it (it may be inside a quoted field)
+        raise TrackImportFormatError(f"Malformed CSV record on line {first_line}: {e}")
+
+
+def _parse_csv_row(header: list[str], values: list[str]) -> dict:
+    """One CSV record -> TrackCreate fields. genre is '|'-separated, extra_metadata a JSON object."""
+    if len(values) != len(header):
+        raise ValueError(f"Expected {len(header)} columns, got {len(values)}.")
+    fields = {name: value for name, value in zip(header, values) if value != ""}
+    if "genre" in fields:
+        fields["genre"] = [genre.strip() for genre in fields["genre"].split("|") if genre.strip()]
+    if "extra_metadata" in fields:
+        fields["extra_metadata"] = json.loads(fields["extra_metadata"])
+    return fields
+
+
+def _check_lengths(track: TrackCreate) -> None:
+    for name, limit in _STRING_LIMITS.items():
+        value = getattr(track, name, None)
+        if value is not None and len(value) > limit:
+            raise ValueError(f"{name} longer than {limit} characters.")
+
+
 class TrackService:
-    def __init__(self, session: AsyncSession, producer_profile_id: UUID):
+    def __init__(self, session: AsyncSession, producer_profile_id: UUID, read_session: AsyncSession | None = None):
         self.session = session
         self.producer_profile_id = producer_profile_id
+        self.read_session = read_session or session
 
     
     async def create_track(self, track_data: TrackCreate) -> Track:
@@ -76,8 +175,101 @@ class TrackService:
         return
 
 
-    async def list_tracks(self) -> list[Track]:
-        result = await self.session.execute(select(Track).where(Track.producer_profile_id == self.producer_profile_id))
-        tracks = result.scalars().all()
+    async def import_tracks(self, chunks: AsyncIterator[bytes], content_type: str) -> dict:
+        """Stream-import tracks from a CSV (text/csv, header row) or NDJSON body.
+
+        The body is spooled to a temporary file and read back with one csv.reader, so a
+        quoted field may span lines. Rows are validated one by one with TrackCreate and
+        loaded with COPY in batches of settings.track_import_batch_size, each batch
+        committed on its own, so memory stays bounded by one batch (and the spool's
+        in-memory part, _SPOOL_MEMORY_BYTES). Invalid rows are reported by line number and skipped,
+        as are rows the database rejects (a rejected batch is retried row by row); a row
+        is reported by its first line. A body that can't be read at all (encoding, oversized
+        line, malformed CSV, header) raises TrackImportFormatError before anything is stored.
+        """
+        is_csv = content_type.startswith("text/csv")
+        report = {"imported": 0, "failed": 0, "errors": []}
+        header: list[str] | None = None
+        batch: list[tuple[int, tuple]] = []
+
+        def fail(line_no: int, detail: str) -> None:
+            report["failed"] += 1
+            if len(report["errors"]) < _MAX_REPORTED_ERRORS:
+                report["errors"].append({"line": line_no, "detail": detail})
+
+        with await _spool_body(chunks) as body:
+            lines = io.TextIOWrapper(body, encoding="utf-8", newline="")
+            if is_csv:
+                # a malformed record is a format error as well: look for one before storing anything
+                for _ in _iter_csv_records(lines):
+                    pass
+                lines.seek(0)
+            for line_no, record in _iter_csv_records(lines) if is_csv else _iter_ndjson_records(lines):
+                if is_csv and header is None:
+                    header = [name.strip() for name in record]
+                    unknown = set(header) - set(TrackCreate.model_fields)
+                    if unknown:
+                        raise TrackImportFormatError(f"Unknown CSV columns: {', '.join(sorted(unknown))}")
+                    continue
+
+                try:
+                    fields = _parse_csv_row(header, record) if is_csv else json.loads(record)
+                    track = TrackCreate.model_validate(fields)
+                    _check_lengths(track)
+                except ValidationError as e:
+                    fail(line_no, "; ".join(f"{'.'.join(map(str, err['loc']))}: {err['msg']}" for err in e.errors()))
+                    continue
+                except ValueError as e:
+                    fail(line_no, str(e))
+                    continue
+
+                batch.append((line_no, (uuid4(), self.producer_profile_id, track.title, track.streaming_url,
+                                        track.tempo, track.genre, track.key,
+                                        Jsonb(track.extra_metadata) if track.extra_metadata is not None else None)))
+
+                if len(batch) >= settings.track_import_batch_size:
+                    await self._copy_batch(batch, report, fail)
+                    batch = []
+
+        if batch:
+            await self._copy_batch(batch, report, fail)
+        return report
+
+
+    async def _copy_batch(self, batch: list[tuple[int, tuple]], report: dict, fail) -> None:
+        """COPY a batch of (line number, row); when the database rejects it, load its rows
+        one at a time so only the rejected lines are skipped and reported."""
+        try:
+            await self._copy_rows([row for _, row in batch])
+            report["imported"] += len(batch)
+            return
+        except psycopg.Error:
+            await self.session.rollback()
+        for line_no, row in batch:
+            try:
+                await self._copy_rows([row])
+                report["imported"] += 1
+            except psycopg.Error as e:
+                await self.session.rollback()
+                fail(line_no, f"Row was not loaded: {e}")
+
+
+    async def _copy_rows(self, rows: list[tuple]) -> None:
+        connection = await self.session.connection()
+        raw_connection = await connection.get_raw_connection()
+        async with raw_connection.driver_connection.cursor() as cursor:
+            async with cursor.copy(_COPY_TRACKS) as copy:
+                copy.set_types(_COPY_TYPES)
+                for row in rows:
+                    await copy.write_row(row)
+        await self.session.commit()
+
+
+    async def list_tracks(self) -> list[Row]:
+        """Public columns only, as row tuples (for RowsJSONResponse)."""
+        result = await self.read_session.execute(
+            select(*public_columns(TrackPublic, Track)).where(Track.producer_profile_id == self.producer_profile_id)
+        )
+        tracks = result.all()
 
         return tracks
\ No newline at end of file
@@ -1,12 +1,44 @@
+import asyncio
+import threading
 from uuid import UUID
 
-import zxcvbn
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, inspect
 
 from app.schemas.schemas import UserCreate, ProducerProfileUpdate, LabelStaffProfileUpdate, UserUpdate
 from app.models.models import User, LabelStaffProfile, ProducerProfile
 from app.services.auth import AuthService
+from app.cache import TTLCache
+from app.settings import settings
+
+
+# Column snapshots of authenticated users, keyed by user id (see get_authenticated_user)
+user_cache = TTLCache(maxsize=settings.user_cache_size, ttl=settings.user_cache_ttl_seconds)
+_USER_COLUMNS = [attr.key for attr in inspect(User).column_attrs]
+
+# zxcvbn loads large frequency dictionaries on import; keep that off the cold-start path
+_zxcvbn = None
+_zxcvbn_lock = threading.Lock()
+
+
+def load_password_scorer():
+    """Import zxcvbn on first use (or from the startup pre-warm) and return its scorer."""
+    global _zxcvbn
+    if _zxcvbn is None:
+        with _zxcvbn_lock:
+            if _zxcvbn is None:
+                from zxcvbn import zxcvbn
+                _zxcvbn = zxcvbn
+    return _zxcvbn
+
+
+def score_password(password: str) -> int:
+    """zxcvbn score (0-4) of the password's first password_strength_max_length characters.
+
+    Scoring cost grows with length (and zxcvbn rejects anything over 72 chars),
+    so long passwords are judged on their prefix.
+    """
+    return load_password_scorer()(password[:settings.password_strength_max_length])["score"]
 
 
 class PasswordTooWeakError(Exception):
@@ -46,10 +78,10 @@ class UserService:
 
 
     async def create_user(self, user_data: UserCreate):
-        self._check_password_strength(user_data.password)
+        await self._check_password_strength(user_data.password)
         await self._is_username_taken(user_data.username)
 
-        hashed_pwd = self.auth_service.hash_password(user_data.password)
+        hashed_pwd = await self.auth_service.hash_password(user_data.password)
 
         new_user = User(email=user_data.email,
                 username=user_data.username,
@@ -75,8 +107,8 @@ class UserService:
         return new_user
 
 
-    def _check_password_strength(self, password: str):
-        if zxcvbn.zxcvbn(password)["score"] < 1:
+    async def _check_password_strength(self, password: str):
+        if await asyncio.to_thread(score_password, password) < 1:
             raise PasswordTooWeakError("Password too weak")
 
 
@@ -92,7 +124,7 @@ class UserService:
         result = await self.session.execute(select(User).where(User.username == username))
         user = result.scalar_one_or_none()
 
-        if not user or not self.auth_service.verify_password(password, user.pwd_hash):
+        if not user or not await self.auth_service.verify_password(password, user.pwd_hash):
             raise AuthenticationError("Authentication failed")
         
         return user
@@ -104,6 +136,43 @@ class UserService:
         return user
 
 
+    async def get_authenticated_user(self, id: UUID) -> tuple[User, UUID | None] | None:
+        """User plus its producer or labelstaff profile id, in one joined query behind user_cache.
+
+        The cache holds plain column values, each hit builds a fresh transient User so
+        no ORM instance is shared between sessions or requests.
+        """
+        cached = user_cache.get(id)
+        if cached is not None:
+            snapshot, profile_id = cached
+            return User(**snapshot), profile_id
+
+        result = await self.session.execute(
+            select(User, ProducerProfile.id, LabelStaffProfile.id)
+            .outerjoin(ProducerProfile, ProducerProfile.user_id == User.id)
+            .outerjoin(LabelStaffProfile, LabelStaffProfile.user_id == User.id)
+            .where(User.id == id)
+        )
+        row = result.one_or_none()
+        if not row:
+            return None
+
+        user, producer_profile_id, labelstaff_profile_id = row
+        profile_id = producer_profile_id or labelstaff_profile_id
+        user_cache.set(id, ({key: getattr(user, key) for key in _USER_COLUMNS}, profile_id))
+        return user, profile_id
+
+
+    async def create_access_token(self, user: User) -> str:
+        """Access token for `user`; carries profile claims when settings.token_profile_claims is on."""
+        if not settings.token_profile_claims:
+            return self.auth_service.generate_access_token(user.id)
+
+        resolved = await self.get_authenticated_user(user.id)
+        profile_id = resolved[1] if resolved else None
+        return self.auth_service.generate_access_token(user.id, user.user_type.value, profile_id)
+
+
     async def update_labelstaff_profile(self, user_id: UUID, data: LabelStaffProfileUpdate) -> LabelStaffProfile:
         result = await self.session.execute(select(LabelStaffProfile).where(LabelStaffProfile.user_id == user_id))
         labelstaff_profile = result.scalar_one_or_none()
@@ -116,6 +185,7 @@ class UserService:
             setattr(labelstaff_profile, key, value)
 
         await self.session.commit()
+        user_cache.invalidate(user_id)
         await self.session.refresh(labelstaff_profile)
 
         return labelstaff_profile
@@ -133,6 +203,7 @@ class UserService:
             setattr(producer_profile, key, value)
         
         await self.session.commit()
+        user_cache.invalidate(user_id)
         await self.session.refresh(producer_profile)
 
         return producer_profile
@@ -182,6 +253,7 @@ class UserService:
             setattr(user, key, value)
 
         await self.session.commit()
+        user_cache.invalidate(user_id)
         await self.session.refresh(user)
 
         return user
\ No newline at end of file
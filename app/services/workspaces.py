@@ -6,6 +6,7 @@ from sqlalchemy.orm import selectinload
 
 from app.models.models import Membership, Workspace
 from app.schemas.schemas import WorkspaceCreate, WorkspaceUpdate
+from app.services.memberships import get_member_role, invalidate_workspace_memberships
 
 
 class WorkspaceNotFoundError(Exception):
@@ -19,9 +20,10 @@ class WorkspaceForbiddenError(Exception):
 
 
 class WorkspaceService:
-    def __init__(self, session: AsyncSession, labelstaff_profile_id: UUID):
+    def __init__(self, session: AsyncSession, labelstaff_profile_id: UUID, read_session: AsyncSession | None = None):
         self.session = session
         self.labelstaff_profile_id = labelstaff_profile_id
+        self.read_session = read_session or session
 
     
     async def create_workspace(self, workspace_data: WorkspaceCreate) -> Workspace:
@@ -70,6 +72,7 @@ class WorkspaceService:
         )
         await self.session.execute(delete(Workspace).where(Workspace.id == workspace_id))
         await self.session.commit()
+        invalidate_workspace_memberships(workspace_id)
 
 
     async def list_workspaces(self) -> list[Workspace]:
@@ -80,18 +83,13 @@ class WorkspaceService:
             .options(selectinload(Workspace.memberships))
         )
 
-        result = await self.session.execute(stmt)
+        result = await self.read_session.execute(stmt)
         workspaces = result.scalars().unique().all()
         return workspaces
     
 
     async def _check_admin(self, workspace_id: UUID) -> None:
-        result = await self.session.execute(select(Membership).where(
-            Membership.workspace_id == workspace_id,
-            Membership.labelstaff_profile_id == self.labelstaff_profile_id,
-            Membership.role == "admin"
-        ))
-        membership = result.scalar_one_or_none()
+        role = await get_member_role(self.session, self.labelstaff_profile_id, workspace_id)
 
-        if not membership:
+        if role != "admin":
             raise WorkspaceForbiddenError("User is not the admin of this workspace.")
\ No newline at end of file
@@ -1,4 +1,5 @@
 import sys
+from typing import Literal
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -10,11 +11,98 @@ class Settings(BaseSettings):
     algorithm: str
     app_env: str
 
+    # Optional read replica; list endpoints fall back to the primary when unset
+    read_database_url: str | None = None
+    # same database as test_database_url, through a second engine (see .env.example)
+    test_read_database_url: str | None = None
+    read_your_writes_seconds: float = 0.0
+
+    # Argon2 runs on a thread pool; requests beyond max_pending get a 503
+    password_hash_workers: int = 2
+    password_hash_max_pending: int = 16
+
+    # zxcvbn: scored prefix length and whether to load it in the background after startup
+    password_strength_max_length: int = 64
+    prewarm_password_scorer: bool = True
+
+    # Embed user type and profile id as signed claims in access tokens
+    token_profile_claims: bool = True
+
+    # Authenticated-user cache (see app/services/users.py)
+    user_cache_size: int = 1024
+    user_cache_ttl_seconds: float = 60.0
+
+    # Membership role cache (see app/services/memberships.py)
+    membership_cache_size: int = 4096
+    membership_cache_ttl_seconds: float = 30.0
+    membership_cache_negative_ttl_seconds: float = 5.0
+
+    # Keyset pagination of submission and event lists (?limit=, next page cursor in X-Next-Cursor)
+    page_size_default: int = 50
+    page_size_max: int = 200
+    # Rows fetched per server-side cursor round trip when an event history is streamed as NDJSON
+    stream_batch_size: int = 500
+    # Label response times: calendar months merged into the reported time to first review,
+    # and the default age after which a PENDING submission counts as stale
+    response_time_window_months: int = 3
+    stale_pending_days_default: int = 14
+    # Workspaces / producers recounted per transaction by `python -m app.reconcile_counts`
+    counter_reconcile_batch_size: int = 500
+    # Server-sent event push (/events/live): live connections per process, keepalive comment
+    # interval and the reconnect delay suggested to EventSource clients. The listener holds one
+    # LISTEN connection per process to the primary: push_listen_database_url, or database_url
+    # unless that is a transaction-mode pooler (db_pool_mode "pgbouncer"), where LISTEN never
+    # delivers; push is then unavailable (503) until a direct URL is set.
+    push_listen_database_url: str | None = None
+    push_max_subscribers: int = 5000
+    push_keepalive_seconds: float = 15.0
+    push_retry_ms: int = 3000
+    # submission_events is range-partitioned by month (see app/partitions.py): partitions kept
+    # ready ahead of the current month, checked every event_partition_check_hours by the app
+    # when maintenance is enabled; partitions older than the retention window are archived
+    # (gzip'd CSV) to event_archive_dir by `python -m app.partitions archive`
+    event_partitions_ahead: int = 3
+    event_partition_maintenance: bool = True
+    event_partition_check_hours: float = 24.0
+    event_partition_lock_timeout_ms: int = 5000
+    event_retention_months: int = 24
+    event_archive_dir: str = "archive/submission_events"
+
+    # Rows per COPY batch in POST /api/tracks/import
+    track_import_batch_size: int = 1000
+
+    # GET /api/metrics requires "Authorization: Bearer <metrics_token>"; unset, it is only
+    # served when app_env == "local" (404 elsewhere)
+    metrics_token: str | None = None
+
+    # Connection pool (see app/database.py)
+    db_pool_mode: Literal["null", "queue", "pgbouncer"] = "queue"
+    db_pool_size: int = 5
+    db_max_overflow: int = 5
+    db_pool_pre_ping: bool = True
+    db_pool_recycle: int = 1800
+    db_pool_timeout: float = 10.0
+
+    # Startup: create_all always runs for app_env == "local"; elsewhere only when enabled
+    # (it only creates missing tables; deployed schemas are migrated by alembic)
+    db_create_schema_on_startup: bool = False
+    db_warm_connections: int = 2
+    # Rows per transaction when a migration backfills a new column of a large table
+    schema_backfill_batch_size: int = 5000
+
+    # SQL logging and instrumentation (see app/instrumentation.py)
+    db_echo: bool = False
+    sql_instrumentation: bool = True
+    sql_sample_rate: float = 1.0
+    sql_slow_query_ms: float = 200.0
+    sql_n_plus_one_threshold: int = 10
+
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8")
 
     def model_post_init(self, __context) -> None:
         if "pytest" in sys.modules:
             object.__setattr__(self, "database_url", self.test_database_url)
+            object.__setattr__(self, "read_database_url", self.test_read_database_url)
 
 
 settings = Settings()
\ No newline at end of file
@@ -0,0 +1,42 @@
+import math
+from typing import Mapping
+
+from sqlalchemy import SmallInteger, cast, func
+
+
+# Log-bucketed quantile sketch (as in DDSketch): bucket i counts the values in
+# (GAMMA**(i-1), GAMMA**i], so any quantile read back from the bucket counts is within
+# RELATIVE_ACCURACY of the exact one. Buckets merge by adding counts, so a sketch can be
+# kept as (key, bucket) -> count rows, upserted in SQL and summed over any set of keys.
+RELATIVE_ACCURACY = 0.02
+GAMMA = (1 + RELATIVE_ACCURACY) / (1 - RELATIVE_ACCURACY)
+_LOG_GAMMA = math.log(GAMMA)
+
+
+def bucket_of(value: float) -> int:
+    """Bucket of a positive value; values below 1 share bucket 0."""
+    return math.ceil(math.log(max(value, 1.0)) / _LOG_GAMMA)
+
+
+def bucket_expression(value):
+    """SQL equivalent of bucket_of for a numeric column expression."""
+    return cast(func.ceil(func.ln(func.greatest(value, 1.0)) / _LOG_GAMMA), SmallInteger)
+
+
+def bucket_value(bucket: int) -> float:
+    """Estimate for the values of a bucket, within RELATIVE_ACCURACY of each of them."""
+    return 2 * GAMMA ** bucket / (GAMMA + 1)
+
+
+def quantile(counts: Mapping[int, int], q: float) -> float | None:
+    """q-quantile (0..1) of the values counted in `counts` (bucket -> count); None when empty."""
+    total = sum(counts.values())
+    if not total:
+        return None
+    rank = q * (total - 1)
+    seen = 0
+    for bucket in sorted(counts):
+        seen += counts[bucket]
+        if seen > rank:
+            return bucket_value(bucket)
+    return bucket_value(max(counts))
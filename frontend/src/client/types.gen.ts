@@ -1113,7 +1113,18 @@ export type ListMembershipsApiWorkspacesWorkspaceIdMembershipsGetResponse = List
 export type ListProducerSubmissionsApiSubmissionsGetData = {
     body?: never;
     path?: never;
-    query?: never;
+    query?: {
+        /**
+         * Cursor
+         *
+         * Opaque cursor from the X-Next-Cursor header of the previous page
+         */
+        cursor?: string | null;
+        /**
+         * Limit
+         */
+        limit?: number;
+    };
     url: '/api/submissions';
 };
 
@@ -1161,7 +1172,42 @@ export type ListLabelSubmissionsApiWorkspacesWorkspaceIdSubmissionsGetData = {
          */
         workspace_id: string;
     };
-    query?: never;
+    query?: {
+        /**
+         * Cursor
+         *
+         * Opaque cursor from the X-Next-Cursor header of the previous page
+         */
+        cursor?: string | null;
+        /**
+         * Limit
+         */
+        limit?: number;
+        /**
+         * Status
+         */
+        status?: Array<Status> | null;
+        /**
+         * Tempo Min
+         */
+        tempo_min?: number | null;
+        /**
+         * Tempo Max
+         */
+        tempo_max?: number | null;
+        /**
+         * Key
+         */
+        key?: string | null;
+        /**
+         * Genre
+         */
+        genre?: Array<string> | null;
+        /**
+         * Sort
+         */
+        sort?: 'newest' | 'oldest' | 'tempo_asc' | 'tempo_desc';
+    };
     url: '/api/workspaces/{workspace_id}/submissions';
 };
 
@@ -1354,7 +1400,30 @@ export type TransitionToRejectedApiWorkspacesWorkspaceIdSubmissionsSubmissionIdR
 export type ListProducerSubmissionEventsApiSubmissionsEventsGetData = {
     body?: never;
     path?: never;
-    query?: never;
+    query?: {
+        /**
+         * Cursor
+         *
+         * Opaque cursor from the X-Next-Cursor header of the previous page
+         */
+        cursor?: string | null;
+        /**
+         * Limit
+         */
+        limit?: number;
+        /**
+         * Since
+         *
+         * Incremental sync: only events after this cursor, oldest first ('0' for the beginning); the next one is in X-Next-Cursor
+         */
+        since?: string | null;
+        /**
+         * Stream
+         *
+         * Stream the whole history as NDJSON (same as Accept: application/x-ndjson)
+         */
+        stream?: boolean;
+    };
     url: '/api/submissions/events';
 };
 
@@ -1377,7 +1446,30 @@ export type ListLabelSubmissionEventsApiWorkspacesWorkspaceIdSubmissionsEventsGe
          */
         workspace_id: string;
     };
-    query?: never;
+    query?: {
+        /**
+         * Cursor
+         *
+         * Opaque cursor from the X-Next-Cursor header of the previous page
+         */
+        cursor?: string | null;
+        /**
+         * Limit
+         */
+        limit?: number;
+        /**
+         * Since
+         *
+         * Incremental sync: only events after this cursor, oldest first ('0' for the beginning); the next one is in X-Next-Cursor
+         */
+        since?: string | null;
+        /**
+         * Stream
+         *
+         * Stream the whole history as NDJSON (same as Accept: application/x-ndjson)
+         */
+        stream?: boolean;
+    };
     url: '/api/workspaces/{workspace_id}/submissions/events';
 };
 
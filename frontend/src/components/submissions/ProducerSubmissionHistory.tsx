@@ -29,7 +29,8 @@ interface ProducerSubmissionHistoryProps {
 }
 
 export function ProducerSubmissionHistory({ isOpen, onClose }: ProducerSubmissionHistoryProps) {
-  const { data: events, isLoading, isError } = useProducerSubmissionEvents({ enabled: isOpen });
+  const { data: events, isLoading, isError, hasNextPage, fetchNextPage, isFetchingNextPage } =
+    useProducerSubmissionEvents({ enabled: isOpen });
 
   if (!isOpen) return null;
 
@@ -138,6 +139,13 @@ export function ProducerSubmissionHistory({ isOpen, onClose }: ProducerSubmissio
               </tbody>
             </table>
           )}
+          {!isLoading && !isError && hasNextPage && (
+            <div style={{ marginTop: 12 }}>
+              <Button variant="outline" size="sm" type="button" onClick={() => fetchNextPage()} disabled={isFetchingNextPage}>
+                {isFetchingNextPage ? "Loading…" : "Load older events"}
+              </Button>
+            </div>
+          )}
         </div>
       </div>
     </div>
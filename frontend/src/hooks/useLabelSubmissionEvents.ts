@@ -1,6 +1,7 @@
-import { useQuery } from "@tanstack/react-query";
+import { useInfiniteQuery } from "@tanstack/react-query";
 import { listLabelSubmissionEventsApiWorkspacesWorkspaceIdSubmissionsEventsGet } from "@/client";
 import type { SubmissionEventPublic } from "@/client";
+import { toPage, type Page } from "@/lib/pagination";
 
 export const labelSubmissionEventsQueryKey = (workspaceId: string) => [
   "workspaces",
@@ -9,17 +10,21 @@ export const labelSubmissionEventsQueryKey = (workspaceId: string) => [
   "events",
 ];
 
+/** Newest first, one page at a time: `fetchNextPage` follows X-Next-Cursor. */
 export function useLabelSubmissionEvents(workspaceId: string | undefined) {
-  return useQuery<SubmissionEventPublic[]>({
+  return useInfiniteQuery({
     queryKey: labelSubmissionEventsQueryKey(workspaceId ?? ""),
-    queryFn: async () => {
-      if (!workspaceId) return [];
+    queryFn: async ({ pageParam }): Promise<Page<SubmissionEventPublic>> => {
+      if (!workspaceId) return { items: [] };
       const res =
         await listLabelSubmissionEventsApiWorkspacesWorkspaceIdSubmissionsEventsGet(
-          { path: { workspace_id: workspaceId } }
+          { path: { workspace_id: workspaceId }, query: { cursor: pageParam } }
         );
-      return res.data ?? [];
+      return toPage(res);
     },
+    initialPageParam: undefined as string | undefined,
+    getNextPageParam: (lastPage) => lastPage.nextCursor,
+    select: (data) => data.pages.flatMap((page) => page.items),
     enabled: Boolean(workspaceId),
   });
 }
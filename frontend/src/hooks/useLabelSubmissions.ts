@@ -1,6 +1,7 @@
-import { useQuery } from "@tanstack/react-query";
+import { useInfiniteQuery } from "@tanstack/react-query";
 import { listLabelSubmissionsApiWorkspacesWorkspaceIdSubmissionsGet } from "@/client";
 import type { SubmissionPublic } from "@/client";
+import { toPage, type Page } from "@/lib/pagination";
 
 export const labelSubmissionsQueryKey = (workspaceId: string) => [
   "workspaces",
@@ -8,18 +9,25 @@ export const labelSubmissionsQueryKey = (workspaceId: string) => [
   "submissions",
 ];
 
+/** Newest first, one page at a time: `fetchNextPage` follows X-Next-Cursor. */
 export function useLabelSubmissions(workspaceId: string | undefined) {
-  return useQuery<SubmissionPublic[]>({
+  return useInfiniteQuery({
     queryKey: labelSubmissionsQueryKey(workspaceId ?? ""),
-    queryFn: async () => {
-      if (!workspaceId) return [];
+    queryFn: async ({ pageParam }): Promise<Page<SubmissionPublic>> => {
+      if (!workspaceId) return { items: [] };
       const res =
         await listLabelSubmissionsApiWorkspacesWorkspaceIdSubmissionsGet({
           path: { workspace_id: workspaceId },
+          query: { cursor: pageParam },
         });
-      const list = res.data ?? [];
-      return list.filter((s) => s.status !== "WITHDRAWN");
+      return toPage(res);
     },
+    initialPageParam: undefined as string | undefined,
+    getNextPageParam: (lastPage) => lastPage.nextCursor,
+    select: (data) =>
+      data.pages
+        .flatMap((page) => page.items)
+        .filter((s) => s.status !== "WITHDRAWN"),
     enabled: Boolean(workspaceId),
   });
 }
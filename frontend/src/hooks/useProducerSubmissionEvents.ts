@@ -1,16 +1,23 @@
-import { useQuery } from "@tanstack/react-query";
+import { useInfiniteQuery } from "@tanstack/react-query";
 import { listProducerSubmissionEventsApiSubmissionsEventsGet } from "@/client";
 import type { SubmissionEventPublic } from "@/client";
+import { toPage, type Page } from "@/lib/pagination";
 
 export const producerSubmissionEventsQueryKey = ["producer", "submissions", "events"];
 
+/** Newest first, one page at a time: `fetchNextPage` follows X-Next-Cursor. */
 export function useProducerSubmissionEvents(options?: { enabled?: boolean }) {
-  return useQuery<SubmissionEventPublic[]>({
+  return useInfiniteQuery({
     queryKey: producerSubmissionEventsQueryKey,
-    queryFn: async () => {
-      const res = await listProducerSubmissionEventsApiSubmissionsEventsGet();
-      return res.data ?? [];
+    queryFn: async ({ pageParam }): Promise<Page<SubmissionEventPublic>> => {
+      const res = await listProducerSubmissionEventsApiSubmissionsEventsGet({
+        query: { cursor: pageParam },
+      });
+      return toPage(res);
     },
+    initialPageParam: undefined as string | undefined,
+    getNextPageParam: (lastPage) => lastPage.nextCursor,
+    select: (data) => data.pages.flatMap((page) => page.items),
     enabled: options?.enabled ?? true,
   });
 }
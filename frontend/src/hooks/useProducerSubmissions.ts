@@ -1,15 +1,22 @@
-import { useQuery } from "@tanstack/react-query";
+import { useInfiniteQuery } from "@tanstack/react-query";
 import { listProducerSubmissionsApiSubmissionsGet } from "@/client";
 import type { SubmissionPublic } from "@/client";
+import { toPage, type Page } from "@/lib/pagination";
 
 export const producerSubmissionsQueryKey = ["producer", "submissions"];
 
+/** Newest first, one page at a time: `fetchNextPage` follows X-Next-Cursor. */
 export function useProducerSubmissions() {
-  return useQuery<SubmissionPublic[]>({
+  return useInfiniteQuery({
     queryKey: producerSubmissionsQueryKey,
-    queryFn: async () => {
-      const res = await listProducerSubmissionsApiSubmissionsGet();
-      return res.data ?? [];
+    queryFn: async ({ pageParam }): Promise<Page<SubmissionPublic>> => {
+      const res = await listProducerSubmissionsApiSubmissionsGet({
+        query: { cursor: pageParam },
+      });
+      return toPage(res);
     },
+    initialPageParam: undefined as string | undefined,
+    getNextPageParam: (lastPage) => lastPage.nextCursor,
+    select: (data) => data.pages.flatMap((page) => page.items),
   });
 }
@@ -1,9 +1,10 @@
-import { useMutation, useQueryClient } from "@tanstack/react-query";
+import { useMutation, useQueryClient, type InfiniteData } from "@tanstack/react-query";
 import {
   transitionToWithdrawnApiSubmissionsSubmissionIdWithdrawPost,
   type TransitionToWithdrawnApiSubmissionsSubmissionIdWithdrawPostData,
 } from "@/client";
 import type { SubmissionPublic } from "@/client";
+import type { Page } from "@/lib/pagination";
 import { producerSubmissionsQueryKey } from "./useProducerSubmissions";
 
 /**
@@ -30,14 +31,21 @@ export function useWithdrawProducerSubmission() {
 
       const previousSubmissions = queryClient.getQueryData(producerSubmissionsQueryKey);
 
-      queryClient.setQueryData(producerSubmissionsQueryKey, (old: SubmissionPublic[] | undefined) => {
-        if (Array.isArray(old)) {
-          return old.map((s) =>
-            s.id === submissionId ? { ...s, status: "WITHDRAWN" } : s
-          );
+      queryClient.setQueryData(
+        producerSubmissionsQueryKey,
+        (old: InfiniteData<Page<SubmissionPublic>> | undefined) => {
+          if (!old) return old;
+          return {
+            ...old,
+            pages: old.pages.map((page) => ({
+              ...page,
+              items: page.items.map((s) =>
+                s.id === submissionId ? { ...s, status: "WITHDRAWN" as const } : s
+              ),
+            })),
+          };
         }
-        return old;
-      });
+      );
 
       return { previousSubmissions };
     },
@@ -0,0 +1,13 @@
+/** One page of a keyset-paginated list endpoint. */
+export type Page<T> = {
+  items: T[];
+  nextCursor?: string;
+};
+
+/** The list endpoints send the cursor of the next page in X-Next-Cursor (absent on the last page). */
+export function toPage<T>(res: { data?: T[]; response?: Response }): Page<T> {
+  return {
+    items: res.data ?? [],
+    nextCursor: res.response?.headers.get("X-Next-Cursor") ?? undefined,
+  };
+}
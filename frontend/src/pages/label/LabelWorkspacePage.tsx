@@ -41,8 +41,20 @@ function eventActorLabel(e: SubmissionEventPublic): string {
 
 export default function LabelWorkspacePage() {
   const { workspaceId } = useParams<{ workspaceId: string }>();
-  const { data: submissions = [], isLoading, isError } = useLabelSubmissions(workspaceId);
-  const { data: allEvents = [] } = useLabelSubmissionEvents(workspaceId);
+  const {
+    data: submissions = [],
+    isLoading,
+    isError,
+    hasNextPage: hasMoreSubmissions,
+    fetchNextPage: fetchMoreSubmissions,
+    isFetchingNextPage: isFetchingMoreSubmissions,
+  } = useLabelSubmissions(workspaceId);
+  const {
+    data: allEvents = [],
+    hasNextPage: hasMoreEvents,
+    fetchNextPage: fetchMoreEvents,
+    isFetchingNextPage: isFetchingMoreEvents,
+  } = useLabelSubmissionEvents(workspaceId);
   const [selectedSubmissionId, setSelectedSubmissionId] = useState<string | null>(null);
 
   const { data: myMembership } = useWorkspaceMyRole(workspaceId);
@@ -133,6 +145,18 @@ export default function LabelWorkspacePage() {
               </button>
             ))
           )}
+          {hasMoreSubmissions && (
+            <div className="px-5 py-4">
+              <Button
+                variant="outline"
+                size="sm"
+                onClick={() => fetchMoreSubmissions()}
+                disabled={isFetchingMoreSubmissions}
+              >
+                {isFetchingMoreSubmissions ? "Loading…" : "Load more"}
+              </Button>
+            </div>
+          )}
         </div>
       </section>
 
@@ -211,6 +235,16 @@ export default function LabelWorkspacePage() {
                   ))
                 )}
               </ul>
+              {hasMoreEvents && (
+                <Button
+                  variant="outline"
+                  size="sm"
+                  onClick={() => fetchMoreEvents()}
+                  disabled={isFetchingMoreEvents}
+                >
+                  {isFetchingMoreEvents ? "Loading…" : "Load older events"}
+                </Button>
+              )}
             </>
           ) : (
             <p className="text-slate-600 text-sm">
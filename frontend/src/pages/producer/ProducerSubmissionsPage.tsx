@@ -12,7 +12,14 @@ import type { SubmissionCreate } from "@/client";
 
 export default function ProducerSubmissionsPage() {
   const [historyOpen, setHistoryOpen] = useState(false);
-  const { data: submissions, isLoading, isError } = useProducerSubmissions();
+  const {
+    data: submissions,
+    isLoading,
+    isError,
+    hasNextPage,
+    fetchNextPage,
+    isFetchingNextPage,
+  } = useProducerSubmissions();
   const createMutation = useCreateProducerSubmission();
   const withdrawMutation = useWithdrawProducerSubmission();
 
@@ -33,6 +40,13 @@ export default function ProducerSubmissionsPage() {
   return (
     <div style={{ maxWidth: 720, margin: "0 auto" }}>
       <SubmissionList submissions={submissions ?? []} onWithdraw={handleWithdraw} />
+      {hasNextPage && (
+        <div style={{ marginTop: 12 }}>
+          <Button variant="outline" size="sm" type="button" onClick={() => fetchNextPage()} disabled={isFetchingNextPage}>
+            {isFetchingNextPage ? "Loading…" : "Load more"}
+          </Button>
+        </div>
+      )}
       <div style={{ marginTop: 24, display: "flex", gap: 12, flexWrap: "wrap" }}>
         <SubmissionActions onCreate={handleCreate} />
         <Button variant="outline" size="md" type="button" onClick={() => setHistoryOpen(true)}>
@@ -0,0 +1,45 @@
+"""Alembic environment: migrates settings.database_url (run `alembic upgrade head`).
+
+psycopg serves both the app's async engine and this synchronous one. Every revision
+runs in its own transaction; the online upgrades open autocommit blocks for the steps
+that must not run inside one (CREATE INDEX CONCURRENTLY, batched backfills).
+"""
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import create_engine
+from sqlalchemy.pool import NullPool
+
+import app.models.models  # noqa: F401
+from app.database import Base
+from app.settings import settings
+
+
+config = context.config
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+# for `alembic revision --autogenerate`; the revisions themselves never import the models
+target_metadata = Base.metadata
+
+
+def run_migrations_offline() -> None:
+    context.configure(url=settings.database_url, target_metadata=target_metadata, literal_binds=True,
+                      dialect_opts={"paramstyle": "named"}, transaction_per_migration=True)
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    engine = create_engine(settings.database_url, poolclass=NullPool)
+    with engine.connect() as connection:
+        context.configure(connection=connection, target_metadata=target_metadata, transaction_per_migration=True)
+        with context.begin_transaction():
+            context.run_migrations()
+    engine.dispose()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,193 @@
+"""Steps for revisions that change large tables while the previous release keeps serving.
+
+Every step opens its own connections on the migration engine and keeps each transaction
+short (one batch, one catalog change), so nothing holds row locks on a whole table or an
+exclusive lock for longer than a catalog update. Revisions call them inside
+op.get_context().autocommit_block(): the revision's own transaction would otherwise stay
+open meanwhile, and CREATE INDEX CONCURRENTLY waits for every transaction older than it.
+
+The steps check the catalog before acting, so a run that failed part way is picked up by
+the next one, and databases the former boot-time upgrade (init_db) already took part of
+the way are finished rather than upgraded twice.
+"""
+import logging
+import re
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+
+from app.settings import settings
+
+
+logger = logging.getLogger("alembic.online")
+
+BACKFILL_PENDING = "schema upgrade: backfill pending"
+_BACKFILL_MAX_PASSES = 3
+
+_INDEX_HEAD = re.compile(r"^CREATE (UNIQUE )?INDEX (\S+) ON (\S+) ")
+
+
+def _column_state(conn: Connection, table_name: str, column_name: str) -> tuple[str, str | None, str] | None:
+    """(is_nullable, comment, is_generated) of a column; None when it doesn't exist."""
+    return conn.execute(text(
+        "SELECT is_nullable, col_description(to_regclass(:table_name), ordinal_position), is_generated "
+        "FROM information_schema.columns "
+        "WHERE table_schema = current_schema() AND table_name = :table_name AND column_name = :column_name"
+    ), {"table_name": table_name, "column_name": column_name}).first()
+
+
+def add_backfilled_column(engine: Engine, table_name: str, column_name: str, column_type: str,
+                          default: str | None = None) -> None:
+    """Add a column to backfill, unless the table has it.
+
+    It is added nullable (instant; a server default would only apply to new rows anyway)
+    and marked pending until `backfill` has filled it. A generated column of that name,
+    left by an older layout, keeps its values and stops being computed.
+    """
+    with engine.begin() as conn:
+        state = _column_state(conn, table_name, column_name)
+        if state is not None:
+            if state[2] == "ALWAYS":
+                conn.execute(text(f"ALTER TABLE {table_name} ALTER COLUMN {column_name} DROP EXPRESSION"))
+            return
+        logger.info("adding %s.%s", table_name, column_name)
+        conn.execute(text(f"ALTER TABLE {table_name} ADD COLUMN {column_name} {column_type}"))
+        if default is not None:
+            conn.execute(text(f"ALTER TABLE {table_name} ALTER COLUMN {column_name} SET DEFAULT {default}"))
+        conn.execute(text(f"COMMENT ON COLUMN {table_name}.{column_name} IS '{BACKFILL_PENDING}'"))
+
+
+def backfill(engine: Engine, table_name: str, column_name: str, statements: tuple[str, ...],
+             not_null: bool) -> None:
+    """Fill a column added by add_backfilled_column, then enforce NOT NULL if `not_null`.
+
+    The first statement fills the next batch after :last_id (primary key order) and
+    returns the ids it touched; the others run once, after the last batch. Each batch
+    commits on its own (settings.schema_backfill_batch_size rows), so the upgrade neither
+    holds row locks on the whole table nor fires the submissions statement triggers with
+    whole-table transition tables. Rows the previous release inserts meanwhile must be
+    filled by a server default or by the database itself (a BEFORE INSERT trigger), or
+    NOT NULL would break its writes.
+    """
+    statement, *finishing = statements
+    with engine.connect() as conn:
+        is_nullable, description, _ = _column_state(conn, table_name, column_name)
+    pending = description == BACKFILL_PENDING
+    if not pending and (not not_null or is_nullable == "NO"):
+        return
+
+    # a further pass picks up rows committed behind the previous one's position (by
+    # transactions that were in flight when it started); bounded, in case writers keep
+    # leaving NULLs, in which case NOT NULL waits for the next upgrade
+    for _ in range(_BACKFILL_MAX_PASSES):
+        filled, last_id = 0, UUID(int=0)
+        while True:
+            with engine.begin() as conn:
+                ids = conn.execute(text(statement), {
+                    "last_id": last_id, "batch_size": settings.schema_backfill_batch_size,
+                }).scalars().all()
+            if not ids:
+                break
+            filled += len(ids)
+            last_id = max(ids)
+            logger.info("%s.%s backfilled %d rows", table_name, column_name, filled)
+        if not filled:
+            break
+
+    if pending:
+        with engine.begin() as conn:
+            for finish in finishing:
+                conn.execute(text(finish))
+            conn.execute(text(f"COMMENT ON COLUMN {table_name}.{column_name} IS NULL"))
+    if not not_null:
+        return
+    with engine.connect() as conn:
+        if conn.scalar(text(f"SELECT EXISTS (SELECT FROM {table_name} WHERE {column_name} IS NULL)")):
+            logger.warning("%s.%s still has NULLs after %d passes, NOT NULL not enforced yet",
+                           table_name, column_name, _BACKFILL_MAX_PASSES)
+            return
+    # SET NOT NULL skips its full-table scan (under an exclusive lock) when a validated
+    # CHECK proves it; VALIDATE scans without blocking writes
+    constraint = f"{table_name}_{column_name}_not_null"
+    with engine.begin() as conn:
+        conn.execute(text(f"ALTER TABLE {table_name} DROP CONSTRAINT IF EXISTS {constraint}"))
+        conn.execute(text(f"ALTER TABLE {table_name} ADD CONSTRAINT {constraint} "
+                          f"CHECK ({column_name} IS NOT NULL) NOT VALID"))
+    with engine.begin() as conn:
+        conn.execute(text(f"ALTER TABLE {table_name} VALIDATE CONSTRAINT {constraint}"))
+    with engine.begin() as conn:
+        conn.execute(text(f"ALTER TABLE {table_name} ALTER COLUMN {column_name} SET NOT NULL"))
+        conn.execute(text(f"ALTER TABLE {table_name} DROP CONSTRAINT {constraint}"))
+
+
+def add_foreign_key(engine: Engine, table_name: str, name: str, definition: str) -> None:
+    """Add a FOREIGN KEY constraint unless the table has one of that name: NOT VALID first
+    (catalog only), then VALIDATE, which checks the existing rows without blocking writes."""
+    with engine.begin() as conn:
+        if conn.scalar(text("SELECT EXISTS (SELECT FROM pg_constraint "
+                            "WHERE conrelid = to_regclass(:table_name) AND conname = :name)"),
+                       {"table_name": table_name, "name": name}):
+            return
+        conn.execute(text(f"ALTER TABLE {table_name} ADD CONSTRAINT {name} FOREIGN KEY {definition} NOT VALID"))
+    with engine.begin() as conn:
+        conn.execute(text(f"ALTER TABLE {table_name} VALIDATE CONSTRAINT {name}"))
+
+
+def _index_state(conn: Connection, name: str) -> bool | None:
+    """None when the index doesn't exist, else whether it is valid."""
+    return conn.scalar(text("SELECT indisvalid FROM pg_index WHERE indexrelid = to_regclass(:name)"),
+                       {"name": name})
+
+
+def _index_ddl(ddl: str, name: str, table_name: str, concurrently: bool) -> str:
+    """`ddl` (CREATE [UNIQUE] INDEX <name> ON <table> ...) renamed and retargeted (a partition)."""
+    unique, _, _ = _INDEX_HEAD.match(ddl).groups()
+    target = f"{table_name} " if concurrently else f"ONLY {table_name} "
+    return _INDEX_HEAD.sub(f"CREATE {unique or ''}INDEX {'CONCURRENTLY ' if concurrently else ''}IF NOT EXISTS "
+                           f"{name} ON {target}", ddl)
+
+
+def create_index_concurrently(engine: Engine, ddl: str) -> None:
+    """Build a missing index, given as `CREATE [UNIQUE] INDEX <name> ON <table> ...`,
+    without blocking writes.
+
+    A build that failed half-way leaves an invalid index; it is dropped and rebuilt.
+    Partitioned tables can't build CONCURRENTLY: the parent index is created ON ONLY the
+    parent (catalog only), each partition's index is built concurrently and attached,
+    and the parent index turns valid once every partition has one.
+    """
+    _, name, table_name = _INDEX_HEAD.match(ddl).groups()
+    with engine.connect() as conn:
+        conn = conn.execution_options(isolation_level="AUTOCOMMIT")
+        state = _index_state(conn, name)
+        if state:
+            return
+        partitioned = conn.scalar(text("SELECT relkind = 'p' FROM pg_class WHERE oid = to_regclass(:name)"),
+                                  {"name": table_name})
+        logger.info("creating index %s", name)
+        if not partitioned:
+            if state is False:
+                conn.execute(text(f"DROP INDEX CONCURRENTLY {name}"))
+            conn.execute(text(_index_ddl(ddl, name, table_name, concurrently=True)))
+            return
+
+        conn.execute(text(_index_ddl(ddl, name, table_name, concurrently=False)))
+        result = conn.execute(text(
+            "SELECT child.relname FROM pg_inherits JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE pg_inherits.inhparent = to_regclass(:name) AND NOT EXISTS ("
+            "SELECT FROM pg_inherits attached JOIN pg_index ON pg_index.indexrelid = attached.inhrelid "
+            "WHERE attached.inhparent = to_regclass(:index_name) AND pg_index.indrelid = child.oid)"
+        ), {"name": table_name, "index_name": name})
+        for (partition,) in result.tuples().all():
+            child_name = f"{name}_{partition.removeprefix(f'{table_name}_')}"[:63]
+            if _index_state(conn, child_name) is False:
+                conn.execute(text(f"DROP INDEX CONCURRENTLY {child_name}"))
+            conn.execute(text(_index_ddl(ddl, child_name, partition, concurrently=True)))
+            conn.execute(text(f"ALTER INDEX {name} ATTACH PARTITION {child_name}"))
+
+
+def drop_index_concurrently(engine: Engine, name: str) -> None:
+    with engine.connect() as conn:
+        conn = conn.execution_options(isolation_level="AUTOCOMMIT")
+        conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {name}"))
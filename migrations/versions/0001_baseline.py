@@ -0,0 +1,157 @@
+"""Baseline: the schema create_all built before the project had migrations.
+
+Databases created that way already have these tables and skip this revision's DDL;
+the following revisions upgrade them in place, whichever of the former boot-time
+upgrades (init_db) they had already been through.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# shared by two tables: created once, up front
+STATUS = postgresql.ENUM("PENDING", "WITHDRAWN", "IN_REVIEW", "SHORTLISTED", "ACCEPTED", "REJECTED",
+                         name="status_enums", create_type=False)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if sa.inspect(op.get_bind()).has_table("users"):
+        return
+
+    STATUS.create(op.get_bind())
+    op.create_table(
+        "users",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("email", sa.String(200), nullable=False),
+        sa.Column("username", sa.String(50), nullable=False),
+        sa.Column("pwd_hash", sa.String(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.Column("first_name", sa.String(50), nullable=False),
+        sa.Column("last_name", sa.String(50), nullable=False),
+        sa.Column("gender", sa.Enum("male", "female", "other", name="gender_enums"), nullable=True),
+        sa.Column("user_type", sa.Enum("producer", "label_staff", name="usertype_enums"), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("email"),
+        sa.UniqueConstraint("username"),
+    )
+    op.create_table(
+        "workspaces",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("name", sa.String(255), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "producer_profiles",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("user_id", sa.UUID(), nullable=False),
+        sa.Column("artist_name", sa.String(100), nullable=False),
+        sa.Column("music_genre", postgresql.ARRAY(sa.String()), nullable=True),
+        sa.Column("bio", sa.Text(), nullable=True),
+        sa.Column("location", sa.String(100), nullable=True),
+        sa.Column("contact_email", sa.String(255), nullable=False),
+        sa.Column("social_links", postgresql.JSONB(), nullable=True),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("user_id"),
+    )
+    op.create_index("ix_producer_profiles_contact_email", "producer_profiles", ["contact_email"], unique=True)
+    op.create_table(
+        "labelstaff_profiles",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("user_id", sa.UUID(), nullable=False),
+        sa.Column("bio", sa.Text(), nullable=True),
+        sa.Column("location", sa.String(100), nullable=True),
+        sa.Column("contact_email", sa.String(255), nullable=False),
+        sa.Column("social_links", postgresql.JSONB(), nullable=True),
+        sa.Column("position", sa.String(50), nullable=True),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("user_id"),
+    )
+    op.create_index("ix_labelstaff_profiles_contact_email", "labelstaff_profiles", ["contact_email"], unique=True)
+    op.create_table(
+        "tracks",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("producer_profile_id", sa.UUID(), nullable=False),
+        sa.Column("title", sa.String(100), nullable=False),
+        sa.Column("streaming_url", sa.Text(), nullable=False),
+        sa.Column("tempo", sa.Float(), nullable=False),
+        sa.Column("genre", postgresql.ARRAY(sa.String()), nullable=False),
+        sa.Column("key", sa.String(3), nullable=True),
+        sa.Column("extra_metadata", postgresql.JSONB(), nullable=False),
+        sa.ForeignKeyConstraint(["producer_profile_id"], ["producer_profiles.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_tracks_tempo", "tracks", ["tempo"])
+    op.create_index("ix_tracks_key", "tracks", ["key"])
+    op.create_table(
+        "memberships",
+        sa.Column("labelstaff_profile_id", sa.UUID(), nullable=False),
+        sa.Column("workspace_id", sa.UUID(), nullable=False),
+        sa.Column("role", sa.Enum("admin", "agent", name="labelrole_enums"), nullable=False),
+        sa.ForeignKeyConstraint(["labelstaff_profile_id"], ["labelstaff_profiles.id"]),
+        sa.ForeignKeyConstraint(["workspace_id"], ["workspaces.id"]),
+        sa.PrimaryKeyConstraint("labelstaff_profile_id", "workspace_id"),
+    )
+    op.create_table(
+        "submissions",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("producer_profile_id", sa.UUID(), nullable=False),
+        sa.Column("workspace_id", sa.UUID(), nullable=False),
+        sa.Column("title", sa.String(100), nullable=False),
+        sa.Column("streaming_url", sa.Text(), nullable=False),
+        sa.Column("tempo", sa.Float(), nullable=False),
+        sa.Column("genre", postgresql.ARRAY(sa.String()), nullable=False),
+        sa.Column("key", sa.String(3), nullable=True),
+        sa.Column("extra_metadata", postgresql.JSONB(), nullable=False),
+        sa.Column("status", STATUS, nullable=False),
+        sa.ForeignKeyConstraint(["producer_profile_id"], ["producer_profiles.id"]),
+        sa.ForeignKeyConstraint(["workspace_id"], ["workspaces.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_submissions_tempo", "submissions", ["tempo"])
+    op.create_index("ix_submissions_key", "submissions", ["key"])
+    op.create_table(
+        "submission_events",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("status", STATUS, nullable=False),
+        sa.Column("event_date", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.Column("submission_id", sa.UUID(), nullable=False),
+        sa.Column("workspace_id", sa.UUID(), nullable=False),
+        sa.Column("producer_profile_id", sa.UUID(), nullable=True),
+        sa.Column("labelstaff_profile_id", sa.UUID(), nullable=True),
+        sa.CheckConstraint(
+            "(producer_profile_id IS NOT NULL AND labelstaff_profile_id IS NULL) OR "
+            "(producer_profile_id IS NULL AND labelstaff_profile_id IS NOT NULL)",
+            name="exactly_one_actor_provided"
+        ),
+        sa.ForeignKeyConstraint(["submission_id"], ["submissions.id"]),
+        sa.ForeignKeyConstraint(["workspace_id"], ["workspaces.id"]),
+        sa.ForeignKeyConstraint(["producer_profile_id"], ["producer_profiles.id"]),
+        sa.ForeignKeyConstraint(["labelstaff_profile_id"], ["labelstaff_profiles.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_submission_events_producer_profile_id", "submission_events", ["producer_profile_id"])
+    op.create_index("ix_submission_events_labelstaff_profile_id", "submission_events", ["labelstaff_profile_id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in ("submission_events", "submissions", "memberships", "tracks",
+                  "labelstaff_profiles", "producer_profiles", "workspaces", "users"):
+        op.drop_table(table)
+    for enum in ("status_enums", "labelrole_enums", "usertype_enums", "gender_enums"):
+        op.execute(f"DROP TYPE {enum}")
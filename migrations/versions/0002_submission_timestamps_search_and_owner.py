@@ -0,0 +1,163 @@
+"""Submission timestamps, search document and event owner; review latency sketches.
+
+submissions gains created_at, last_transition_at, first_reviewed_at and search_vector
+(kept by a trigger), submission_events gains txid and owner_producer_profile_id (filled
+by a trigger for writers that don't set it). All of them are added nullable and filled
+in batches (migrations/online.py), the owner's foreign key is validated afterwards; the
+first reviews seed review_latency_buckets.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 10:05:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy import text
+
+from migrations.online import add_backfilled_column, add_foreign_key, backfill
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, Sequence[str], None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column, type, server default, NOT NULL once filled)
+COLUMNS = (
+    ("submissions", "created_at", "TIMESTAMP WITHOUT TIME ZONE", "now()", True),
+    ("submissions", "last_transition_at", "TIMESTAMP WITHOUT TIME ZONE", "now()", True),
+    ("submissions", "first_reviewed_at", "TIMESTAMP WITHOUT TIME ZONE", None, False),
+    ("submissions", "search_vector", "TSVECTOR", None, False),
+    # events that predate it sort first in incremental sync
+    ("submission_events", "txid", "BIGINT", "(pg_current_xact_id()::text::bigint)", True),
+    ("submission_events", "owner_producer_profile_id", "UUID", None, True),
+)
+
+# (table, column) -> the batch statement, then statements run once after the last batch
+BACKFILLS = {
+    ("submissions", "created_at"): (
+        "WITH batch AS (SELECT id FROM submissions "
+        "WHERE id > :last_id AND created_at IS NULL ORDER BY id LIMIT :batch_size) "
+        "UPDATE submissions SET created_at = coalesce((SELECT min(event_date) FROM submission_events "
+        "WHERE submission_events.submission_id = submissions.id), now()) "
+        "FROM batch WHERE submissions.id = batch.id RETURNING submissions.id",
+    ),
+    ("submissions", "last_transition_at"): (
+        "WITH batch AS (SELECT id FROM submissions "
+        "WHERE id > :last_id AND last_transition_at IS NULL ORDER BY id LIMIT :batch_size) "
+        "UPDATE submissions SET last_transition_at = coalesce((SELECT max(event_date) FROM submission_events "
+        "WHERE submission_events.submission_id = submissions.id), created_at) "
+        "FROM batch WHERE submissions.id = batch.id RETURNING submissions.id",
+    ),
+    ("submissions", "first_reviewed_at"): (
+        # only submissions that were reviewed: the others stay NULL
+        "WITH batch AS (SELECT id FROM submissions "
+        "WHERE id > :last_id AND first_reviewed_at IS NULL AND EXISTS (SELECT FROM submission_events "
+        "WHERE submission_events.submission_id = submissions.id AND submission_events.status = 'IN_REVIEW') "
+        "ORDER BY id LIMIT :batch_size) "
+        "UPDATE submissions SET first_reviewed_at = (SELECT min(event_date) FROM submission_events "
+        "WHERE submission_events.submission_id = submissions.id AND submission_events.status = 'IN_REVIEW') "
+        "FROM batch WHERE submissions.id = batch.id RETURNING submissions.id",
+        # seed the response-time sketches from the history (bucket: app.sketch.bucket_expression)
+        "INSERT INTO review_latency_buckets (workspace_id, period_start, bucket, reviews, latency_seconds) "
+        "SELECT workspace_id, period_start, "
+        "CAST(ceil(ln(greatest(latency, 1.0)) / CAST(0.040005334613699206 AS FLOAT)) AS SMALLINT), "
+        "count(*), sum(latency) "
+        "FROM (SELECT workspace_id, date_trunc('month', first_reviewed_at)::date AS period_start, "
+        "extract(epoch FROM first_reviewed_at - created_at) AS latency "
+        "FROM submissions WHERE first_reviewed_at IS NOT NULL) AS reviewed "
+        "GROUP BY 1, 2, 3 ON CONFLICT DO NOTHING",
+    ),
+    # rewriting title fires the trigger that computes the search document
+    ("submissions", "search_vector"): (
+        "WITH batch AS (SELECT id FROM submissions "
+        "WHERE id > :last_id AND search_vector IS NULL ORDER BY id LIMIT :batch_size) "
+        "UPDATE submissions SET title = submissions.title FROM batch "
+        "WHERE submissions.id = batch.id RETURNING submissions.id",
+    ),
+    ("submission_events", "txid"): (
+        "WITH batch AS (SELECT id FROM submission_events "
+        "WHERE id > :last_id AND txid IS NULL ORDER BY id LIMIT :batch_size) "
+        "UPDATE submission_events SET txid = 0 FROM batch "
+        "WHERE submission_events.id = batch.id RETURNING submission_events.id",
+    ),
+    ("submission_events", "owner_producer_profile_id"): (
+        "WITH batch AS (SELECT id FROM submission_events "
+        "WHERE id > :last_id AND owner_producer_profile_id IS NULL ORDER BY id LIMIT :batch_size) "
+        "UPDATE submission_events SET owner_producer_profile_id = submissions.producer_profile_id "
+        "FROM batch, submissions "
+        "WHERE submission_events.id = batch.id AND submissions.id = submission_events.submission_id "
+        "RETURNING submission_events.id",
+    ),
+}
+
+SEARCH_DOCUMENT = (
+    "setweight(to_tsvector('simple'::regconfig, title), 'A') || "
+    "setweight(to_tsvector('simple'::regconfig, submission_genre_text(genre)), 'B') || "
+    "setweight(to_tsvector('simple'::regconfig, coalesce(extra_metadata ->> 'vibe', '') || ' ' || "
+    "coalesce(extra_metadata ->> 'tags', '') || ' ' || coalesce(extra_metadata ->> 'description', '')), 'C')"
+)
+
+# functions and triggers, created once the columns they write exist
+TRIGGERS = (
+    "CREATE OR REPLACE FUNCTION submission_genre_text(genre varchar[]) RETURNS text "
+    "LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$ SELECT coalesce(array_to_string(genre, ' '), '') $$",
+    "CREATE OR REPLACE FUNCTION submission_search_vector() RETURNS trigger LANGUAGE plpgsql AS $$ "
+    f"BEGIN NEW.search_vector := (SELECT {SEARCH_DOCUMENT} FROM (SELECT (NEW).*) AS submission); "
+    "RETURN NEW; END $$",
+    "CREATE OR REPLACE TRIGGER submissions_search_vector BEFORE INSERT OR UPDATE OF title, genre, extra_metadata "
+    "ON submissions FOR EACH ROW EXECUTE FUNCTION submission_search_vector()",
+    "CREATE OR REPLACE FUNCTION fill_submission_event_owner() RETURNS trigger LANGUAGE plpgsql AS $$ "
+    "BEGIN IF NEW.owner_producer_profile_id IS NULL THEN "
+    "SELECT producer_profile_id INTO NEW.owner_producer_profile_id FROM submissions WHERE id = NEW.submission_id; "
+    "END IF; RETURN NEW; END $$",
+    "CREATE OR REPLACE TRIGGER submission_events_fill_owner BEFORE INSERT ON submission_events "
+    "FOR EACH ROW EXECUTE FUNCTION fill_submission_event_owner()",
+    "CREATE OR REPLACE FUNCTION notify_submission_events() RETURNS trigger LANGUAGE plpgsql AS $$ "
+    "BEGIN PERFORM pg_notify('submission_events', json_build_object("
+    "'workspace_id', changed.workspace_id, 'producer_profile_id', changed.producer_profile_id, "
+    "'txid', pg_current_xact_id()::text::bigint)::text) "
+    "FROM (SELECT DISTINCT workspace_id, owner_producer_profile_id AS producer_profile_id FROM new_events) AS changed; "
+    "RETURN NULL; END $$",
+    "CREATE OR REPLACE TRIGGER submission_events_notify AFTER INSERT ON submission_events "
+    "REFERENCING NEW TABLE AS new_events FOR EACH STATEMENT EXECUTE FUNCTION notify_submission_events()",
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(
+        "CREATE TABLE IF NOT EXISTS review_latency_buckets ("
+        "workspace_id UUID NOT NULL REFERENCES workspaces (id) ON DELETE CASCADE, "
+        "period_start DATE NOT NULL, "
+        "bucket SMALLINT NOT NULL, "
+        "reviews BIGINT NOT NULL, "
+        "latency_seconds FLOAT NOT NULL, "
+        "PRIMARY KEY (workspace_id, period_start, bucket))"
+    )
+    with op.get_context().autocommit_block():
+        engine = op.get_bind().engine
+        for table_name, column_name, column_type, default, _ in COLUMNS:
+            add_backfilled_column(engine, table_name, column_name, column_type, default)
+        with engine.begin() as conn:
+            for statement in TRIGGERS:
+                conn.execute(text(statement))
+        for table_name, column_name, _, _, not_null in COLUMNS:
+            backfill(engine, table_name, column_name, BACKFILLS[(table_name, column_name)], not_null)
+        add_foreign_key(engine, "submission_events", "submission_events_owner_producer_profile_id_fkey",
+                        "(owner_producer_profile_id) REFERENCES producer_profiles (id)")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS submission_events_notify ON submission_events")
+    op.execute("DROP TRIGGER IF EXISTS submission_events_fill_owner ON submission_events")
+    op.execute("DROP TRIGGER IF EXISTS submissions_search_vector ON submissions")
+    for function in ("notify_submission_events", "fill_submission_event_owner", "submission_search_vector"):
+        op.execute(f"DROP FUNCTION IF EXISTS {function}()")
+    for table_name, column_name, *_ in reversed(COLUMNS):
+        op.execute(f"ALTER TABLE {table_name} DROP COLUMN IF EXISTS {column_name}")
+    op.execute("DROP FUNCTION IF EXISTS submission_genre_text(varchar[])")
+    op.execute("DROP TABLE IF EXISTS review_latency_buckets")
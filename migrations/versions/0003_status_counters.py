@@ -0,0 +1,133 @@
+"""Submission counts per status, per workspace and per producer.
+
+The counter tables are kept by statement-level triggers on submissions; the counts of
+the submissions that predate them are seeded in chunks of
+settings.counter_reconcile_batch_size keys, one short transaction each. A table stays
+marked pending (its comment) until seeded, so an interrupted run seeds it again.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 10:10:00.000000
+
+"""
+from typing import Sequence, Union
+from uuid import UUID
+
+from alembic import op
+from sqlalchemy import text
+
+from app.settings import settings
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, Sequence[str], None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PENDING_COMMENT = "counts pending reconciliation"
+
+# (counter table, submissions column, owner table)
+COUNTERS = (("workspace_status_counts", "workspace_id", "workspaces"),
+            ("producer_status_counts", "producer_profile_id", "producer_profiles"))
+
+
+def _apply_status_deltas(changes: str) -> str:
+    """Add the per-(key, status) sum of `changes` to both counter tables, keys in order."""
+    return "".join(
+        f"INSERT INTO {table} ({column}, status, count) "
+        f"SELECT {column}, status, sum(delta) FROM ({changes.format(column=column)}) AS changes "
+        f"GROUP BY {column}, status HAVING sum(delta) <> 0 ORDER BY {column}, status "
+        f"ON CONFLICT ({column}, status) DO UPDATE SET count = {table}.count + EXCLUDED.count; "
+        for table, column, _ in COUNTERS
+    )
+
+
+COUNT_FUNCTION = (
+    "CREATE OR REPLACE FUNCTION count_submission_statuses() RETURNS trigger LANGUAGE plpgsql AS $$ "
+    "BEGIN "
+    "IF TG_OP = 'INSERT' THEN "
+    + _apply_status_deltas("SELECT {column}, status, 1 AS delta FROM new_rows")
+    + "ELSIF TG_OP = 'UPDATE' THEN "
+    + _apply_status_deltas("SELECT {column}, status, -1 AS delta FROM old_rows "
+                           "UNION ALL SELECT {column}, status, 1 FROM new_rows")
+    + "ELSE "
+    + _apply_status_deltas("SELECT {column}, status, -1 AS delta FROM old_rows")
+    + "END IF; "
+    "RETURN NULL; "
+    "END $$"
+)
+TRIGGERS = (("insert", "NEW TABLE AS new_rows"),
+            ("update", "OLD TABLE AS old_rows NEW TABLE AS new_rows"),
+            ("delete", "OLD TABLE AS old_rows"))
+
+
+def _repair(table: str, column: str) -> str:
+    """Add (actual - stored) to the counters of the keys in (:after, :upto] that are off.
+
+    Both counts come from one statement snapshot, where they agree unless the counter is
+    unseeded; applying the difference as a delta keeps the increments the triggers commit
+    concurrently after that snapshot.
+    """
+    return (
+        f"INSERT INTO {table} ({column}, status, count) "
+        "SELECT coalesce(actual.key_id, stored.key_id), coalesce(actual.status, stored.status), "
+        "coalesce(actual.count, 0) - coalesce(stored.count, 0) "
+        f"FROM (SELECT {column} AS key_id, status, count(*) AS count FROM submissions "
+        f"WHERE {column} > :after AND {column} <= :upto GROUP BY {column}, status) AS actual "
+        f"FULL JOIN (SELECT {column} AS key_id, status, count FROM {table} "
+        f"WHERE {column} > :after AND {column} <= :upto) AS stored "
+        "ON actual.key_id = stored.key_id AND actual.status = stored.status "
+        "WHERE coalesce(actual.count, 0) - coalesce(stored.count, 0) <> 0 "
+        "ORDER BY 1, 2 "
+        f"ON CONFLICT ({column}, status) DO UPDATE SET count = {table}.count + EXCLUDED.count"
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, column, owner in COUNTERS:
+        op.execute(
+            f"DO $$ BEGIN IF to_regclass('{table}') IS NULL THEN "
+            f"CREATE TABLE {table} ("
+            f"{column} UUID NOT NULL REFERENCES {owner} (id) ON DELETE CASCADE, "
+            "status status_enums NOT NULL, "
+            "count BIGINT DEFAULT '0' NOT NULL, "
+            f"PRIMARY KEY ({column}, status)); "
+            f"COMMENT ON TABLE {table} IS '{PENDING_COMMENT}'; "
+            "END IF; END $$"
+        )
+    op.execute(COUNT_FUNCTION)
+    for operation, transition_tables in TRIGGERS:
+        op.execute(f"CREATE OR REPLACE TRIGGER submissions_count_{operation} AFTER {operation.upper()} ON submissions "
+                   f"REFERENCING {transition_tables} FOR EACH STATEMENT EXECUTE FUNCTION count_submission_statuses()")
+
+    # seeded after the commit of the above: every submission written from then on is
+    # counted by the triggers, the ones before by the repair
+    with op.get_context().autocommit_block():
+        engine = op.get_bind().engine
+        for table, column, owner in COUNTERS:
+            with engine.connect() as conn:
+                if conn.scalar(text("SELECT obj_description(to_regclass(:table_name), 'pg_class')"),
+                               {"table_name": table}) != PENDING_COMMENT:
+                    continue
+            after = UUID(int=0)
+            while True:
+                with engine.begin() as conn:
+                    key_ids = conn.execute(text(f"SELECT id FROM {owner} WHERE id > :after ORDER BY id LIMIT :batch_size"),
+                                           {"after": after, "batch_size": settings.counter_reconcile_batch_size}
+                                           ).scalars().all()
+                    if not key_ids:
+                        break
+                    conn.execute(text(_repair(table, column)), {"after": after, "upto": key_ids[-1]})
+                after = key_ids[-1]
+            with engine.begin() as conn:
+                conn.execute(text(f"COMMENT ON TABLE {table} IS NULL"))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for operation, _ in TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS submissions_count_{operation} ON submissions")
+    op.execute("DROP FUNCTION IF EXISTS count_submission_statuses()")
+    for table, _, _ in COUNTERS:
+        op.execute(f"DROP TABLE IF EXISTS {table}")
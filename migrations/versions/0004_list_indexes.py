@@ -0,0 +1,60 @@
+"""Workspace- and producer-scoped indexes for the lists, the queue, search and sync.
+
+Built CONCURRENTLY, after the backfills so those don't maintain them row by row; the
+single-column submission indexes they supersede are dropped afterwards.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 10:15:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from migrations.online import create_index_concurrently, drop_index_concurrently
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, Sequence[str], None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = (
+    "CREATE INDEX ix_submissions_genre ON submissions USING gin (genre)",
+    "CREATE INDEX ix_submissions_workspace_id_created_at_id ON submissions (workspace_id, created_at, id)",
+    "CREATE INDEX ix_submissions_workspace_id_tempo_id ON submissions (workspace_id, tempo, id)",
+    "CREATE INDEX ix_submissions_producer_profile_id_created_at_id ON submissions (producer_profile_id, created_at, id)",
+    "CREATE INDEX ix_submissions_workspace_id_status_last_transition_at "
+    "ON submissions (workspace_id, status, last_transition_at, id)",
+    "CREATE INDEX ix_submissions_search_vector ON submissions USING gin (search_vector)",
+    "CREATE INDEX ix_submissions_workspace_id_key ON submissions (workspace_id, key)",
+    "CREATE INDEX ix_submission_events_submission_id ON submission_events (submission_id)",
+    "CREATE INDEX ix_submission_events_owner_txid_id ON submission_events (owner_producer_profile_id, txid, id)",
+    "CREATE INDEX ix_submission_events_workspace_id_event_date_id ON submission_events (workspace_id, event_date, id)",
+    "CREATE INDEX ix_submission_events_workspace_id_txid_id ON submission_events (workspace_id, txid, id)",
+    "CREATE INDEX ix_submission_events_owner_event_date_id ON submission_events "
+    "(owner_producer_profile_id, event_date, id) "
+    "INCLUDE (status, submission_id, workspace_id, producer_profile_id, labelstaff_profile_id)",
+)
+
+# superseded by the workspace-scoped composites
+DROPPED_INDEXES = ("ix_submissions_tempo", "ix_submissions_key", "ix_submissions_workspace_id_status")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        engine = op.get_bind().engine
+        for ddl in INDEXES:
+            create_index_concurrently(engine, ddl)
+        for name in DROPPED_INDEXES:
+            drop_index_concurrently(engine, name)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index("ix_submissions_tempo", "submissions", ["tempo"])
+    op.create_index("ix_submissions_key", "submissions", ["key"])
+    for ddl in INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {ddl.split()[2]}")
@@ -0,0 +1,154 @@
+"""Monthly range partitions of submission_events.
+
+The unpartitioned table becomes submission_events_legacy, attached below the month after
+next (rows the running release writes meanwhile still fit it). Everything that reads the
+whole table runs first, without blocking writes: the (id, event_date) key is built
+CONCURRENTLY and a CHECK matching the partition bound is validated. The last transaction
+then only changes the catalog under its ACCESS EXCLUSIVE lock (bounded by
+settings.event_partition_lock_timeout_ms): the key replaces the primary key, the indexes
+are renamed so the parent's can take their names (ATTACH adopts them instead of building
+new ones) and the CHECK spares ATTACH its scan. Monthly partitions are created ahead by
+the app (app/partitions.py); until then the DEFAULT partition catches new rows.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18 10:20:00.000000
+
+"""
+from datetime import date
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy import text
+
+from app.settings import settings
+
+# revision identifiers, used by Alembic.
+revision: str = "0005"
+down_revision: Union[str, Sequence[str], None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+EVENTS_TABLE = "submission_events"
+LEGACY_PARTITION = f"{EVENTS_TABLE}_legacy"
+LEGACY_KEY = f"{LEGACY_PARTITION}_pkey"
+LEGACY_BOUND = f"{LEGACY_PARTITION}_bound"
+
+PARENT = (
+    f"CREATE TABLE {EVENTS_TABLE} ("
+    "id UUID NOT NULL, "
+    "status status_enums NOT NULL, "
+    "event_date TIMESTAMP WITHOUT TIME ZONE DEFAULT now() NOT NULL, "
+    "txid BIGINT DEFAULT (pg_current_xact_id()::text::bigint) NOT NULL, "
+    "submission_id UUID NOT NULL REFERENCES submissions (id), "
+    "workspace_id UUID NOT NULL REFERENCES workspaces (id), "
+    "producer_profile_id UUID REFERENCES producer_profiles (id), "
+    "labelstaff_profile_id UUID REFERENCES labelstaff_profiles (id), "
+    "owner_producer_profile_id UUID NOT NULL REFERENCES producer_profiles (id), "
+    "PRIMARY KEY (id, event_date), "
+    "CONSTRAINT exactly_one_actor_provided CHECK ("
+    "(producer_profile_id IS NOT NULL AND labelstaff_profile_id IS NULL) OR "
+    "(producer_profile_id IS NULL AND labelstaff_profile_id IS NOT NULL))"
+    ") PARTITION BY RANGE (event_date)"
+)
+# created while the parent has no partition yet (catalog only); ATTACH adopts the legacy
+# table's matching indexes
+PARENT_INDEXES = (
+    "CREATE INDEX ix_submission_events_submission_id ON submission_events (submission_id)",
+    "CREATE INDEX ix_submission_events_producer_profile_id ON submission_events (producer_profile_id)",
+    "CREATE INDEX ix_submission_events_labelstaff_profile_id ON submission_events (labelstaff_profile_id)",
+    "CREATE INDEX ix_submission_events_owner_txid_id ON submission_events (owner_producer_profile_id, txid, id)",
+    "CREATE INDEX ix_submission_events_workspace_id_event_date_id ON submission_events (workspace_id, event_date, id)",
+    "CREATE INDEX ix_submission_events_workspace_id_txid_id ON submission_events (workspace_id, txid, id)",
+    "CREATE INDEX ix_submission_events_owner_event_date_id ON submission_events "
+    "(owner_producer_profile_id, event_date, id) "
+    "INCLUDE (status, submission_id, workspace_id, producer_profile_id, labelstaff_profile_id)",
+)
+PARENT_TRIGGERS = (
+    f"CREATE TABLE {EVENTS_TABLE}_default PARTITION OF {EVENTS_TABLE} DEFAULT",
+    f"CREATE TRIGGER submission_events_fill_owner BEFORE INSERT ON {EVENTS_TABLE} "
+    "FOR EACH ROW EXECUTE FUNCTION fill_submission_event_owner()",
+    f"CREATE TRIGGER submission_events_notify AFTER INSERT ON {EVENTS_TABLE} "
+    "REFERENCING NEW TABLE AS new_events FOR EACH STATEMENT EXECUTE FUNCTION notify_submission_events()",
+)
+
+
+def _add_months(month: date, months: int) -> date:
+    index = month.month - 1 + months
+    return date(month.year + index // 12, index % 12 + 1, 1)
+
+
+def _kind(conn) -> str | None:
+    return conn.scalar(text("SELECT relkind FROM pg_class WHERE oid = to_regclass(:table_name)"),
+                       {"table_name": EVENTS_TABLE})
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        engine = op.get_bind().engine
+        with engine.connect() as conn:
+            conn = conn.execution_options(isolation_level="AUTOCOMMIT")
+            if _kind(conn) != "r":
+                return
+            key_valid = conn.scalar(text("SELECT indisvalid FROM pg_index WHERE indexrelid = to_regclass(:name)"),
+                                    {"name": LEGACY_KEY})
+            if key_valid is False:
+                conn.execute(text(f"DROP INDEX CONCURRENTLY {LEGACY_KEY}"))
+            conn.execute(text(
+                f"CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS {LEGACY_KEY} ON {EVENTS_TABLE} (id, event_date)"
+            ))
+            current_month = conn.scalar(text("SELECT date_trunc('month', now())::date"))
+            newest = conn.scalar(text(f"SELECT max(event_date) FROM {EVENTS_TABLE}"))
+        end = _add_months(current_month, 2)
+        if newest is not None:
+            end = max(end, _add_months(newest.date().replace(day=1), 1))
+
+        lock_timeout = f"SET LOCAL lock_timeout = '{settings.event_partition_lock_timeout_ms}ms'"
+        with engine.begin() as conn:
+            conn.execute(text(lock_timeout))
+            conn.execute(text(
+                f"ALTER TABLE {EVENTS_TABLE} DROP CONSTRAINT IF EXISTS {LEGACY_BOUND}, ADD CONSTRAINT {LEGACY_BOUND} "
+                f"CHECK (event_date IS NOT NULL AND event_date < '{end.isoformat()}') NOT VALID"
+            ))
+        with engine.begin() as conn:
+            conn.execute(text(f"ALTER TABLE {EVENTS_TABLE} VALIDATE CONSTRAINT {LEGACY_BOUND}"))
+
+        with engine.begin() as conn:
+            conn.execute(text(lock_timeout))
+            conn.execute(text(f"LOCK TABLE {EVENTS_TABLE} IN ACCESS EXCLUSIVE MODE"))
+            if _kind(conn) != "r":
+                return
+            conn.execute(text(f"ALTER TABLE {EVENTS_TABLE} RENAME TO {LEGACY_PARTITION}"))
+            # partitions take the parent's row triggers; a statement trigger with a transition
+            # table isn't allowed on a partition at all
+            conn.execute(text(f"DROP TRIGGER IF EXISTS submission_events_notify ON {LEGACY_PARTITION}"))
+            conn.execute(text(f"DROP TRIGGER IF EXISTS submission_events_fill_owner ON {LEGACY_PARTITION}"))
+            # the parent's key must include the partition column
+            conn.execute(text(f"ALTER TABLE {LEGACY_PARTITION} DROP CONSTRAINT IF EXISTS {EVENTS_TABLE}_pkey"))
+            conn.execute(text(f"ALTER TABLE {LEGACY_PARTITION} ADD CONSTRAINT {LEGACY_KEY} "
+                              f"PRIMARY KEY USING INDEX {LEGACY_KEY}"))
+            indexes = conn.execute(text(
+                "SELECT indexname FROM pg_indexes WHERE tablename = :table_name AND indexname <> :key"
+            ), {"table_name": LEGACY_PARTITION, "key": LEGACY_KEY})
+            for (index_name,) in indexes.tuples().all():
+                conn.execute(text(f"ALTER INDEX {index_name} RENAME TO {index_name}_legacy"))
+
+            conn.execute(text(PARENT))
+            for ddl in PARENT_INDEXES:
+                conn.execute(text(ddl))
+            if not conn.scalar(text(f"SELECT EXISTS (SELECT FROM {LEGACY_PARTITION})")):
+                conn.execute(text(f"DROP TABLE {LEGACY_PARTITION}"))
+            else:
+                conn.execute(text(
+                    f"ALTER TABLE {EVENTS_TABLE} ATTACH PARTITION {LEGACY_PARTITION} "
+                    f"FOR VALUES FROM (MINVALUE) TO ('{end.isoformat()}')"
+                ))
+                conn.execute(text(f"ALTER TABLE {LEGACY_PARTITION} DROP CONSTRAINT {LEGACY_BOUND}"))
+            for ddl in PARENT_TRIGGERS:
+                conn.execute(text(ddl))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    raise NotImplementedError("submission_events can't be turned back into a single table in place")
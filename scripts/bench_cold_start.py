@@ -0,0 +1,67 @@
+"""Cold-start benchmark: time from process exec to the first 200 on /api/.
+
+Run from the repo root with a configured .env (and a reachable database):
+
+    uv run python scripts/bench_cold_start.py --runs 5
+
+Each run spawns a fresh uvicorn process, polls /api/ until it answers 200,
+then reads the server-side startup milestones from /api/metrics.
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+
+
+def wait_for_200(url: str, timeout: float) -> float:
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        try:
+            with urllib.request.urlopen(url, timeout=1) as response:
+                if response.status == 200:
+                    return time.perf_counter()
+        except (urllib.error.URLError, ConnectionError, TimeoutError):
+            pass
+        time.sleep(0.005)
+    raise TimeoutError(f"{url} did not answer 200 within {timeout}s")
+
+
+def run_once(port: int, timeout: float) -> dict:
+    base_url = f"http://127.0.0.1:{port}/api"
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning"],
+    )
+    try:
+        first_200 = wait_for_200(f"{base_url}/", timeout)
+        with urllib.request.urlopen(f"{base_url}/metrics", timeout=5) as response:
+            server_startup = json.load(response)["startup"]
+        return {"client_first_200_ms": (first_200 - started) * 1000, **server_startup}
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    args = parser.parse_args()
+
+    results = [run_once(args.port, args.timeout) for _ in range(args.runs)]
+    for i, result in enumerate(results, start=1):
+        print(f"run {i}: first 200 after {result['client_first_200_ms']:.0f} ms "
+              f"(server ready {result['ready_ms']:.0f} ms, first response {result['first_response_ms']:.0f} ms)")
+
+    samples = [result["client_first_200_ms"] for result in results]
+    print(f"exec -> first 200 on /api/: min {min(samples):.0f} ms, "
+          f"median {statistics.median(samples):.0f} ms, max {max(samples):.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""Partitioned submission_events benchmark: insert and recent-range latency as history grows.
+
+Run from the repo root with a configured .env (and a reachable database):
+
+    uv run python scripts/bench_event_partitions.py --rows 10000000 --months 36
+
+Creates the tables in a throwaway Postgres schema (bench_event_partitions, dropped at
+the end unless --keep), with monthly partitions covering --months of history, then
+grows the event history in steps up to --rows events spread evenly over that span.
+After each step (and an ANALYZE) it reports the median latency of:
+
+  insert:      one event INSERT, committed (as the workflow writes them)
+  first page:  newest 50 events of one workspace (list_label_submission_events)
+  next page:   the page after it, through its cursor (pruned to the partitions it reaches)
+  last 7 days: count of the workspace's events of the past week
+
+With partitioning these should stay flat while the history grows; only the number of
+partitions grows, not the size of the indexes that a recent-range query touches.
+"""
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+
+from sqlalchemy import func, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.database import Base
+from app.models.models import ProducerProfile, Status, Submission, SubmissionEvent, User, UserType, Workspace
+from app.partitions import add_months, create_month_partition, ensure_partitions
+from app.services.submissions import SubmissionQueryService
+from app.settings import settings
+
+
+SCHEMA = "bench_event_partitions"
+WORKSPACES = 20
+SUBMISSIONS = 2000
+SEED_CHUNK = 1_000_000
+
+# events for numbered submissions, dated evenly over the last :months months
+_SEED_EVENTS = (
+    "INSERT INTO submission_events (id, status, event_date, submission_id, workspace_id, "
+    "producer_profile_id, owner_producer_profile_id) "
+    "SELECT gen_random_uuid(), 'PENDING', now() - random() * make_interval(0, :months), "
+    "numbered.id, numbered.workspace_id, numbered.producer_profile_id, numbered.producer_profile_id "
+    "FROM generate_series(1, :rows) AS g "
+    "JOIN (SELECT id, workspace_id, producer_profile_id, row_number() OVER (ORDER BY id) - 1 AS n FROM submissions) "
+    "AS numbered ON numbered.n = g % :submissions"
+)
+
+
+async def seed_base(session: AsyncSession) -> tuple[uuid.UUID, list[uuid.UUID], list[uuid.UUID]]:
+    user_id, producer_id = uuid.uuid4(), uuid.uuid4()
+    workspace_ids = [uuid.uuid4() for _ in range(WORKSPACES)]
+    await session.execute(insert(User).values(id=user_id, email=f"{user_id}@bench.local", username=user_id.hex[:20],
+                                              pwd_hash="-", first_name="Bench", last_name="User",
+                                              user_type=UserType.producer))
+    await session.execute(insert(ProducerProfile).values(id=producer_id, user_id=user_id, artist_name="Bench",
+                                                         contact_email=f"{user_id}@bench.local"))
+    await session.execute(insert(Workspace), [{"id": workspace_id, "name": f"Bench {i}"}
+                                              for i, workspace_id in enumerate(workspace_ids)])
+    submission_ids = [uuid.uuid4() for _ in range(SUBMISSIONS)]
+    await session.execute(insert(Submission), [
+        {"id": submission_id, "producer_profile_id": producer_id, "workspace_id": workspace_ids[i % WORKSPACES],
+         "title": f"Bench {i}", "streaming_url": f"https://example.com/{i}", "tempo": 120, "status": Status.PENDING}
+        for i, submission_id in enumerate(submission_ids)
+    ])
+    return producer_id, workspace_ids, submission_ids
+
+
+async def grow(engine, rows: int, months: int) -> None:
+    while rows > 0:
+        chunk = min(rows, SEED_CHUNK)
+        async with engine.begin() as conn:
+            await conn.execute(text(_SEED_EVENTS), {"rows": chunk, "months": months, "submissions": SUBMISSIONS})
+        rows -= chunk
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.execute(text("VACUUM ANALYZE submission_events"))
+
+
+async def median_ms(fn, runs: int) -> float:
+    await fn()
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        await fn()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+async def measure(engine, workspace_id: uuid.UUID, producer_id: uuid.UUID, submission_id: uuid.UUID,
+                  runs: int) -> dict:
+    async def insert_event() -> None:
+        async with engine.begin() as conn:
+            await conn.execute(insert(SubmissionEvent).values(
+                status=Status.PENDING, submission_id=submission_id, workspace_id=workspace_id,
+                producer_profile_id=producer_id, owner_producer_profile_id=producer_id,
+            ))
+
+    async with AsyncSession(engine) as session:
+        service = SubmissionQueryService(session)
+        _, cursor = await service.list_label_submission_events(workspace_id, None, 50)
+
+        async def first_page() -> None:
+            await service.list_label_submission_events(workspace_id, None, 50)
+
+        async def next_page() -> None:
+            await service.list_label_submission_events(workspace_id, cursor, 50)
+
+        async def last_week() -> None:
+            await session.scalar(select(func.count()).select_from(SubmissionEvent).where(
+                SubmissionEvent.workspace_id == workspace_id,
+                SubmissionEvent.event_date >= func.now() - func.make_interval(0, 0, 1)))
+
+        return {
+            "insert": await median_ms(insert_event, runs),
+            "first page": await median_ms(first_page, runs),
+            "next page": await median_ms(next_page, runs),
+            "last 7 days": await median_ms(last_week, runs),
+        }
+
+
+async def main(rows: int, months: int, runs: int, keep: bool) -> None:
+    engine = create_async_engine(settings.database_url, connect_args={"options": f"-c search_path={SCHEMA}"})
+    try:
+        async with engine.begin() as conn:
+            await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+            await conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+            await conn.run_sync(Base.metadata.create_all)
+            await ensure_partitions(conn, settings.event_partitions_ahead)
+            current_month = await conn.scalar(text("SELECT date_trunc('month', now())::date"))
+            for offset in range(1, months + 1):
+                await create_month_partition(conn, add_months(current_month, -offset))
+        async with AsyncSession(engine) as session:
+            producer_id, workspace_ids, submission_ids = await seed_base(session)
+            await session.commit()
+
+        seeded = 0
+        for step in (rows // 10, rows // 4, rows // 2, rows):
+            await grow(engine, step - seeded, months)
+            seeded = step
+            result = await measure(engine, workspace_ids[0], producer_id, submission_ids[0], runs)
+            print(f"{seeded:>11,} events: " + ", ".join(f"{name} {ms:.2f} ms" for name, ms in result.items()))
+    finally:
+        if not keep:
+            async with engine.begin() as conn:
+                await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=10_000_000, help="events at the last step")
+    parser.add_argument("--months", type=int, default=36, help="months of history the events are spread over")
+    parser.add_argument("--runs", type=int, default=50)
+    parser.add_argument("--keep", action="store_true", help="keep the bench_event_partitions schema")
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.months, args.runs, args.keep))
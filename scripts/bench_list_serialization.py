@@ -0,0 +1,101 @@
+"""List serialization benchmark: ORM entities vs column rows for a 10k-row response.
+
+Run from the repo root with a configured .env (and a reachable database):
+
+    uv run python scripts/bench_list_serialization.py --rows 10000 --runs 5
+
+Seeds one workspace with N submissions inside a transaction that is rolled back at
+the end, then builds the response body both ways:
+
+  before: select(Submission) -> ORM entities -> validate through SubmissionPublic
+          (from_attributes) -> dump to dicts -> stdlib json
+  after:  select(public columns) -> row tuples -> cached TypeAdapter dump_json
+
+and reports median latency and peak traced allocations (tracemalloc) for each.
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+import tracemalloc
+import uuid
+
+from pydantic import TypeAdapter
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import engine
+from app.models.models import ProducerProfile, Status, Submission, User, UserType, Workspace
+from app.schemas.schemas import SubmissionPublic
+from app.serialization import RowsJSONResponse, public_columns
+
+
+async def seed(session: AsyncSession, rows: int) -> uuid.UUID:
+    user_id, producer_id, workspace_id = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    await session.execute(insert(User).values(id=user_id, email=f"{user_id}@bench.local", username=user_id.hex[:20],
+                                              pwd_hash="-", first_name="Bench", last_name="User",
+                                              user_type=UserType.producer))
+    await session.execute(insert(ProducerProfile).values(id=producer_id, user_id=user_id, artist_name="Bench",
+                                                         contact_email=f"{user_id}@bench.local"))
+    await session.execute(insert(Workspace).values(id=workspace_id, name="Bench Label"))
+    await session.execute(insert(Submission), [
+        {"producer_profile_id": producer_id, "workspace_id": workspace_id, "title": f"Bench {i}",
+         "streaming_url": f"https://example.com/{i}", "tempo": 100 + i % 60, "genre": ["house", "deep house"],
+         "key": "Am", "extra_metadata": {"vibe": "late night", "n": i}, "status": Status.PENDING}
+        for i in range(rows)
+    ])
+    return workspace_id
+
+
+async def before(session: AsyncSession, workspace_id: uuid.UUID) -> bytes:
+    result = await session.execute(select(Submission).where(Submission.workspace_id == workspace_id))
+    adapter = TypeAdapter(list[SubmissionPublic])
+    validated = adapter.validate_python(result.scalars().all(), from_attributes=True)
+    body = json.dumps(adapter.dump_python(validated, mode="json")).encode()
+    session.expunge_all()
+    return body
+
+
+async def after(session: AsyncSession, workspace_id: uuid.UUID) -> bytes:
+    result = await session.execute(
+        select(*public_columns(SubmissionPublic, Submission)).where(Submission.workspace_id == workspace_id)
+    )
+    return RowsJSONResponse(SubmissionPublic, result.all()).body
+
+
+async def measure(fn, session: AsyncSession, workspace_id: uuid.UUID, runs: int) -> dict:
+    await fn(session, workspace_id)  # warm caches and the adapter
+    timings, peaks = [], []
+    for _ in range(runs):
+        tracemalloc.start()
+        started = time.perf_counter()
+        body = await fn(session, workspace_id)
+        timings.append((time.perf_counter() - started) * 1000)
+        peaks.append(tracemalloc.get_traced_memory()[1] / 2**20)
+        tracemalloc.stop()
+    return {"median_ms": statistics.median(timings), "peak_mib": statistics.median(peaks), "bytes": len(body)}
+
+
+async def main(rows: int, runs: int) -> None:
+    async with engine.connect() as conn:
+        transaction = await conn.begin()
+        try:
+            async with AsyncSession(bind=conn, expire_on_commit=False) as session:
+                workspace_id = await seed(session, rows)
+                await session.flush()
+                for name, fn in (("before", before), ("after", after)):
+                    result = await measure(fn, session, workspace_id, runs)
+                    print(f"{name:>6}: {result['median_ms']:.1f} ms, peak {result['peak_mib']:.1f} MiB "
+                          f"allocated, {result['bytes']} byte body ({rows} rows)")
+        finally:
+            await transaction.rollback()
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.runs))
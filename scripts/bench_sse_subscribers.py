@@ -0,0 +1,128 @@
+"""Push load test: many idle server-sent event subscribers on one workspace.
+
+Run from the repo root against a running server (and a reachable database):
+
+    uv run python scripts/bench_sse_subscribers.py --base-url http://127.0.0.1:8000/api --subscribers 1000 --pid <server pid>
+
+Registers a throwaway label user (with a workspace) and producer, opens N
+connections to /workspaces/{id}/submissions/events/live and holds them idle, then
+submits one demo and measures how long until every subscriber has received its
+event. Reports connections held, delivery latency (p50/max), the server's push and
+pool stats from /api/metrics and, with --pid, the server's resident memory.
+Raise the open file limit (ulimit -n) on both sides for large N.
+"""
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+
+import httpx
+
+
+async def login_new_user(client: httpx.AsyncClient, user_type: str) -> dict:
+    username = f"bench_{uuid.uuid4().hex[:12]}"
+    password = "Benchpassword1234!"
+    response = await client.post("/register", json={
+        "email": f"{username}@bench.local", "username": username, "password": password,
+        "first_name": "Bench", "last_name": "User", "user_type": user_type,
+    })
+    response.raise_for_status()
+    response = await client.post("/token", data={"username": username, "password": password})
+    response.raise_for_status()
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+def rss_mb(pid: int) -> float | None:
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        return None
+    return None
+
+
+async def subscribe(client: httpx.AsyncClient, url: str, headers: dict, target: int, ready: asyncio.Event,
+                    opened: list, delivered: list, stop: asyncio.Event) -> None:
+    try:
+        async with client.stream("GET", url, headers=headers) as response:
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                if line.startswith("retry:"):
+                    opened.append(time.perf_counter())
+                    if len(opened) == target:
+                        ready.set()
+                elif line.startswith("event: submission_event"):
+                    delivered.append(time.perf_counter())
+                    break
+    except httpx.HTTPError as e:
+        print(f"subscriber failed: {e!r}")
+    await stop.wait()
+
+
+async def run(args: argparse.Namespace) -> None:
+    limits = httpx.Limits(max_connections=args.subscribers + 10, max_keepalive_connections=args.subscribers + 10)
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=httpx.Timeout(30, read=None)) as client:
+        label_headers = await login_new_user(client, "labelstaff")
+        producer_headers = await login_new_user(client, "producer")
+        workspace_id = (await client.post("/workspaces", json={"name": "Bench Push"}, headers=label_headers)).json()["id"]
+        baseline_rss = rss_mb(args.pid) if args.pid else None
+
+        ready, stop = asyncio.Event(), asyncio.Event()
+        opened, delivered = [], []
+        started = time.perf_counter()
+        tasks = [asyncio.create_task(subscribe(client, f"/workspaces/{workspace_id}/submissions/events/live",
+                                               label_headers, args.subscribers, ready, opened, delivered, stop))
+                 for _ in range(args.subscribers)]
+        try:
+            await asyncio.wait_for(ready.wait(), args.connect_timeout)
+        except TimeoutError:
+            pass
+        print(f"held {len(opened)}/{args.subscribers} connections, opened in {time.perf_counter() - started:.2f} s")
+
+        await asyncio.sleep(args.idle)
+        metrics = (await client.get("/metrics")).json()
+        held_rss = rss_mb(args.pid) if args.pid else None
+
+        submitted = time.perf_counter()
+        response = await client.post("/submissions", headers=producer_headers, json={
+            "workspace_id": workspace_id, "title": "Bench push", "streaming_url": "https://example.com/push", "tempo": 120,
+        })
+        response.raise_for_status()
+        deadline = submitted + args.delivery_timeout
+        while len(delivered) < len(opened) and time.perf_counter() < deadline:
+            await asyncio.sleep(0.01)
+
+        latencies = sorted((at - submitted) * 1000 for at in delivered)
+        if latencies:
+            print(f"delivered to {len(latencies)}/{len(opened)}: p50 {statistics.median(latencies):.1f} ms, "
+                  f"max {latencies[-1]:.1f} ms")
+        else:
+            print("delivered to nobody")
+        print(f"push: {metrics['push']}")
+        print(f"db_pool while idle: checked_out={metrics['db_pool'].get('checked_out')}")
+        if baseline_rss is not None and held_rss is not None:
+            print(f"server RSS {baseline_rss:.0f} MB -> {held_rss:.0f} MB "
+                  f"({(held_rss - baseline_rss) * 1024 / max(len(opened), 1):.1f} KB per connection)")
+
+        stop.set()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000/api")
+    parser.add_argument("--subscribers", type=int, default=1000)
+    parser.add_argument("--idle", type=float, default=5.0, help="seconds to hold the connections idle before submitting")
+    parser.add_argument("--connect-timeout", type=float, default=60.0)
+    parser.add_argument("--delivery-timeout", type=float, default=30.0)
+    parser.add_argument("--pid", type=int, help="server process id, to report its resident memory")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Bulk import benchmark: rows/s for POST /api/tracks/import.
+
+Run from the repo root against a running server (and a reachable database):
+
+    uv run python scripts/bench_track_import.py --base-url http://127.0.0.1:8000/api --rows 10000
+
+Registers a throwaway producer, streams a generated CSV body in chunks and
+reports wall time and rows/s for the whole import.
+"""
+import argparse
+import json
+import time
+import urllib.parse
+import urllib.request
+import uuid
+
+
+def post(url: str, data: bytes, headers: dict) -> dict:
+    request = urllib.request.Request(url, data=data, headers=headers, method="POST")
+    with urllib.request.urlopen(request, timeout=300) as response:
+        return json.load(response)
+
+
+def login_new_producer(base_url: str) -> dict:
+    username = f"bench_{uuid.uuid4().hex[:12]}"
+    password = "Benchpassword1234!"
+    post(f"{base_url}/register", json.dumps({
+        "email": f"{username}@bench.local", "username": username, "password": password,
+        "first_name": "Bench", "last_name": "Producer", "user_type": "producer",
+    }).encode(), {"Content-Type": "application/json"})
+    token = post(f"{base_url}/token", urllib.parse.urlencode({"username": username, "password": password}).encode(),
+                 {"Content-Type": "application/x-www-form-urlencoded"})["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+def csv_body(rows: int, chunk_rows: int = 500):
+    yield b"title,streaming_url,tempo,genre,key,extra_metadata\n"
+    for start in range(0, rows, chunk_rows):
+        yield "".join(
+            f'Bench {i},https://example.com/{i},{100 + i % 60},house|deep,Am,"{{""n"": {i}}}"\n'
+            for i in range(start, min(start + chunk_rows, rows))
+        ).encode()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000/api")
+    parser.add_argument("--rows", type=int, default=10_000)
+    args = parser.parse_args()
+
+    headers = {**login_new_producer(args.base_url), "Content-Type": "text/csv"}
+    started = time.perf_counter()
+    report = post(f"{args.base_url}/tracks/import", csv_body(args.rows), headers)
+    elapsed = time.perf_counter() - started
+
+    print(f"imported {report['imported']} rows ({report['failed']} failed) in {elapsed:.2f} s: "
+          f"{report['imported'] / elapsed:.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,9 +2,12 @@ import asyncio
 
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
 
 from app.main import app
 from app.database import init_db, drop_db
+from app.settings import settings
 
 
 @pytest.fixture(scope="session")
@@ -14,7 +17,81 @@ def setup_test_db() -> None:
     asyncio.run(drop_db())
 
 
+@pytest.fixture
+def db_engine(setup_test_db: None) -> AsyncEngine:
+    """Engine on the test database for work beside the app's own sessions. NullPool: every
+    use opens its own connection, so it works from any asyncio.run() (a new event loop)."""
+    engine = create_async_engine(settings.database_url, poolclass=NullPool)
+    yield engine
+    asyncio.run(engine.dispose())
+
+
+@pytest.fixture
+def session_factory(db_engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(bind=db_engine, expire_on_commit=False)
+
+
+@pytest.fixture
+def run_db(db_engine: AsyncEngine):
+    """Run `await work(conn)` on a fresh connection (commit explicitly) and return its result."""
+    def _run(work):
+        async def _with_connection():
+            async with db_engine.connect() as conn:
+                return await work(conn)
+        return asyncio.run(_with_connection())
+    return _run
+
+
 @pytest.fixture(scope="session")
 def client(setup_test_db: None) -> TestClient:
     with TestClient(app) as c:
-        yield c
\ No newline at end of file
+        yield c
+
+def register_and_login(client: TestClient, username: str, user_type: str) -> dict:
+    """Register a user and return Authorization headers for it."""
+    password = "Testpassword1234!"
+    client.post("/api/register", json={
+        "email": f"{username}@test.com",
+        "username": username,
+        "password": password,
+        "first_name": "Test",
+        "last_name": "User",
+        "gender": "other",
+        "user_type": user_type,
+    })
+    response = client.post("/api/token", data={"username": username, "password": password})
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+@pytest.fixture(scope="session")
+def producer_headers(client: TestClient) -> dict:
+    return register_and_login(client, "flowproducer", "producer")
+
+
+@pytest.fixture(scope="session")
+def labelstaff_headers(client: TestClient) -> dict:
+    return register_and_login(client, "flowlabelstaff", "labelstaff")
+
+
+@pytest.fixture(scope="session")
+def workspace_id(client: TestClient, labelstaff_headers: dict) -> str:
+    response = client.post("/api/workspaces", json={"name": "Test Label"}, headers=labelstaff_headers)
+    return response.json()["id"]
+
+
+@pytest.fixture
+def create_submission(client: TestClient, producer_headers: dict, workspace_id: str):
+    def _create(**overrides) -> dict:
+        payload = {
+            "workspace_id": workspace_id,
+            "title": "Demo",
+            "streaming_url": "https://example.com/demo",
+            "tempo": 124.0,
+            "genre": ["deep house"],
+            "key": "Am",
+            **overrides,
+        }
+        response = client.post("/api/submissions", json=payload, headers=producer_headers)
+        assert response.status_code == 201
+        return response.json()
+    return _create
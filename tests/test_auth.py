@@ -0,0 +1,49 @@
+import asyncio
+import time
+from uuid import uuid4
+
+from app.services.auth import AuthService, HashingBusyError, PasswordHashExecutor
+
+
+def test_access_token_without_profile_claims() -> None:
+    auth_service = AuthService()
+    user_id = uuid4()
+    payload = auth_service.verify_access_token(auth_service.generate_access_token(user_id))
+    assert payload["sub"] == user_id
+    assert "pid" not in payload
+    assert "utype" not in payload
+
+
+def test_access_token_carries_profile_claims() -> None:
+    auth_service = AuthService()
+    user_id, profile_id = uuid4(), uuid4()
+    token = auth_service.generate_access_token(user_id, "producer", profile_id)
+    payload = auth_service.verify_access_token(token)
+    assert payload["sub"] == user_id
+    assert payload["utype"] == "producer"
+    assert payload["pid"] == profile_id
+
+
+def test_password_hashing_round_trip() -> None:
+    auth_service = AuthService()
+
+    async def hash_and_verify() -> tuple[bool, bool]:
+        hashed = await auth_service.hash_password("Testpassword1234!")
+        return (await auth_service.verify_password("Testpassword1234!", hashed),
+                await auth_service.verify_password("wrong", hashed))
+
+    assert asyncio.run(hash_and_verify()) == (True, False)
+
+
+def test_password_hash_executor_rejects_when_full() -> None:
+    executor = PasswordHashExecutor(workers=1, max_pending=1)
+
+    async def burst() -> list:
+        return await asyncio.gather(executor.run(time.sleep, 0.05),
+                                    executor.run(time.sleep, 0.05),
+                                    return_exceptions=True)
+
+    first, second = asyncio.run(burst())
+    assert first is None
+    assert isinstance(second, HashingBusyError)
+    assert executor.stats()["rejected"] == 1
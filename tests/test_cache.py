@@ -0,0 +1,53 @@
+import time
+
+from app.cache import TTLCache
+
+
+def test_cache_hit_and_miss_counters() -> None:
+    cache = TTLCache(maxsize=10, ttl=60)
+    assert cache.get("a") is None
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_cache_evicts_least_recently_used() -> None:
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.evictions == 1
+
+
+def test_cache_entries_expire() -> None:
+    cache = TTLCache(maxsize=10, ttl=0.01)
+    cache.set("a", 1)
+    time.sleep(0.02)
+    assert cache.get("a") is None
+    assert cache.stats()["size"] == 0
+
+
+def test_cache_invalidate_and_disable() -> None:
+    cache = TTLCache(maxsize=10, ttl=60)
+    cache.set("a", 1)
+    cache.invalidate("a")
+    assert cache.get("a") is None
+
+    disabled = TTLCache(maxsize=10, ttl=0)
+    disabled.set("a", 1)
+    assert disabled.get("a") is None
+
+
+def test_cache_per_entry_ttl_and_invalidate_where() -> None:
+    cache = TTLCache(maxsize=10, ttl=60)
+    cache.set(("a", 1), "admin")
+    cache.set(("b", 1), "agent")
+    cache.set(("a", 2), "negative", ttl=0.01)
+    time.sleep(0.02)
+    assert cache.get(("a", 2)) is None
+
+    cache.invalidate_where(lambda key: key[1] == 1)
+    assert cache.stats()["size"] == 0
@@ -0,0 +1,24 @@
+from app.instrumentation import RequestQueryStats, statement_shape
+from app.settings import settings
+
+
+def test_statement_shape_ignores_parameters() -> None:
+    first = statement_shape("SELECT users.id FROM users WHERE users.id = %(id_1)s::UUID")
+    second = statement_shape("SELECT users.id  FROM users\nWHERE users.id = %(id_2)s::UUID")
+    assert first == second
+
+
+def test_statement_shape_collapses_in_lists() -> None:
+    shape = statement_shape("SELECT 1 FROM t WHERE t.id IN (%(id_1_1)s, %(id_1_2)s, %(id_1_3)s)")
+    assert shape == "SELECT ? FROM t WHERE t.id IN (?)"
+
+
+def test_request_stats_flag_repeated_statements() -> None:
+    stats = RequestQueryStats("GET", "/api/tracks")
+    for i in range(settings.sql_n_plus_one_threshold):
+        stats.record(f"SELECT * FROM tracks WHERE id = {i}", elapsed_ms=1.0)
+    stats.record("SELECT * FROM users", elapsed_ms=5.0)
+
+    assert stats.query_count == settings.sql_n_plus_one_threshold + 1
+    assert stats.slowest_statement == "SELECT * FROM users"
+    assert stats.repeated_shapes() == [("SELECT * FROM tracks WHERE id = ?", settings.sql_n_plus_one_threshold)]
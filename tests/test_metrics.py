@@ -0,0 +1,25 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app.settings import settings
+
+
+def test_metrics_exposes_pool_stats(client: TestClient) -> None:
+    client.get("/api/")
+    response = client.get("/api/metrics")
+    assert response.status_code == 200
+    pool = response.json()["db_pool"]
+    assert pool["mode"] in ("null", "queue", "pgbouncer")
+    assert pool["checkouts"] >= pool["checkins"]
+
+
+def test_metrics_require_the_token(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "metrics_token", "scraper-token")
+    assert client.get("/api/metrics").status_code == 401
+    assert client.get("/api/metrics", headers={"Authorization": "Bearer wrong"}).status_code == 401
+    assert client.get("/api/metrics", headers={"Authorization": "Bearer scraper-token"}).status_code == 200
+
+
+def test_metrics_hidden_outside_local_without_token(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "app_env", "production")
+    assert client.get("/api/metrics").status_code == 404
@@ -0,0 +1,37 @@
+from alembic import command
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+from sqlalchemy import text
+
+
+def alembic_config() -> Config:
+    # no ini file: env.py then leaves the test run's logging alone
+    config = Config()
+    config.set_main_option("script_location", "migrations")
+    return config
+
+
+def test_revisions_form_one_line() -> None:
+    script = ScriptDirectory.from_config(alembic_config())
+    assert len(script.get_heads()) == 1
+    revisions = list(script.walk_revisions())
+    assert revisions[-1].down_revision is None
+    assert all(isinstance(revision.down_revision, (str, type(None))) for revision in revisions)
+
+
+def test_upgrade_finishes_a_create_all_database(run_db) -> None:
+    # the online steps check the catalog first: on a schema the models created they do nothing
+    command.upgrade(alembic_config(), "head")
+
+    async def applied(conn) -> tuple[str, str, str | None]:
+        version = await conn.scalar(text("SELECT version_num FROM alembic_version"))
+        kind = await conn.scalar(text("SELECT relkind FROM pg_class WHERE oid = to_regclass('submission_events')"))
+        comment = await conn.scalar(text("SELECT obj_description(to_regclass('workspace_status_counts'), 'pg_class')"))
+        await conn.execute(text("DROP TABLE alembic_version"))
+        await conn.commit()
+        return version, kind, comment
+
+    version, kind, comment = run_db(applied)
+    assert version == ScriptDirectory.from_config(alembic_config()).get_current_head()
+    assert kind == "p"
+    assert comment is None
@@ -0,0 +1,81 @@
+import asyncio
+import json
+from collections import namedtuple
+from datetime import datetime
+from uuid import UUID, uuid4
+
+import pytest
+
+from app.models.models import Status
+from app.notifications import ChangeListener, PushUnavailableError, Subscription, live_events
+from app.pagination import encode_cursor
+from app.settings import settings
+
+
+EventRow = namedtuple("EventRow", ["id", "status", "event_date", "submission_id", "workspace_id",
+                                   "producer_profile_id", "labelstaff_profile_id", "txid"])
+
+
+def test_subscription_coalesces_wakeups() -> None:
+    async def notify_twice():
+        subscription = Subscription(("workspace", uuid4()))
+        first, second = subscription.notify(10), subscription.notify(7)
+        return first, second, subscription.pending_txid, await subscription.wait(1), await subscription.wait(0.01)
+
+    assert asyncio.run(notify_twice()) == (True, False, 10, True, False)
+
+
+def test_dispatch_wakes_workspace_and_producer_subscribers() -> None:
+    listener = ChangeListener()
+    workspace_id, producer_id, other_id = uuid4(), uuid4(), uuid4()
+    # subscribe() would start the LISTEN task; register directly
+    subscriptions = {key: Subscription(key) for key in
+                     [("workspace", workspace_id), ("producer", producer_id), ("workspace", other_id)]}
+    for key, subscription in subscriptions.items():
+        listener._subscribers[key].add(subscription)
+
+    payload = json.dumps({"workspace_id": str(workspace_id), "producer_profile_id": str(producer_id), "txid": 42})
+    listener.dispatch(payload)
+    listener.dispatch(payload)
+    listener.dispatch("not json")
+
+    assert [subscription.pending_txid for subscription in subscriptions.values()] == [42, 42, 0]
+    assert (listener.notifications, listener.wakeups, listener.coalesced) == (2, 2, 2)
+
+
+def test_subscribe_refuses_listen_through_transaction_pooler(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "db_pool_mode", "pgbouncer")
+    monkeypatch.setattr(settings, "push_listen_database_url", None)
+    listener = ChangeListener()
+
+    with pytest.raises(PushUnavailableError):
+        listener.subscribe("workspace", uuid4())
+    assert listener.subscriber_count == 0
+
+
+def test_live_events_frames_and_keepalive(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "push_keepalive_seconds", 0.01)
+    row = EventRow(uuid4(), Status.PENDING, datetime(2026, 1, 2), uuid4(), uuid4(), uuid4(), None, 5)
+    row_cursor = encode_cursor([5, row.id])
+    start = encode_cursor([0, UUID(int=0)])
+
+    async def sync(cursor):
+        return ([row], row_cursor) if cursor == start else ([], cursor)
+
+    async def first_frames():
+        frames = live_events(Subscription(("workspace", row.workspace_id)), sync, start)
+        return [await anext(frames) for _ in range(3)]
+
+    retry, event, keepalive = asyncio.run(first_frames())
+    assert retry == f"retry: {settings.push_retry_ms}\n\n"
+    event_id, name, data = event.strip().split("\n")
+    assert event_id == f"id: {row_cursor}"
+    assert name == "event: submission_event"
+    assert json.loads(data.removeprefix("data: "))["submission_id"] == str(row.submission_id)
+    assert "txid" not in data
+    assert keepalive == ": keepalive\n\n"
+
+
+def test_live_events_reject_bad_last_event_id(client, producer_headers: dict) -> None:
+    response = client.get("/api/submissions/events/live", headers={**producer_headers, "Last-Event-ID": "nope"})
+    assert response.status_code == 400
@@ -0,0 +1,120 @@
+import json
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.models.models import Submission, SubmissionEvent
+from app.pagination import InvalidCursorError, decode_cursor, encode_cursor
+from app.settings import settings
+
+
+def test_cursor_round_trip() -> None:
+    columns = (Submission.created_at, Submission.id)
+    values = [datetime(2026, 1, 2, 3, 4, 5, 678), uuid4()]
+    assert decode_cursor(encode_cursor(values), columns) == values
+
+    with pytest.raises(InvalidCursorError):
+        decode_cursor("not-a-cursor", columns)
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(encode_cursor(values[:1]), columns)
+
+
+@pytest.mark.parametrize("values", [
+    ["2024-01-01T00:00:00", 5],
+    ["2024-01-01T00:00:00", None],
+    ["2024-01-01T00:00:00", ["nested"]],
+    [1704067200, str(uuid4())],
+    [True, str(uuid4())],
+])
+def test_cursor_values_must_match_column_types(values: list) -> None:
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(encode_cursor(values), (SubmissionEvent.event_date, SubmissionEvent.id))
+
+
+def test_crafted_cursor_is_a_bad_request(client: TestClient, labelstaff_headers: dict, workspace_id: str) -> None:
+    response = client.get(f"/api/workspaces/{workspace_id}/submissions/events",
+                          params={"cursor": encode_cursor(["2024-01-01T00:00:00", 5])}, headers=labelstaff_headers)
+    assert response.status_code == 400
+
+
+def test_label_submissions_keyset_pages(client: TestClient, labelstaff_headers: dict, workspace_id: str, create_submission) -> None:
+    for i in range(5):
+        create_submission(title=f"Paged {i}")
+
+    seen, cursor = [], None
+    while True:
+        params = {"limit": 2, **({"cursor": cursor} if cursor else {})}
+        response = client.get(f"/api/workspaces/{workspace_id}/submissions", params=params, headers=labelstaff_headers)
+        assert response.status_code == 200
+        assert len(response.json()) <= 2
+        seen.extend(submission["id"] for submission in response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+
+    assert len(seen) == len(set(seen)) >= 5
+    everything = client.get(f"/api/workspaces/{workspace_id}/submissions", params={"limit": 200}, headers=labelstaff_headers)
+    assert [submission["id"] for submission in everything.json()] == seen
+
+
+def test_default_page_size_without_limit(client: TestClient, labelstaff_headers: dict, workspace_id: str,
+                                        create_submission) -> None:
+    for i in range(settings.page_size_default + 1):
+        create_submission(title=f"Default page {i}")
+    url = f"/api/workspaces/{workspace_id}/submissions"
+
+    first = client.get(url, headers=labelstaff_headers)
+    assert len(first.json()) == settings.page_size_default
+    second = client.get(url, params={"cursor": first.headers["X-Next-Cursor"]}, headers=labelstaff_headers)
+    assert second.json()
+    assert not {submission["id"] for submission in first.json()} & {submission["id"] for submission in second.json()}
+
+
+def test_pagination_rejects_bad_cursor_and_limit(client: TestClient, producer_headers: dict) -> None:
+    assert client.get("/api/submissions", params={"cursor": "garbage"}, headers=producer_headers).status_code == 400
+    assert client.get("/api/submissions/events", params={"limit": 100000}, headers=producer_headers).status_code == 422
+
+
+def test_label_events_stream_as_ndjson(client: TestClient, labelstaff_headers: dict, workspace_id: str, create_submission) -> None:
+    submission = create_submission()
+    client.post(f"/api/workspaces/{workspace_id}/submissions/{submission['id']}/start-review", headers=labelstaff_headers)
+
+    paged = client.get(f"/api/workspaces/{workspace_id}/submissions/events", params={"limit": 200},
+                       headers=labelstaff_headers).json()
+    streamed = client.get(f"/api/workspaces/{workspace_id}/submissions/events",
+                          headers={**labelstaff_headers, "Accept": "application/x-ndjson"})
+    assert streamed.status_code == 200
+    assert streamed.headers["content-type"] == "application/x-ndjson"
+    assert [json.loads(line) for line in streamed.text.splitlines()] == paged
+
+    flagged = client.get(f"/api/workspaces/{workspace_id}/submissions/events", params={"stream": True},
+                         headers=labelstaff_headers)
+    assert flagged.text == streamed.text
+
+
+def test_label_events_incremental_sync(client: TestClient, labelstaff_headers: dict, create_submission) -> None:
+    workspace_id = client.post("/api/workspaces", json={"name": "Sync Label"}, headers=labelstaff_headers).json()["id"]
+    url = f"/api/workspaces/{workspace_id}/submissions/events"
+
+    empty = client.get(url, params={"since": "0"}, headers=labelstaff_headers)
+    assert empty.json() == []
+    cursor = empty.headers["X-Next-Cursor"]
+
+    first, second = create_submission(workspace_id=workspace_id), create_submission(workspace_id=workspace_id)
+    for submission in (first, second):
+        client.post(f"/api/workspaces/{workspace_id}/submissions/{submission['id']}/start-review", headers=labelstaff_headers)
+
+    synced = client.get(url, params={"since": cursor, "limit": 2}, headers=labelstaff_headers)
+    assert [(event["submission_id"], event["status"]) for event in synced.json()] == [
+        (first["id"], "PENDING"), (second["id"], "PENDING")
+    ]
+    rest = client.get(url, params={"since": synced.headers["X-Next-Cursor"]}, headers=labelstaff_headers)
+    assert [(event["submission_id"], event["status"]) for event in rest.json()] == [
+        (first["id"], "IN_REVIEW"), (second["id"], "IN_REVIEW")
+    ]
+
+    idle = client.get(url, params={"since": rest.headers["X-Next-Cursor"]}, headers=labelstaff_headers)
+    assert idle.json() == []
+    assert idle.headers["X-Next-Cursor"] == rest.headers["X-Next-Cursor"]
@@ -0,0 +1,87 @@
+import gzip
+from datetime import date, datetime
+from uuid import UUID
+
+from sqlalchemy import text
+
+from app.pagination import encode_cursor, keyset_paginate
+from app.partitions import (DEFAULT_PARTITION, add_months, archive_partitions, create_month_partition,
+                            list_partitions, partition_name, restore_partition)
+from app.services.submissions import SubmissionQueryService
+from app.settings import settings
+
+
+async def _current_month(conn) -> date:
+    return await conn.scalar(text("SELECT date_trunc('month', now())::date"))
+
+
+def test_add_months() -> None:
+    assert add_months(date(2025, 11, 1), 3) == date(2026, 2, 1)
+    assert add_months(date(2025, 1, 1), -1) == date(2024, 12, 1)
+    assert partition_name(date(2026, 3, 1)) == "submission_events_p202603"
+
+
+def test_partitions_ready_ahead(run_db) -> None:
+    async def work(conn):
+        async with conn.begin():
+            return await _current_month(conn), await list_partitions(conn)
+
+    current_month, partitions = run_db(work)
+    names = {partition.name for partition in partitions}
+    assert DEFAULT_PARTITION in names
+    for offset in range(settings.event_partitions_ahead + 1):
+        assert partition_name(add_months(current_month, offset)) in names
+
+
+def test_event_pages_prune_partitions(run_db) -> None:
+    async def work(conn):
+        current_month = await _current_month(conn)
+        service = SubmissionQueryService(None)
+        cursor = encode_cursor([datetime(current_month.year, current_month.month, 1), UUID(int=0)])
+        stmt = keyset_paginate(service._label_events_query(UUID(int=1)), service.event_order, cursor, 50)
+        compiled = stmt.compile(dialect=conn.dialect, compile_kwargs={"literal_binds": True})
+        rows = await conn.execute(text(f"EXPLAIN {compiled}"))
+        return current_month, "\n".join(row[0] for row in rows)
+
+    current_month, plan = run_db(work)
+    # newest first from the start of this month: later months are pruned at plan time
+    assert partition_name(current_month) in plan
+    assert partition_name(add_months(current_month, 1)) not in plan
+
+
+def test_archive_and_restore_partition(client, create_submission, run_db, tmp_path) -> None:
+    submission = create_submission()
+    month = date(2001, 1, 1)
+    name = partition_name(month)
+
+    async def count(conn) -> int:
+        return await conn.scalar(text(f"SELECT count(*) FROM submission_events WHERE submission_id = '{submission['id']}' "
+                                      "AND event_date < '2001-02-01'"))
+
+    async def work(conn):
+        async with conn.begin():
+            # an event of a month without a partition lands in the DEFAULT partition
+            await conn.execute(text(
+                "INSERT INTO submission_events (id, status, event_date, submission_id, workspace_id, "
+                "producer_profile_id, labelstaff_profile_id, owner_producer_profile_id) "
+                "SELECT gen_random_uuid(), status, '2001-01-15', submission_id, workspace_id, producer_profile_id, "
+                "labelstaff_profile_id, owner_producer_profile_id FROM submission_events WHERE submission_id = :id"
+            ), {"id": submission["id"]})
+            assert await create_month_partition(conn, month)
+            in_partition = await conn.scalar(text(f"SELECT count(*) FROM {name}"))
+        paths = await archive_partitions(conn, add_months(month, 1), tmp_path)
+        async with conn.begin():
+            archived = await count(conn)
+            attached = {partition.name for partition in await list_partitions(conn)}
+        restored_rows = await restore_partition(conn, name, tmp_path)
+        async with conn.begin():
+            restored = await count(conn)
+        return in_partition, paths, archived, attached, restored_rows, restored
+
+    in_partition, paths, archived, attached, restored_rows, restored = run_db(work)
+    assert in_partition == 1
+    assert paths == [tmp_path / f"{name}.csv.gz"]
+    with gzip.open(paths[0], "rt") as archive:
+        assert archive.readline().startswith("id,status,event_date")
+    assert (archived, name in attached) == (0, False)
+    assert (restored_rows, restored) == (1, 1)
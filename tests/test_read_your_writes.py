@@ -0,0 +1,56 @@
+import asyncio
+import time
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app import database
+from app.database import RecentWriters, read_session_factory
+from app.dependencies import Principal, get_read_session
+from app.models.models import UserType
+
+
+@pytest.fixture
+def replica(monkeypatch: pytest.MonkeyPatch):
+    # engines connect lazily: nothing here reaches a database
+    replica_engine = create_async_engine("postgresql+psycopg://replica.invalid/trackflow")
+    monkeypatch.setattr(database, "read_engine", replica_engine)
+    monkeypatch.setattr(database, "ReadSessionLocal", async_sessionmaker(bind=replica_engine))
+    monkeypatch.setattr(database, "recent_writers", RecentWriters(window_s=0.05))
+    yield replica_engine
+    asyncio.run(replica_engine.dispose())
+
+
+def _read_session_bind(principal: Principal):
+    async def bind():
+        async for session in get_read_session(principal):
+            return session.bind
+
+    return asyncio.run(bind())
+
+
+def test_reads_stay_on_primary_within_write_window(replica) -> None:
+    writer = Principal(uuid4(), UserType.producer, uuid4())
+    other = Principal(uuid4(), UserType.producer, uuid4())
+    assert _read_session_bind(writer) is replica
+
+    database.recent_writers.mark(writer.user_id)
+    assert read_session_factory(writer.user_id) is database.SessionLocal
+    assert _read_session_bind(writer) is database.engine
+    assert _read_session_bind(other) is replica
+
+    time.sleep(0.06)
+    assert _read_session_bind(writer) is replica
+
+
+def test_write_window_off_without_replica_or_window(replica, monkeypatch: pytest.MonkeyPatch) -> None:
+    user_id = uuid4()
+    database.recent_writers.window_s = 0
+    database.recent_writers.mark(user_id)
+    assert not database.recent_writers.is_recent(user_id)
+
+    monkeypatch.setattr(database, "read_engine", database.engine)
+    database.recent_writers.window_s = 60
+    database.recent_writers.mark(user_id)
+    assert not database.recent_writers.is_recent(user_id)
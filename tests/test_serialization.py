@@ -0,0 +1,22 @@
+from collections import namedtuple
+from datetime import datetime
+from uuid import uuid4
+
+from pydantic import TypeAdapter
+
+from app.models.models import Status
+from app.schemas.schemas import SubmissionPublic
+from app.serialization import RowsJSONResponse, rows_adapter
+
+
+def test_rows_response_matches_schema_serialization() -> None:
+    Row = namedtuple("Row", [*SubmissionPublic.model_fields, "rank"])
+    row = Row(uuid4(), uuid4(), uuid4(), "Demo", "https://example.com/demo", 124.0, ["deep house"], None,
+              {"vibe": "late night"}, Status.PENDING, datetime(2026, 1, 2, 3, 4, 5), 0.5)
+
+    response = RowsJSONResponse(SubmissionPublic, [row], headers={"X-Next-Cursor": "abc"})
+    expected = TypeAdapter(list[SubmissionPublic]).dump_json([SubmissionPublic.model_validate(row, from_attributes=True)])
+    assert response.body == expected
+    assert response.headers["content-type"] == "application/json"
+    assert response.headers["x-next-cursor"] == "abc"
+    assert rows_adapter(SubmissionPublic) is rows_adapter(SubmissionPublic)
@@ -0,0 +1,21 @@
+import random
+
+from app.sketch import RELATIVE_ACCURACY, bucket_of, quantile
+
+
+def test_quantiles_within_relative_accuracy() -> None:
+    rng = random.Random(7)
+    values = sorted(rng.lognormvariate(10, 2) for _ in range(20_000))
+    counts = {}
+    for value in values:
+        counts[bucket_of(value)] = counts.get(bucket_of(value), 0) + 1
+
+    for q in (0.5, 0.9, 0.99):
+        exact = values[int(q * (len(values) - 1))]
+        assert abs(quantile(counts, q) - exact) <= RELATIVE_ACCURACY * exact * 1.0001
+    assert len(counts) < 600
+
+
+def test_empty_sketch_and_sub_second_values() -> None:
+    assert quantile({}, 0.5) is None
+    assert bucket_of(0.2) == bucket_of(1) == 0
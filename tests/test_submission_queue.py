@@ -0,0 +1,98 @@
+from uuid import UUID
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import func, literal_column, select, text
+from sqlalchemy.dialects import postgresql
+
+from app.models.models import Submission
+from app.pagination import keyset_paginate
+from app.schemas.schemas import SubmissionQueueFilters
+from app.services.submissions import SubmissionQueryService
+
+
+def test_label_queue_filters_and_sorting(client: TestClient, labelstaff_headers: dict, create_submission) -> None:
+    workspace_id = client.post("/api/workspaces", json={"name": "Queue Label"}, headers=labelstaff_headers).json()["id"]
+    slow = create_submission(workspace_id=workspace_id, tempo=100.0, key="Am", genre=["ambient"])
+    mid = create_submission(workspace_id=workspace_id, tempo=124.0, key="Fm", genre=["deep house", "minimal"])
+    fast = create_submission(workspace_id=workspace_id, tempo=140.0, key="Am", genre=["techno"])
+    client.post(f"/api/workspaces/{workspace_id}/submissions/{fast['id']}/start-review", headers=labelstaff_headers)
+
+    def ids(**params) -> list[str]:
+        response = client.get(f"/api/workspaces/{workspace_id}/submissions", params=params, headers=labelstaff_headers)
+        assert response.status_code == 200
+        return [submission["id"] for submission in response.json()]
+
+    assert ids(status="PENDING", sort="tempo_asc") == [slow["id"], mid["id"]]
+    assert ids(tempo_min=110, tempo_max=150, sort="tempo_desc") == [fast["id"], mid["id"]]
+    assert ids(key="Am", sort="oldest") == [slow["id"], fast["id"]]
+    assert ids(genre=["minimal", "techno"], sort="tempo_asc") == [mid["id"], fast["id"]]
+    assert ids(sort="tempo_asc", limit=2) == [slow["id"], mid["id"]]
+
+    response = client.get(f"/api/workspaces/{workspace_id}/submissions", params={"tempo_min": 150, "tempo_max": 100},
+                          headers=labelstaff_headers)
+    assert response.status_code == 422
+
+
+def test_search_label_submissions(client: TestClient, labelstaff_headers: dict, create_submission) -> None:
+    workspace_id = client.post("/api/workspaces", json={"name": "Search Label"}, headers=labelstaff_headers).json()["id"]
+    vocal = create_submission(workspace_id=workspace_id, title="Midnight Vocal Chop", genre=["deep house"])
+    by_genre = create_submission(workspace_id=workspace_id, title="Sunrise", genre=["deep house"],
+                                 extra_metadata={"vibe": "vocal heavy"})
+    create_submission(workspace_id=workspace_id, title="Warehouse", genre=["techno"])
+
+    def search(q: str) -> list[str]:
+        response = client.get(f"/api/workspaces/{workspace_id}/submissions/search", params={"q": q},
+                              headers=labelstaff_headers)
+        assert response.status_code == 200
+        return [submission["id"] for submission in response.json()]
+
+    assert search("deep ho voc") == [vocal["id"], by_genre["id"]]
+    assert search("chop") == [vocal["id"]]
+    assert search("ambient") == []
+    assert search("&|!") == []
+
+
+def explain(run_db, stmt) -> str:
+    """EXPLAIN a statement with sequential scans priced out, as on a large table."""
+    compiled = stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+
+    async def work(conn) -> str:
+        await conn.execute(text("SET enable_seqscan = off"))
+        rows = await conn.execute(text(f"EXPLAIN {compiled}"))
+        return "\n".join(row[0] for row in rows)
+
+    return run_db(work)
+
+
+@pytest.mark.parametrize("filters, index_name", [
+    (SubmissionQueueFilters(status=["PENDING"]), "ix_submissions_workspace_id_status_last_transition_at"),
+    (SubmissionQueueFilters(tempo_min=120, tempo_max=128), "ix_submissions_workspace_id_tempo_id"),
+    (SubmissionQueueFilters(key="Am"), "ix_submissions_workspace_id_key"),
+    (SubmissionQueueFilters(genre=["techno"]), "ix_submissions_genre"),
+])
+def test_label_queue_filters_use_indexes(run_db, filters: SubmissionQueueFilters, index_name: str) -> None:
+    plan = explain(run_db, SubmissionQueryService(None).label_queue_query(UUID(int=1), filters).limit(50))
+    assert "Seq Scan" not in plan
+    assert index_name in plan
+
+
+def test_search_uses_gin_index(run_db) -> None:
+    tsquery = func.to_tsquery(literal_column("'simple'::regconfig"), "vocal:* & chop:*")
+    plan = explain(run_db, select(Submission.id).where(Submission.search_vector.bool_op("@@")(tsquery)))
+    assert "ix_submissions_search_vector" in plan
+
+
+def test_stale_pending_uses_index(run_db) -> None:
+    service = SubmissionQueryService(None)
+    plan = explain(run_db, keyset_paginate(service.stale_query(UUID(int=1), 14), service.stale_order, None, 50, descending=False))
+    assert "ix_submissions_workspace_id_status_last_transition_at" in plan
+    assert "Sort" not in plan
+
+
+def test_producer_timeline_is_join_free_index_scan(run_db) -> None:
+    service = SubmissionQueryService(None)
+    plan = explain(run_db, keyset_paginate(service._producer_events_query(UUID(int=1)), service.event_order, None, 50))
+    # partitions carry their own copies of ix_submission_events_owner_event_date_id
+    assert "Seq Scan" not in plan and "owner_producer_profile_id" in plan
+    assert "Join" not in plan and "Nested Loop" not in plan
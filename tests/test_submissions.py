@@ -0,0 +1,281 @@
+import asyncio
+from uuid import UUID
+
+from fastapi.testclient import TestClient
+from sqlalchemy import insert, text, update
+
+from app.services.auth import AuthService
+from app.models.models import COUNTERS_PENDING_COMMENT, Status, SubmissionEvent, WorkspaceStatusCount
+from app.services.submissions import SubmissionCounterService, SubmissionWorkflowService, TransitionNotAllowedError
+
+
+def profile_id(headers: dict):
+    token = headers["Authorization"].removeprefix("Bearer ")
+    return AuthService().verify_access_token(token)["pid"]
+
+
+def test_transition_happy_path(client: TestClient, labelstaff_headers: dict, workspace_id: str, create_submission) -> None:
+    submission = create_submission()
+    response = client.post(f"/api/workspaces/{workspace_id}/submissions/{submission['id']}/start-review",
+                           headers=labelstaff_headers)
+    assert response.status_code == 200
+    assert response.json()["status"] == "IN_REVIEW"
+
+
+def test_transition_not_found_vs_not_allowed(client: TestClient, labelstaff_headers: dict, workspace_id: str, create_submission) -> None:
+    submission = create_submission()
+    missing = client.post(f"/api/workspaces/{workspace_id}/submissions/{workspace_id}/start-review",
+                          headers=labelstaff_headers)
+    assert missing.status_code == 404
+
+    illegal = client.post(f"/api/workspaces/{workspace_id}/submissions/{submission['id']}/accept",
+                          headers=labelstaff_headers)
+    assert illegal.status_code == 409
+
+
+def test_concurrent_transitions_apply_once(client: TestClient, labelstaff_headers: dict, workspace_id: str, create_submission,
+                                           session_factory) -> None:
+    submission = create_submission()
+    actor_id = profile_id(labelstaff_headers)
+
+    async def attempt() -> str:
+        async with session_factory() as session:
+            try:
+                await SubmissionWorkflowService(session).start_review(UUID(submission["id"]), UUID(workspace_id), actor_id)
+                return "ok"
+            except TransitionNotAllowedError:
+                return "conflict"
+
+    async def race() -> list[str]:
+        return await asyncio.gather(*(attempt() for _ in range(5)))
+
+    outcomes = asyncio.run(race())
+    assert sorted(outcomes) == ["conflict"] * 4 + ["ok"]
+
+    events = client.get(f"/api/workspaces/{workspace_id}/submissions/events", headers=labelstaff_headers).json()
+    review_events = [e for e in events if e["submission_id"] == submission["id"] and e["status"] == "IN_REVIEW"]
+    assert len(review_events) == 1
+
+
+def test_bulk_transition_reports_per_id_outcomes(client: TestClient, labelstaff_headers: dict, workspace_id: str, create_submission) -> None:
+    pending = [create_submission()["id"] for _ in range(3)]
+    already_in_review = create_submission()["id"]
+    client.post(f"/api/workspaces/{workspace_id}/submissions/{already_in_review}/start-review", headers=labelstaff_headers)
+    missing = workspace_id
+
+    response = client.post(f"/api/workspaces/{workspace_id}/submissions/transitions",
+                           json={"target_status": "IN_REVIEW", "submission_ids": [*pending, already_in_review, missing]},
+                           headers=labelstaff_headers)
+    assert response.status_code == 200
+    outcomes = {item["submission_id"]: item for item in response.json()}
+    assert all(outcomes[submission_id]["outcome"] == "transitioned" for submission_id in pending)
+    assert outcomes[already_in_review] == {"submission_id": already_in_review, "outcome": "not_allowed", "status": "IN_REVIEW"}
+    assert outcomes[missing]["outcome"] == "not_found"
+
+    events = client.get(f"/api/workspaces/{workspace_id}/submissions/events", headers=labelstaff_headers).json()
+    assert sum(1 for e in events if e["submission_id"] in pending and e["status"] == "IN_REVIEW") == 3
+
+
+def test_overlapping_bulk_transitions_dont_deadlock(client: TestClient, labelstaff_headers: dict, create_submission,
+                                                    session_factory) -> None:
+    workspace_id = client.post("/api/workspaces", json={"name": "Overlap Label"}, headers=labelstaff_headers).json()["id"]
+    submission_ids = [UUID(create_submission(workspace_id=workspace_id)["id"]) for _ in range(40)]
+    actor_id = UUID(profile_id(labelstaff_headers))
+
+    async def transition(ids: list[UUID]) -> list[dict]:
+        async with session_factory() as session:
+            return await SubmissionWorkflowService(session).bulk_transition(ids, Status.IN_REVIEW, UUID(workspace_id), actor_id)
+
+    async def overlap() -> list[list[dict]]:
+        # same rows, opposite request order, plus a few only one side asks for
+        return await asyncio.gather(transition(submission_ids[:30]), transition(submission_ids[10:][::-1]))
+
+    first, second = asyncio.run(overlap())
+    transitioned = [item["submission_id"] for item in first + second if item["outcome"] == "transitioned"]
+    assert sorted(transitioned) == sorted(submission_ids)
+    counts = client.get(f"/api/workspaces/{workspace_id}/submissions/summary", headers=labelstaff_headers).json()["counts"]
+    assert (counts["PENDING"], counts["IN_REVIEW"]) == (0, 40)
+
+
+def test_bulk_transition_rejects_producer_only_status(client: TestClient, labelstaff_headers: dict, workspace_id: str, create_submission) -> None:
+    submission = create_submission()
+    response = client.post(f"/api/workspaces/{workspace_id}/submissions/transitions",
+                           json={"target_status": "WITHDRAWN", "submission_ids": [submission["id"]]},
+                           headers=labelstaff_headers)
+    assert response.status_code == 422
+
+
+def test_fan_out_track_to_many_workspaces(client: TestClient, producer_headers: dict, labelstaff_headers: dict, workspace_id: str) -> None:
+    second_workspace = client.post("/api/workspaces", json={"name": "Second Label"}, headers=labelstaff_headers).json()["id"]
+    track = client.post("/api/tracks", json={
+        "title": "Vocal Chop",
+        "streaming_url": "https://example.com/vocal-chop",
+        "tempo": 122.0,
+        "genre": ["deep house"],
+        "key": "Fm",
+    }, headers=producer_headers).json()
+
+    response = client.post("/api/submissions/fan-out",
+                           json={"track_id": track["id"], "workspace_ids": [workspace_id, second_workspace, track["id"]]},
+                           headers=producer_headers)
+    assert response.status_code == 201
+    data = response.json()
+    assert {item["workspace_id"] for item in data["submissions"]} == {workspace_id, second_workspace}
+    assert data["unknown_workspace_ids"] == [track["id"]]
+
+    submissions = client.get("/api/submissions", headers=producer_headers).json()
+    created_ids = {item["submission_id"] for item in data["submissions"]}
+    snapshots = [s for s in submissions if s["id"] in created_ids]
+    assert all(s["title"] == "Vocal Chop" and s["status"] == "PENDING" for s in snapshots)
+
+    events = client.get("/api/submissions/events", headers=producer_headers).json()
+    assert sum(1 for e in events if e["submission_id"] in created_ids and e["status"] == "PENDING") == 2
+
+
+def test_fan_out_unknown_track(client: TestClient, producer_headers: dict, workspace_id: str) -> None:
+    response = client.post("/api/submissions/fan-out",
+                           json={"track_id": workspace_id, "workspace_ids": [workspace_id]},
+                           headers=producer_headers)
+    assert response.status_code == 404
+
+
+def test_label_list_etag_changes_with_transitions(client: TestClient, labelstaff_headers: dict, workspace_id: str, create_submission) -> None:
+    url = f"/api/workspaces/{workspace_id}/submissions"
+    first = client.get(url, headers=labelstaff_headers)
+    etag = first.headers["ETag"]
+
+    unchanged = client.get(url, headers={**labelstaff_headers, "If-None-Match": etag})
+    assert unchanged.status_code == 304
+    assert unchanged.headers["ETag"] == etag
+    assert client.get(f"{url}/events", headers={**labelstaff_headers, "If-None-Match": etag}).status_code == 304
+
+    submission = create_submission()
+    after_create = client.get(url, headers={**labelstaff_headers, "If-None-Match": etag})
+    assert after_create.status_code == 200
+    assert after_create.headers["ETag"] != etag
+
+    client.post(f"{url}/{submission['id']}/start-review", headers=labelstaff_headers)
+    after_transition = client.get(url, headers={**labelstaff_headers, "If-None-Match": after_create.headers["ETag"]})
+    assert after_transition.status_code == 200
+
+
+def test_producer_list_etag(client: TestClient, producer_headers: dict, create_submission) -> None:
+    etag = client.get("/api/submissions", headers=producer_headers).headers["ETag"]
+    assert client.get("/api/submissions", headers={**producer_headers, "If-None-Match": etag}).status_code == 304
+    create_submission()
+    assert client.get("/api/submissions", headers={**producer_headers, "If-None-Match": etag}).status_code == 200
+
+
+def test_etag_changes_when_older_transaction_commits(client: TestClient, labelstaff_headers: dict, workspace_id: str,
+                                                     create_submission, session_factory) -> None:
+    url = f"/api/workspaces/{workspace_id}/submissions"
+    submission = create_submission()
+
+    async def commit_behind_newer_event() -> int:
+        async with session_factory() as older:
+            # takes its transaction id first, then writes its event after a newer one committed
+            await older.execute(text("SELECT pg_current_xact_id()"))
+            create_submission()
+            in_flight = client.get(url, headers=labelstaff_headers).headers["ETag"]
+            await older.execute(insert(SubmissionEvent).values(
+                status=Status.PENDING, submission_id=UUID(submission["id"]), workspace_id=UUID(workspace_id),
+                owner_producer_profile_id=UUID(submission["producer_profile_id"]),
+                producer_profile_id=UUID(submission["producer_profile_id"])))
+            await older.commit()
+        return client.get(url, headers={**labelstaff_headers, "If-None-Match": in_flight}).status_code
+
+    assert asyncio.run(commit_behind_newer_event()) == 200
+
+
+def test_status_summary_follows_creates_and_transitions(client: TestClient, labelstaff_headers: dict, producer_headers: dict,
+                                                       create_submission) -> None:
+    workspace_id = client.post("/api/workspaces", json={"name": "Summary Label"}, headers=labelstaff_headers).json()["id"]
+    url = f"/api/workspaces/{workspace_id}/submissions/summary"
+    assert client.get(url, headers=labelstaff_headers).json() == {"counts": {status.value: 0 for status in Status}, "total": 0}
+
+    producer_before = client.get("/api/submissions/summary", headers=producer_headers).json()
+    first, second, _ = (create_submission(workspace_id=workspace_id) for _ in range(3))
+    for action in ("start-review", "reject"):
+        client.post(f"/api/workspaces/{workspace_id}/submissions/{second['id']}/{action}", headers=labelstaff_headers)
+    client.post(f"/api/workspaces/{workspace_id}/submissions/{first['id']}/start-review", headers=labelstaff_headers)
+
+    summary = client.get(url, headers=labelstaff_headers).json()
+    assert summary["total"] == 3
+    assert (summary["counts"]["PENDING"], summary["counts"]["IN_REVIEW"], summary["counts"]["REJECTED"]) == (1, 1, 1)
+    producer_after = client.get("/api/submissions/summary", headers=producer_headers).json()
+    assert producer_after["total"] == producer_before["total"] + 3
+    assert producer_after["counts"]["REJECTED"] == producer_before["counts"]["REJECTED"] + 1
+
+
+def test_reconcile_repairs_counter_drift(client: TestClient, labelstaff_headers: dict, create_submission,
+                                        session_factory) -> None:
+    workspace_id = client.post("/api/workspaces", json={"name": "Drift Label"}, headers=labelstaff_headers).json()["id"]
+    create_submission(workspace_id=workspace_id)
+    create_submission(workspace_id=workspace_id)
+
+    async def drift_and_reconcile() -> dict:
+        async with session_factory() as session:
+            await session.execute(update(WorkspaceStatusCount)
+                                  .where(WorkspaceStatusCount.workspace_id == UUID(workspace_id))
+                                  .values(count=7))
+            await session.commit()
+            return await SubmissionCounterService(session).reconcile(batch_size=2)
+
+    report = asyncio.run(drift_and_reconcile())
+    assert report["workspace_status_counts"]["repaired"] >= 1
+    counts = client.get(f"/api/workspaces/{workspace_id}/submissions/summary", headers=labelstaff_headers).json()["counts"]
+    assert counts["PENDING"] == 2
+
+
+def test_stale_pending_and_response_times(client: TestClient, labelstaff_headers: dict, producer_headers: dict,
+                                         create_submission) -> None:
+    workspace_id = client.post("/api/workspaces", json={"name": "Reply Label"}, headers=labelstaff_headers).json()["id"]
+    waiting, reviewed = create_submission(workspace_id=workspace_id), create_submission(workspace_id=workspace_id)
+    client.post(f"/api/workspaces/{workspace_id}/submissions/{reviewed['id']}/start-review", headers=labelstaff_headers)
+
+    stale_url = f"/api/workspaces/{workspace_id}/submissions/stale"
+    assert [s["id"] for s in client.get(stale_url, params={"days": 0}, headers=labelstaff_headers).json()] == [waiting["id"]]
+    assert client.get(stale_url, headers=labelstaff_headers).json() == []
+
+    response_times = client.get(f"/api/workspaces/{workspace_id}/response-times", headers=producer_headers).json()
+    assert response_times["reviews"] == 1
+    assert response_times["p50_seconds"] is not None and response_times["mean_seconds"] >= 0
+
+
+def test_event_owner_filled_for_writers_without_it(client: TestClient, producer_headers: dict, create_submission,
+                                                   run_db) -> None:
+    submission = create_submission()
+
+    async def insert_without_owner(conn) -> UUID:
+        # as the previous release writes during a rollout
+        owner_id = await conn.scalar(insert(SubmissionEvent).values(
+            status=Status.WITHDRAWN, submission_id=UUID(submission["id"]),
+            workspace_id=UUID(submission["workspace_id"]), producer_profile_id=UUID(profile_id(producer_headers)),
+        ).returning(SubmissionEvent.owner_producer_profile_id))
+        await conn.commit()
+        return owner_id
+
+    assert run_db(insert_without_owner) == UUID(profile_id(producer_headers))
+
+
+def test_pending_counters_seeded_once(client: TestClient, labelstaff_headers: dict, create_submission,
+                                     session_factory) -> None:
+    workspace_id = client.post("/api/workspaces", json={"name": "Seed Label"}, headers=labelstaff_headers).json()["id"]
+    create_submission(workspace_id=workspace_id)
+
+    async def reset_and_seed() -> tuple:
+        async with session_factory() as session:
+            # as on a database whose submissions predate the counter tables
+            await session.execute(update(WorkspaceStatusCount)
+                                  .where(WorkspaceStatusCount.workspace_id == UUID(workspace_id))
+                                  .values(count=0))
+            await session.execute(text(f"COMMENT ON TABLE workspace_status_counts IS '{COUNTERS_PENDING_COMMENT}'"))
+            await session.commit()
+            service = SubmissionCounterService(session)
+            return await service.reconcile_pending(batch_size=50), await service.reconcile_pending(batch_size=50)
+
+    seeded, again = asyncio.run(reset_and_seed())
+    assert seeded["workspace_status_counts"]["repaired"] >= 1
+    assert again is None
+    counts = client.get(f"/api/workspaces/{workspace_id}/submissions/summary", headers=labelstaff_headers).json()["counts"]
+    assert counts["PENDING"] == 1
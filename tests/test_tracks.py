@@ -0,0 +1,121 @@
+import asyncio
+import io
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.settings import settings
+from app.services.tracks import TrackImportFormatError, _iter_csv_records, _spool_body
+
+
+def _csv_records(*chunks: bytes) -> list:
+    async def stream():
+        for chunk in chunks:
+            yield chunk
+
+    async def spool():
+        return await _spool_body(stream())
+
+    with asyncio.run(spool()) as body:
+        return list(_iter_csv_records(io.TextIOWrapper(body, encoding="utf-8", newline="")))
+
+
+def test_csv_records_span_quoted_newlines() -> None:
+    records = _csv_records(b'title,extra_metadata\r\nOne,"{""note"": ""a\r\nb""}"\r\n\r\nTwo,xy\nThree,"open')
+    assert records == [(1, ["title", "extra_metadata"]), (2, ["One", '{"note": "a\r\nb"}']),
+                       (5, ["Two", "xy"]), (6, ["Three", "open"])]
+
+
+def test_csv_records_stray_quote_in_unquoted_field() -> None:
+    records = _csv_records(b'title,streaming_url,tempo\nA 12" mix,http://a,120\nB,http://b,121\n'
+                           b'C 7" edit,http://c,122\nD,http://d,123\n')
+    assert [(line_no, values[0]) for line_no, values in records] == [
+        (1, "title"), (2, 'A 12" mix'), (3, "B"), (4, 'C 7" edit'), (5, "D")]
+
+
+def test_csv_line_limit_counts_bytes() -> None:
+    # 30000 characters, 90000 bytes, split across chunks
+    line = "\u266b".encode() * 30000
+    with pytest.raises(TrackImportFormatError, match="Line 2 "):
+        _csv_records(b"title\n" + line[:50000], line[50000:] + b"\n")
+
+
+def test_csv_malformed_record_is_a_format_error() -> None:
+    # a field over csv.field_size_limit() spread over short lines
+    with pytest.raises(TrackImportFormatError, match="line 2:"):
+        _csv_records(b'title\n"' + b"x\n" * 70000 + b'"\nAfter\n')
+
+
+def test_import_tracks_csv_reports_bad_rows(client: TestClient, producer_headers: dict) -> None:
+    body = (
+        "title,streaming_url,tempo,genre,key,extra_metadata\n"
+        'Imported One,https://example.com/1,124,house|deep,Am,"{""label"": ""x""}"\n'
+        "Imported Two,https://example.com/2,not-a-number,techno,,\n"
+        "Imported Three,https://example.com/3,128,techno,TOOLONG,\n"
+        "Imported Four,https://example.com/4,130,,,\n"
+    )
+    response = client.post("/api/tracks/import", content=body,
+                           headers={**producer_headers, "Content-Type": "text/csv"})
+    assert response.status_code == 200
+    report = response.json()
+    assert report["imported"] == 2
+    assert report["failed"] == 2
+    assert [error["line"] for error in report["errors"]] == [3, 4]
+
+    titles = {track["title"] for track in client.get("/api/tracks", headers=producer_headers).json()}
+    assert {"Imported One", "Imported Four"} <= titles
+
+
+def test_import_tracks_ndjson(client: TestClient, producer_headers: dict) -> None:
+    rows = [{"title": f"Ndjson {i}", "streaming_url": f"https://example.com/n{i}", "tempo": 120 + i, "genre": ["edm"]}
+            for i in range(3)]
+    body = "\n".join(json.dumps(row) for row in rows) + "\n{broken\n"
+    response = client.post("/api/tracks/import", content=body,
+                           headers={**producer_headers, "Content-Type": "application/x-ndjson"})
+    assert response.status_code == 200
+    assert response.json()["imported"] == 3
+    assert response.json()["errors"][0]["line"] == 4
+
+
+def test_import_tracks_csv_quoted_newline(client: TestClient, producer_headers: dict) -> None:
+    body = (
+        "title,streaming_url,tempo,extra_metadata\n"
+        'Multiline,https://example.com/m,120,"{""notes"": ""intro\nbreak""}"\n'
+        "After,https://example.com/a,bad,\n"
+    )
+    response = client.post("/api/tracks/import", content=body,
+                           headers={**producer_headers, "Content-Type": "text/csv"})
+    assert response.json()["imported"] == 1
+    assert [error["line"] for error in response.json()["errors"]] == [4]
+
+
+def test_import_tracks_rejected_batch_retried_by_row(client: TestClient, producer_headers: dict) -> None:
+    # valid for TrackCreate, refused by Postgres (text can't hold NUL)
+    rows = [{"title": title, "streaming_url": f"https://example.com/r{i}", "tempo": 120}
+            for i, title in enumerate(["Kept 1", "Nul \u0000 title", "Kept 2"])]
+    body = "\n".join(json.dumps(row) for row in rows)
+    response = client.post("/api/tracks/import", content=body,
+                           headers={**producer_headers, "Content-Type": "application/x-ndjson"})
+    report = response.json()
+    assert (report["imported"], report["failed"]) == (2, 1)
+    assert report["errors"][0]["line"] == 2
+
+
+def test_import_tracks_format_error_stores_nothing(client: TestClient, producer_headers: dict,
+                                                  monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "track_import_batch_size", 1)
+    body = ("title,streaming_url,tempo\n" + "".join(f"Early {i},https://example.com/e{i},120\n" for i in range(3))
+            + "Late," + "x" * 70000 + ",120\n")
+    response = client.post("/api/tracks/import", content=body,
+                           headers={**producer_headers, "Content-Type": "text/csv"})
+    assert response.status_code == 400
+    assert "Line 5" in response.json()["detail"]
+    titles = {track["title"] for track in client.get("/api/tracks", headers=producer_headers).json()}
+    assert not {"Early 0", "Early 1", "Early 2"} & titles
+
+
+def test_import_tracks_unsupported_media_type(client: TestClient, producer_headers: dict) -> None:
+    response = client.post("/api/tracks/import", content="[]",
+                           headers={**producer_headers, "Content-Type": "application/json"})
+    assert response.status_code == 415
@@ -54,4 +54,16 @@ def test_register_username_already_taken(client: TestClient) -> None:
         "user_type": "producer",
     })
     assert response.status_code == 409
-    assert response.json()["detail"] == "Username taken"
\ No newline at end of file
+    assert response.json()["detail"] == "Username taken"
+
+def test_register_very_long_password(client: TestClient) -> None:
+    response = client.post("/api/register", json={
+        "email": "test4@test.com",
+        "username": "testuser4",
+        "password": "Testpassword1234!" * 20,
+        "first_name": "Test",
+        "last_name": "User",
+        "gender": "male",
+        "user_type": "producer",
+    })
+    assert response.status_code == 201